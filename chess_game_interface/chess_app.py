@@ -1,7 +1,7 @@
-from chess_game_interface.chess_exceptions import InvalidMoveException
 from chess_game_interface.chess_move import ChessMove
 from chess_game_interface.chess_pieces import Knight, Bishop, Rook, Queen
 from chess_game_interface.chess_game import ChessGame
+from chess_game_interface.chess_state import GameStatus
 import pygame
 from chess_game_interface.load_svg import load_svg_resize
 from chess_game_interface.chess_utils import (
@@ -165,14 +165,15 @@ class ChessApp:
         about whose turn is it, if a side has won, if there is a draw of if a
         side has resigned.
         """
-        if self.chess_game.is_finished():
-            winner = self.chess_game.get_winner()
-            if winner is None:
-                player_text = "The game has been drawn."
-            else:
-                is_winner_white = winner == self.chess_game.get_white()
-                winning_side = "White" if is_winner_white else "Black"
-                player_text = f"{winning_side} has won."
+        status = self.chess_game.get_status()
+        if status == GameStatus.STALEMATE:
+            player_text = "The game has been drawn."
+        elif status == GameStatus.CHECKMATE:
+            is_winner_white = (
+                self.chess_game.get_winner() == self.chess_game.get_white()
+            )
+            winning_side = "White" if is_winner_white else "Black"
+            player_text = f"{winning_side} has won."
         elif self.resign is not None:
             resigning_side = "White" if self.resign else "Black"
             player_text = f"{resigning_side} has resigned."
@@ -435,11 +436,8 @@ class ChessApp:
                 and self.promotion_type is None
             ):
                 return
-            try:
-                self.chess_game.make_move(self.move, self.promotion_type)
+            if self.chess_game.try_make_move(self.move, self.promotion_type):
                 self.move_sound.play()
-            except InvalidMoveException:
-                pass
             self.moves_list = None
             self.move = None
             self.promotion_type = None
@@ -0,0 +1,222 @@
+from typing import Iterable, Iterator, List, Tuple
+
+# Bitboards are Python integers in which bit number (8 * row + column)
+# represents the square in a given column and row (column 0 and row 0 being
+# the square A1).
+
+PAWN = 0
+KNIGHT = 1
+BISHOP = 2
+ROOK = 3
+QUEEN = 4
+KING = 5
+
+WHITE_INDEX = 0
+BLACK_INDEX = 1
+
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+ALL_CASTLING_RIGHTS = 15
+
+FULL_BOARD = (1 << 64) - 1
+EMPTY_BOARD = 0
+
+FILE_MASKS = [
+    sum(1 << (8 * row + column) for row in range(8)) for column in range(8)
+]
+RANK_MASKS = [0xFF << (8 * row) for row in range(8)]
+
+# masks of the squares that can be shifted by a given number of columns
+# without wrapping around to the other side of the board
+_SHIFT_SOURCE_MASKS = {
+    column_shift: sum(
+        FILE_MASKS[column]
+        for column in range(8)
+        if column + column_shift in range(8)
+    )
+    for column_shift in range(-7, 8)
+}
+
+# castling rights kept after a piece leaves or lands on a given square
+CASTLING_RIGHTS_MASKS = [ALL_CASTLING_RIGHTS for _ in range(64)]
+CASTLING_RIGHTS_MASKS[0] &= ~WHITE_QUEENSIDE
+CASTLING_RIGHTS_MASKS[4] &= ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_RIGHTS_MASKS[7] &= ~WHITE_KINGSIDE
+CASTLING_RIGHTS_MASKS[56] &= ~BLACK_QUEENSIDE
+CASTLING_RIGHTS_MASKS[60] &= ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_RIGHTS_MASKS[63] &= ~BLACK_KINGSIDE
+
+
+def square_index(column: int, row: int) -> int:
+    """Returns the index of a square with a given column and row."""
+    return 8 * row + column
+
+
+def square_column(square: int) -> int:
+    """Returns the column of a square with a given index."""
+    return square & 7
+
+
+def square_row(square: int) -> int:
+    """Returns the row of a square with a given index."""
+    return square >> 3
+
+
+def iterate_squares(bitboard: int) -> Iterator[int]:
+    """
+    Yields the indices of all the squares set in a bitboard, starting from
+    the lowest one.
+
+
+    Parameters:
+
+    bitboard : int
+        an int representing a set of squares
+    """
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield lowest_bit.bit_length() - 1
+        bitboard ^= lowest_bit
+
+
+def count_squares(bitboard: int) -> int:
+    """Returns the number of squares set in a bitboard."""
+    return bin(bitboard).count("1")
+
+
+def shift_bitboard(bitboard: int, column_shift: int, row_shift: int) -> int:
+    """
+    Returns a bitboard with every square of the given bitboard moved by
+    a given number of columns and rows. Squares that would end up outside of
+    the board are dropped.
+
+
+    Parameters:
+
+    bitboard : int
+        an int representing a set of squares
+
+    column_shift : int
+        an int representing the number of columns to move the squares by
+
+    row_shift : int
+        an int representing the number of rows to move the squares by
+    """
+    bitboard &= _SHIFT_SOURCE_MASKS[column_shift]
+    shift = 8 * row_shift + column_shift
+    if shift >= 0:
+        return (bitboard << shift) & FULL_BOARD
+    return bitboard >> -shift
+
+
+def shift_attacks(bitboard: int, shifts: Iterable[Tuple[int, int]]) -> int:
+    """
+    Returns a bitboard of all the squares that can be reached from any of the
+    given squares by making one of the given shifts.
+
+
+    Parameters:
+
+    bitboard : int
+        an int representing a set of squares
+
+    shifts : Iterable[Tuple[int, int]]
+        a list containing tuples of the form (int, int) representing the
+        column and row shift respectively
+    """
+    attacks = EMPTY_BOARD
+    for column_shift, row_shift in shifts:
+        attacks |= shift_bitboard(bitboard, column_shift, row_shift)
+    return attacks
+
+
+def line_attacks(
+    bitboard: int, occupied: int, directions: Iterable[Tuple[int, int]]
+) -> int:
+    """
+    Returns a bitboard of all the squares that can be reached from any of the
+    given squares by moving along the given lines. Each line ends on the first
+    occupied square, which is included in the result.
+
+
+    Parameters:
+
+    bitboard : int
+        an int representing a set of squares
+
+    occupied : int
+        an int representing the set of all the occupied squares
+
+    directions : Iterable[Tuple[int, int]]
+        a list containing tuples of the form (int, int) indicating the column
+        and row direction of each of the lines
+    """
+    empty = ~occupied & FULL_BOARD
+    attacks = EMPTY_BOARD
+    for column_shift, row_shift in directions:
+        flood = generator = bitboard
+        while generator:
+            generator = (
+                shift_bitboard(generator, column_shift, row_shift) & empty
+            )
+            flood |= generator
+        attacks |= shift_bitboard(flood, column_shift, row_shift)
+    return attacks
+
+
+def build_rays(direction: Tuple[int, int]) -> Tuple[List[int], bool]:
+    """
+    Returns a tuple containing a list of bitboards representing the rays
+    going from each of the squares in a given direction on an empty board and
+    a bool that is True if the indices of the squares grow along the rays.
+    Used for building the lookup tables of the sliding pieces.
+
+
+    Parameters:
+
+    direction : Tuple[int, int]
+        a tuple indicating the column and row direction of the rays
+    """
+    column_shift, row_shift = direction
+    rays = [
+        line_attacks(1 << square, EMPTY_BOARD, (direction,))
+        for square in range(64)
+    ]
+    return rays, 8 * row_shift + column_shift > 0
+
+
+def ray_attacks(
+    square: int, occupied: int, rays: Iterable[Tuple[List[int], bool]]
+) -> int:
+    """
+    Returns a bitboard of all the squares that can be reached from a given
+    square by moving along the given rays. Each ray ends on the first occupied
+    square, which is included in the result. The first occupied square is
+    found with a single bit scan and everything behind it is removed using
+    the ray going from that square.
+
+
+    Parameters:
+
+    square : int
+        an int representing the index of the square the rays start from
+
+    occupied : int
+        an int representing the set of all the occupied squares
+
+    rays : Iterable[Tuple[List[int], bool]]
+        a list of the rays tables (as returned by the build_rays function)
+    """
+    attacks = EMPTY_BOARD
+    for direction_rays, is_increasing in rays:
+        ray = direction_rays[square]
+        blockers = ray & occupied
+        if blockers:
+            if is_increasing:
+                ray ^= direction_rays[(blockers & -blockers).bit_length() - 1]
+            else:
+                ray ^= direction_rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
@@ -0,0 +1,842 @@
+from chess_game_interface.chess_exceptions import (
+    InvalidSearchLimitsException,
+)
+from chess_game_interface.chess_state import ChessState, MutableChessState
+from chess_game_interface.chess_move import (
+    ChessMove,
+    PROMOTION_SHIFT,
+    code_to_uci,
+)
+from chess_game_interface.chess_pieces import PIECE_TYPES
+from chess_game_interface.chess_move_ordering import (
+    MAX_PLY,
+    MoveOrdering,
+    get_taken_type,
+)
+from chess_game_interface.chess_transposition import (
+    DEFAULT_SIZE_MB,
+    EXACT_BOUND,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+    table_size_in_bytes,
+)
+from chess_game_interface.chess_polyglot import OpeningBook
+from chess_game_interface.chess_tablebase import Tablebase
+from chess_game_interface.chess_bitboards import count_squares
+from chess_game_interface.chess_evaluation import (
+    ENDGAME_VALUES,
+    MIDDLEGAME_VALUES,
+)
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+from time import perf_counter
+import argparse
+import os
+
+# the score of a position in which the current player is checkmated. A mate
+# found a given number of moves (plies) from the root is scored as
+# MATE_SCORE minus that number, so that the shorter mates are preferred
+MATE_SCORE = 100000
+INFINITE_SCORE = MATE_SCORE + 1
+
+# the depth searched if no limits are given
+DEFAULT_DEPTH = 4
+
+# the number of nodes searched between two checks of the time limit (has to
+# be a power of two)
+TIME_CHECK_INTERVAL = 256
+
+# A capture is skipped by the quiescence search if the value of the taken
+# piece and this margin (for the positional gain) can't raise the static
+# evaluation to alpha ("delta pruning").
+DELTA_MARGIN = 200
+
+# the number of plies of the quiescence search in which all the moves out of
+# a check are searched. Deeper, a position in check is treated like a quiet
+# one, as the evasions would search almost all of the moves again
+QUIESCENCE_EVASION_PLIES = 2
+
+# the greatest values of the piece types (see the chess_evaluation module)
+_CAPTURE_VALUES = [
+    max(values) for values in zip(MIDDLEGAME_VALUES, ENDGAME_VALUES)
+]
+
+
+def evaluate(state: ChessState) -> int:
+    """
+    Returns the score of a position in centipawns from the point of view
+    of the current player (positive if the current player is ahead). The
+    score is kept up to date by the state itself (see the
+    ChessState.evaluate method).
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the position to be evaluated
+    """
+    return state.evaluate()
+
+
+def is_mate_score(score: int) -> bool:
+    """Returns True if a given score means that one of the players can
+    be checkmated."""
+    return abs(score) > MATE_SCORE - 1000
+
+
+def _get_capture_value(state: MutableChessState, code: int) -> int:
+    """
+    Returns the value of the piece taken by a capture in centipawns (0 if
+    the move isn't a capture).
+
+
+    Parameters:
+
+    state : MutableChessState
+        a MutableChessState object representing the position before the move
+
+    code : int
+        an int representing the encoded move (see the ChessMove.code method)
+    """
+    taken_type = get_taken_type(state, code)
+    return 0 if taken_type is None else _CAPTURE_VALUES[taken_type]
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Returns a score to be stored in the transposition table: a mate
+    score is counted from the stored position instead of from the root."""
+    if score > MATE_SCORE - 1000:
+        return score + ply
+    if score < 1000 - MATE_SCORE:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    """Returns a score read from the transposition table for a position
+    a given number of moves from the root (see _score_to_table)."""
+    if score > MATE_SCORE - 1000:
+        return score - ply
+    if score < 1000 - MATE_SCORE:
+        return score + ply
+    return score
+
+
+class SearchLimits:
+    """
+    A class describing when a search should stop. Any of the limits can be
+    left out (set to None), the search stops as soon as any of the given
+    ones is reached. If none of them is given, the search stops at the
+    DEFAULT_DEPTH. The depth of 0 means that the position isn't searched
+    at all (see the ChessEngine.search method).
+
+
+    Attributes:
+
+    depth : int
+        an int representing the greatest depth (in plies) to be searched
+
+    nodes : int
+        an int representing the greatest number of nodes to be searched
+
+    time : float
+        a float representing the greatest time of the search in seconds
+    """
+
+    def __init__(
+        self,
+        depth: Optional[int] = None,
+        nodes: Optional[int] = None,
+        time: Optional[float] = None,
+    ):
+        """
+        SearchLimits class constructor.
+
+
+        Parameters:
+
+        depth : int
+            an int representing the greatest depth (in plies) to be searched
+
+        nodes : int
+            an int representing the greatest number of nodes to be searched
+
+        time : float
+            a float representing the greatest time of the search in seconds
+        """
+        for limit in (depth, nodes, time):
+            if limit is not None and limit < 0:
+                raise InvalidSearchLimitsException
+        if depth is None and nodes is None and time is None:
+            depth = DEFAULT_DEPTH
+        self.depth = depth
+        self.nodes = nodes
+        self.time = time
+
+
+class SearchResult:
+    """
+    A class representing the result of a search.
+
+
+    Attributes:
+
+    codes : List[int]
+        a list of ints encoding the moves of the principal variation (the
+        best sequence of moves found, starting with the best move), see the
+        ChessMove.code method
+
+    score : int
+        an int representing the score of the root position in centipawns
+        from the point of view of the player to move (see the is_mate_score
+        function)
+
+    depth : int
+        an int representing the depth of the last completed iteration (0 if
+        none of the iterations has been completed, the score is then the
+        static evaluation of the position)
+
+    nodes : int
+        an int representing the number of nodes searched
+
+    time : float
+        a float representing the time of the search in seconds
+    """
+
+    def __init__(
+        self,
+        codes: List[int],
+        score: int,
+        depth: int,
+        nodes: int,
+        time: float,
+    ):
+        """
+        SearchResult class constructor. The parameters are described in
+        the class docs.
+        """
+        self.codes = codes
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.time = time
+
+    def principal_variation(self) -> List[ChessMove]:
+        """Returns a list of ChessMove objects representing the principal
+        variation (the promotion types are given by the codes attribute)."""
+        return [ChessMove.from_code(code) for code in self.codes]
+
+    def move(self) -> Optional[ChessMove]:
+        """Returns a ChessMove object representing the best move or None if
+        there are no legal moves in the root position."""
+        if not self.codes:
+            return None
+        return ChessMove.from_code(self.codes[0])
+
+    def promotion_type(self) -> Optional[type]:
+        """Returns the class of the piece to which the pawn promotes in the
+        best move or None if the best move isn't a promotion."""
+        if not self.codes or not self.codes[0] >> PROMOTION_SHIFT:
+            return None
+        return PIECE_TYPES[self.codes[0] >> PROMOTION_SHIFT]
+
+    def __str__(self) -> str:
+        """Returns a string describing the result of the search."""
+        return (
+            f"depth {self.depth} score {self.score} nodes {self.nodes} "
+            f"time {self.time:.3f} pv "
+            + " ".join(code_to_uci(code) for code in self.codes)
+        )
+
+
+class ChessEngine:
+    """
+    A class searching for the best move in a given position with the
+    negamax version of the alpha-beta algorithm. The search is run with
+    iterative deepening: the position is searched to the depth of 1, 2, 3
+    and so on until one of the limits is reached, and each iteration starts
+    with the best moves of the previous one. The other moves are ordered by
+    a MoveOrdering object.
+
+
+    Attributes:
+
+    _limits : SearchLimits
+        a SearchLimits object describing when the current search should stop
+
+    _deadline : float
+        a float representing the value of time.perf_counter after which the
+        current search stops (None if there is no time limit)
+
+    _nodes : int
+        an int representing the number of nodes searched so far
+
+    _stopped : bool
+        a bool that is set when one of the limits has been reached. The
+        unfinished iteration is then abandoned
+
+    _previous_pv : List[int]
+        a list of the codes of the principal variation found by the previous
+        iteration, searched first by the current one
+
+    _ordering : MoveOrdering
+        a MoveOrdering object deciding the order in which the moves are
+        searched
+
+    transposition_table : TranspositionTable
+        a TranspositionTable object with the results of searching the
+        positions, kept between the searches. Its statistics are reset at
+        the beginning of each search
+
+    tablebase : Tablebase
+        a Tablebase object whose scores are used for the covered positions
+        instead of searching them (None if there isn't one)
+    """
+
+    def __init__(
+        self,
+        table_size_mb: float = DEFAULT_SIZE_MB,
+        table: Optional[TranspositionTable] = None,
+        tablebase: Optional[Tablebase] = None,
+    ):
+        """
+        ChessEngine class constructor.
+
+
+        Parameters:
+
+        table_size_mb : float
+            a float representing the size of the transposition table in
+            megabytes
+
+        table : TranspositionTable
+            a TranspositionTable object to be used by the engine (eg. one
+            shared with other processes). A new table of a given size is
+            created if it isn't given
+
+        tablebase : Tablebase
+            a Tablebase object with the endgame tables to be used by the
+            engine
+        """
+        self.transposition_table = table or TranspositionTable(table_size_mb)
+        self.tablebase = tablebase
+        self._ordering = MoveOrdering()
+        self._limits = SearchLimits()
+        self._deadline = None
+        self._nodes = 0
+        self._stopped = False
+        self._previous_pv = []
+
+    def search(
+        self,
+        state: ChessState,
+        limits: Optional[SearchLimits] = None,
+        first_depth: int = 1,
+    ) -> SearchResult:
+        """
+        Returns a SearchResult object with the best move found in a given
+        position within given limits. The given state isn't modified.
+        The result of the last completed iteration is returned. If the
+        limits are reached during the first one (or the depth limit is 0),
+        the best move found so far (or the first legal move) is returned
+        with the static evaluation of the position and the depth of 0.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position to be searched
+
+        limits : SearchLimits
+            a SearchLimits object describing when the search should stop.
+            Defaults to searching to the DEFAULT_DEPTH
+
+        first_depth : int
+            an int representing the depth of the first iteration
+        """
+        start_time = perf_counter()
+        self._limits = limits or SearchLimits()
+        self._deadline = None
+        if self._limits.time is not None:
+            self._deadline = start_time + self._limits.time
+        self._nodes = 0
+        self._stopped = False
+        self._previous_pv = []
+        self.transposition_table.reset_statistics()
+        self._ordering.new_search()
+
+        root = MutableChessState.from_state(state)
+        max_depth = self._limits.depth
+        if max_depth is None:
+            max_depth = float("inf")
+        codes = root.get_legal_move_codes()
+        result = SearchResult(codes[:1], evaluate(state), 0, 0, 0.0)
+        depth = min(first_depth, max_depth)
+        while 0 < depth <= max_depth:
+            pv = []
+            score = self._negamax(
+                root, depth, -INFINITE_SCORE, INFINITE_SCORE, 0, pv
+            )
+            if self._stopped:
+                # the score of an unfinished iteration is meaningless, but
+                # the best move found by the first one is better than none
+                if not result.depth and pv:
+                    result.codes = pv[:1]
+                break
+            result = SearchResult(
+                pv, score, depth, self._nodes, perf_counter() - start_time
+            )
+            if not pv or is_mate_score(score):
+                break
+            self._previous_pv = pv
+            depth += 1
+
+        result.nodes = self._nodes
+        result.time = perf_counter() - start_time
+        return result
+
+    def _check_limits(self):
+        """Sets the _stopped attribute if the node or the time limit of the
+        search has been reached."""
+        if (
+            self._limits.nodes is not None
+            and self._nodes >= self._limits.nodes
+        ):
+            self._stopped = True
+        elif (
+            self._deadline is not None
+            and not self._nodes & (TIME_CHECK_INTERVAL - 1)
+            and perf_counter() >= self._deadline
+        ):
+            self._stopped = True
+
+    def _get_first_code(self, ply: int, table_code: int) -> int:
+        """
+        Returns the code of the move to be searched first: the best move
+        stored in the transposition table or, if there isn't one, the move
+        of the previous principal variation (0 if there is neither).
+
+
+        Parameters:
+
+        ply : int
+            an int representing the number of moves made since the root
+
+        table_code : int
+            an int representing the code of the best move stored in the
+            transposition table (0 if there is none)
+        """
+        if not table_code and ply < len(self._previous_pv):
+            return self._previous_pv[ply]
+        return table_code
+
+    def _probe_tablebase(
+        self, state: MutableChessState, ply: int
+    ) -> Optional[int]:
+        """
+        Returns the exact score of a position found in the tablebase from
+        the point of view of the current player (a mate score counted from
+        the root or 0 for a draw), or None if the position isn't covered.
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position
+
+        ply : int
+            an int representing the number of moves made since the root
+        """
+        if count_squares(state._occupied) > 3:
+            return None
+        result = self.tablebase.probe(state)
+        if result is None:
+            return None
+        wdl, plies = result
+        score = MATE_SCORE - ply - plies
+        return wdl * score
+
+    def _negamax(
+        self,
+        state: MutableChessState,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+        pv: List[int],
+    ) -> int:
+        """
+        Returns the score of a position searched to a given depth from the
+        point of view of the current player, or a bound of it if it lies
+        outside of the (alpha, beta) window. The moves are made and taken
+        back in place, the state is the same after the method returns. The
+        principal variation of the position is written into a given list.
+        The result is stored in the transposition table, and a stored result
+        of a search at least as deep is used instead of searching again
+        (except in the root). The returned value is meaningless if the
+        search has been stopped.
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position
+
+        depth : int
+            an int representing the number of plies left to be searched
+
+        alpha : int
+            an int representing the score the current player is already
+            sure of
+
+        beta : int
+            an int representing the score the other player is already sure
+            of (a better score won't be allowed by the other player)
+
+        ply : int
+            an int representing the number of moves made since the root
+
+        pv : List[int]
+            a list into which the principal variation is written
+        """
+        if ply and self.tablebase is not None:
+            score = self._probe_tablebase(state, ply)
+            if score is not None:
+                self._nodes += 1
+                return score
+        if depth <= 0:
+            return self._quiescence(state, alpha, beta, ply)
+        self._nodes += 1
+        if ply:
+            self._check_limits()
+            if self._stopped:
+                return 0
+
+        table = self.transposition_table
+        key = state._hash
+        table_code = 0
+        entry = table.probe(key)
+        if entry is not None:
+            entry_depth, score, bound, table_code = entry
+            score = _score_from_table(score, ply)
+            if (
+                ply
+                and entry_depth >= depth
+                and (
+                    bound == EXACT_BOUND
+                    or bound == LOWER_BOUND
+                    and score >= beta
+                    or bound == UPPER_BOUND
+                    and score <= alpha
+                )
+            ):
+                if bound == EXACT_BOUND and table_code:
+                    pv[:] = [table_code]
+                return score
+
+        codes = state.get_legal_move_codes()
+        if not codes:
+            return -(MATE_SCORE - ply) if state._is_in_check() else 0
+
+        original_alpha = alpha
+        for code in self._ordering.iterate_moves(
+            state, codes, ply, self._get_first_code(ply, table_code)
+        ):
+            child_pv = []
+            state.push_code(code)
+            score = -self._negamax(
+                state, depth - 1, -beta, -alpha, ply + 1, child_pv
+            )
+            state.pop()
+            if self._stopped:
+                return 0
+            if score > alpha:
+                alpha = score
+                pv[:] = [code] + child_pv
+                if alpha >= beta:
+                    self._ordering.add_cutoff(state, code, depth, ply)
+                    break
+
+        if alpha >= beta:
+            bound = LOWER_BOUND
+        elif alpha > original_alpha:
+            bound = EXACT_BOUND
+        else:
+            bound = UPPER_BOUND
+        table.store(
+            key,
+            depth,
+            _score_to_table(alpha, ply),
+            bound,
+            pv[0] if bound != UPPER_BOUND else 0,
+        )
+        return alpha
+
+    def _quiescence(
+        self,
+        state: MutableChessState,
+        alpha: int,
+        beta: int,
+        ply: int,
+        quiescence_ply: int = 0,
+    ) -> int:
+        """
+        Returns the score of a position in which the main search has ended,
+        from the point of view of the current player (or a bound of it, as
+        in the _negamax method). Only the captures and the promotions are
+        searched, until the position is quiet, so that a score isn't taken
+        in the middle of an exchange. The current player may also decline
+        all of them and keep the static evaluation of the position ("stand
+        pat"), unless the king is in check in one of the first
+        QUIESCENCE_EVASION_PLIES plies, in which case all the moves are
+        searched. The captures that can't raise the score to alpha are
+        skipped (see the DELTA_MARGIN constant).
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position
+
+        alpha : int
+            an int representing the score the current player is already
+            sure of
+
+        beta : int
+            an int representing the score the other player is already sure
+            of
+
+        ply : int
+            an int representing the number of moves made since the root
+
+        quiescence_ply : int
+            an int representing the number of moves made since the end of
+            the main search
+        """
+        self._nodes += 1
+        self._check_limits()
+        if self._stopped:
+            return 0
+
+        stand_pat = None
+        if quiescence_ply < QUIESCENCE_EVASION_PLIES and state._is_in_check():
+            codes = state.get_legal_move_codes()
+            if not codes:
+                return -(MATE_SCORE - ply)
+        else:
+            stand_pat = evaluate(state)
+            if stand_pat >= beta or ply >= MAX_PLY:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            codes = state.get_capture_codes()
+
+        for code in self._ordering.iterate_moves(state, codes, ply):
+            if (
+                stand_pat is not None
+                and not code >> PROMOTION_SHIFT
+                and stand_pat + _get_capture_value(state, code) + DELTA_MARGIN
+                <= alpha
+            ):
+                continue
+            state.push_code(code)
+            score = -self._quiescence(
+                state, -beta, -alpha, ply + 1, quiescence_ply + 1
+            )
+            state.pop()
+            if self._stopped:
+                return 0
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+        return alpha
+
+
+def best_move(
+    state: ChessState, limits: Optional[SearchLimits] = None
+) -> SearchResult:
+    """
+    Returns a SearchResult object with the best move and the principal
+    variation found in a given position within given limits (see the
+    ChessEngine.search method).
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the position to be searched
+
+    limits : SearchLimits
+        a SearchLimits object describing when the search should stop
+    """
+    return ChessEngine().search(state, limits)
+
+
+def _search_task(
+    task: Tuple[str, SearchLimits, str, float, int, Optional[str]]
+) -> tuple:
+    """
+    Searches a position using a transposition table kept in a block of
+    shared memory and returns a tuple containing the codes of the principal
+    variation, the score, the depth and the number of nodes searched. Run
+    by the worker processes of the parallel_search function.
+
+
+    Parameters:
+
+    task : Tuple[str, SearchLimits, str, float, int, Optional[str]]
+        a tuple containing the position in the Forsyth-Edwards Notation, the
+        limits of the search, the name of the block of shared memory, the
+        size of the table in megabytes, the number of the worker and the
+        directory of the endgame tablebases (None if there isn't one)
+    """
+    fen, limits, memory_name, table_size_mb, worker, tablebases = task
+    memory = SharedMemory(memory_name)
+    table = TranspositionTable(table_size_mb, memory.buf)
+    tablebase = Tablebase(tablebases) if tablebases else None
+    try:
+        result = ChessEngine(table=table, tablebase=tablebase).search(
+            ChessState.from_fen(fen), limits, 1 + worker % 2
+        )
+    finally:
+        if tablebase is not None:
+            tablebase.close()
+        table.close()
+        memory.close()
+    return result.codes, result.score, result.depth, result.nodes
+
+
+def parallel_search(
+    state: ChessState,
+    limits: Optional[SearchLimits] = None,
+    processes: Optional[int] = None,
+    table_size_mb: float = DEFAULT_SIZE_MB,
+    tablebases: Optional[str] = None,
+) -> SearchResult:
+    """
+    Returns a SearchResult object with the best move found in a given
+    position, searched by a number of worker processes at once ("lazy
+    SMP"). All the workers search the same position within the same limits
+    and share one transposition table kept in a block of shared memory, so
+    they skip the positions already searched by the others. Every other
+    worker starts its iterative deepening one ply deeper, so that the
+    workers don't search the same moves in the same order. The result of
+    the worker that has completed the deepest iteration is returned, with
+    the number of nodes searched by all of them.
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the position to be searched
+
+    limits : SearchLimits
+        a SearchLimits object describing when the search of each of the
+        workers should stop. Defaults to searching to the DEFAULT_DEPTH
+
+    processes : int
+        an int representing the number of worker processes. Defaults to the
+        number of processors of the machine
+
+    table_size_mb : float
+        a float representing the size of the shared transposition table in
+        megabytes
+
+    tablebases : str
+        a str representing the directory of the endgame tablebases, opened
+        by each of the workers (see the Tablebase class). No tablebases are
+        used if it isn't given
+    """
+    start_time = perf_counter()
+    processes = processes or os.cpu_count() or 1
+    limits = limits or SearchLimits()
+    if processes == 1:
+        tablebase = Tablebase(tablebases) if tablebases else None
+        try:
+            engine = ChessEngine(table_size_mb, tablebase=tablebase)
+            return engine.search(state, limits)
+        finally:
+            if tablebase is not None:
+                tablebase.close()
+
+    memory = SharedMemory(
+        create=True, size=table_size_in_bytes(table_size_mb)
+    )
+    try:
+        memory.buf[:] = bytes(memory.size)
+        fen = state.to_fen()
+        tasks = [
+            (fen, limits, memory.name, table_size_mb, worker, tablebases)
+            for worker in range(processes)
+        ]
+        with ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(_search_task, tasks))
+    finally:
+        memory.close()
+        memory.unlink()
+
+    codes, score, depth, _ = max(
+        results, key=lambda result: (result[2], bool(result[0]))
+    )
+    return SearchResult(
+        codes,
+        score,
+        depth,
+        sum(result[3] for result in results),
+        perf_counter() - start_time,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Searches for the best move in a given position."
+    )
+    parser.add_argument("fen", help="the position in the FEN notation")
+    parser.add_argument("--depth", type=int, default=None)
+    parser.add_argument("--nodes", type=int, default=None)
+    parser.add_argument("--time", type=float, default=None)
+    parser.add_argument("--hash", type=float, default=DEFAULT_SIZE_MB)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--book", help="the path to a Polyglot book")
+    parser.add_argument(
+        "--tablebases", help="the directory of the endgame tablebases"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.book:
+        with OpeningBook(arguments.book) as book:
+            code = book.choose_move_code(ChessState.from_fen(arguments.fen))
+        if code is not None:
+            print(f"book move {code_to_uci(code)}")
+            return
+
+    limits = SearchLimits(arguments.depth, arguments.nodes, arguments.time)
+    if arguments.processes > 1:
+        print(
+            parallel_search(
+                ChessState.from_fen(arguments.fen),
+                limits,
+                arguments.processes,
+                arguments.hash,
+                arguments.tablebases,
+            )
+        )
+        return
+
+    tablebase = None
+    if arguments.tablebases:
+        tablebase = Tablebase(arguments.tablebases)
+    engine = ChessEngine(arguments.hash, tablebase=tablebase)
+    result = engine.search(ChessState.from_fen(arguments.fen), limits)
+    print(result)
+    table = engine.transposition_table
+    print(
+        f"hash hits {table.hits} misses {table.misses} "
+        f"hit rate {table.hit_rate():.1%} overwrites {table.overwrites}"
+    )
+
+
+if __name__ == "__main__":
+    main()
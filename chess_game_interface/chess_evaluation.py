@@ -0,0 +1,196 @@
+from typing import List, Tuple
+from chess_game_interface.chess_bitboards import iterate_squares
+
+# values of the pieces in centipawns in the middlegame and in the endgame,
+# indexed by the piece type (the king can't be taken, so it's not counted)
+MIDDLEGAME_VALUES = [100, 320, 330, 500, 900, 0]
+ENDGAME_VALUES = [120, 300, 320, 530, 950, 0]
+
+# The phase of the game is the sum of the weights of all the pieces left on
+# the board. It is MAX_PHASE in the initial position (and is capped there
+# if promotions make it higher) and 0 when only the kings and the pawns are
+# left. The score is blended between the middlegame and the endgame score
+# according to the phase.
+PHASE_WEIGHTS = [0, 1, 1, 2, 4, 0]
+MAX_PHASE = 24
+
+# Bonuses for a piece standing on a given square, written as seen by the
+# white player (the first row of each table is the eighth rank). Only the
+# pawns and the king have different tables for the endgame.
+# fmt: off
+_PAWN_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]
+_PAWN_ENDGAME_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    80, 80, 80, 80, 80, 80, 80, 80,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    30, 30, 30, 30, 30, 30, 30, 30,
+    20, 20, 20, 20, 20, 20, 20, 20,
+    10, 10, 10, 10, 10, 10, 10, 10,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]
+_KNIGHT_TABLE = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]
+_BISHOP_TABLE = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]
+_ROOK_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+]
+_QUEEN_TABLE = [
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+]
+_KING_TABLE = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+]
+_KING_ENDGAME_TABLE = [
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+]
+# fmt: on
+_MIDDLEGAME_TABLES = [
+    _PAWN_TABLE,
+    _KNIGHT_TABLE,
+    _BISHOP_TABLE,
+    _ROOK_TABLE,
+    _QUEEN_TABLE,
+    _KING_TABLE,
+]
+_ENDGAME_TABLES = [
+    _PAWN_ENDGAME_TABLE,
+    _KNIGHT_TABLE,
+    _BISHOP_TABLE,
+    _ROOK_TABLE,
+    _QUEEN_TABLE,
+    _KING_ENDGAME_TABLE,
+]
+
+
+def _build_square_scores(
+    values: List[int], tables: List[List[int]]
+) -> List[List[int]]:
+    """
+    Returns a list of twelve lists (one for each piece type of each colour,
+    indexed in the same way as the bitboards) of the scores of a piece
+    standing on each of the squares: the value of the piece and the bonus
+    for the square. The scores of the black pieces are negative, so that
+    the sum of the scores of all the pieces is the score of the position
+    from the point of view of the white player.
+
+
+    Parameters:
+
+    values : List[int]
+        a list of the values of the piece types
+
+    tables : List[List[int]]
+        a list of the tables of the bonuses for each of the piece types
+    """
+    white = [
+        [value + table[square ^ 56] for square in range(64)]
+        for value, table in zip(values, tables)
+    ]
+    black = [
+        [-(value + table[square]) for square in range(64)]
+        for value, table in zip(values, tables)
+    ]
+    return white + black
+
+
+MIDDLEGAME_SCORES = _build_square_scores(
+    MIDDLEGAME_VALUES, _MIDDLEGAME_TABLES
+)
+ENDGAME_SCORES = _build_square_scores(ENDGAME_VALUES, _ENDGAME_TABLES)
+
+
+def compute_scores(bitboards: List[int]) -> Tuple[int, int, int]:
+    """
+    Returns a tuple containing the middlegame score, the endgame score (both
+    from the point of view of the white player) and the phase of a position.
+    Used when a state is created from scratch, the states following a move
+    update the scores of the previous one instead.
+
+
+    Parameters:
+
+    bitboards : List[int]
+        a list of twelve bitboards, one for each piece type of each colour
+    """
+    middlegame = endgame = phase = 0
+    for index, bitboard in enumerate(bitboards):
+        for square in iterate_squares(bitboard):
+            middlegame += MIDDLEGAME_SCORES[index][square]
+            endgame += ENDGAME_SCORES[index][square]
+            phase += PHASE_WEIGHTS[index % 6]
+    return middlegame, endgame, phase
+
+
+def tapered_score(scores: Tuple[int, int, int]) -> int:
+    """
+    Returns the score of a position from the point of view of the white
+    player, blended between its middlegame and its endgame score according
+    to the phase of the game (rounded towards zero, so that the scores of
+    the mirrored positions are opposite).
+
+
+    Parameters:
+
+    scores : Tuple[int, int, int]
+        a tuple containing the middlegame score, the endgame score and the
+        phase of the position (see the compute_scores function)
+    """
+    middlegame, endgame, phase = scores
+    phase = min(phase, MAX_PHASE)
+    score = middlegame * phase + endgame * (MAX_PHASE - phase)
+    return int(score / MAX_PHASE)
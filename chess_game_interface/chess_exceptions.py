@@ -18,3 +18,13 @@ class WhitePlayerNotInTheGameException(Exception):
         super().__init__(
             "White player isn't either the current player or the other player."
         )
+
+
+class InvalidFENException(Exception):
+    def __init__(self):
+        super().__init__("Invalid FEN string given to the function.")
+
+
+class InvalidSearchLimitsException(Exception):
+    def __init__(self):
+        super().__init__("Negative search limit given to the function.")
@@ -1,12 +1,11 @@
 from typing import Iterable
-from chess_game_interface.chess_pieces import Queen
 from chess_game_interface.two_player_games.two_player_games.game import Game
 from chess_game_interface.two_player_games.two_player_games.player import (
     Player,
 )
 from chess_game_interface.chess_move import ChessMove
-from chess_game_interface.chess_state import ChessState
-from chess_game_interface.chess_exceptions import InvalidMoveException
+from chess_game_interface.chess_state import ChessState, GameStatus
+from chess_game_interface.chess_bitboards import square_index
 import pygame
 
 
@@ -81,6 +80,35 @@ class ChessGame(Game):
         """
         self.state = self.state.make_move(move, promotion_type)
 
+    def try_make_move(
+        self, move: ChessMove, promotion_type: type = None
+    ) -> bool:
+        """
+        Makes a move and updates the state attribute accordingly if the move
+        can be made. Returns True if the move has been made and False
+        otherwise (no exception is raised).
+
+
+        Parameters:
+
+        move : ChessMove
+            a ChessMove object representing the move being made
+
+        promotion_type : type
+            a type that represents the class of a piece to which the pawn will
+            promote
+        """
+        new_state = self.state.try_make_move(move, promotion_type)
+        if new_state is None:
+            return False
+        self.state = new_state
+        return True
+
+    def get_status(self) -> GameStatus:
+        """Returns a GameStatus value describing if the game is still going
+        on or if it has ended with a checkmate or a stalemate."""
+        return self.state.get_status()
+
     def get_white(self) -> Player:
         """Return the player that is playing white."""
         return self.state._white
@@ -99,21 +127,11 @@ class ChessGame(Game):
         row : int
             an int representing the row of a piece to be checked
         """
-        legal_moves = []
-        get_moves_list = self.state._board[row][column]._get_moves(self.state)
-        for move in get_moves_list:
-            try:
-                new_state = ChessState(
-                    self.state._current_player,
-                    self.state._other_player,
-                    self.state._white,
-                    self.state._board,
-                )
-                new_state.make_move(move, Queen)
-                legal_moves.append(move)
-            except InvalidMoveException:
-                continue
-        return legal_moves
+        return [
+            move
+            for move in self.state.get_legal_moves()
+            if move.start_column() == column and move.start_row() == row
+        ]
 
     def draw(
         self,
@@ -154,7 +172,8 @@ class ChessGame(Game):
         row : int
             an int representing the row of a piece to be checked
         """
-        piece = self.state._board[row][column]
-        return (
-            piece is not None and piece.player() == self.state._current_player
+        return bool(
+            self.state._occupancy[self.state._colour]
+            >> square_index(column, row)
+            & 1
         )
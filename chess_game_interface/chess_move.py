@@ -3,6 +3,14 @@ from chess_game_interface.chess_exceptions import (
 )
 from chess_game_interface.two_player_games.two_player_games.move import Move
 
+# A move is encoded as a 16-bit int: bits 0-5 hold the index of the start
+# square (8 * row + column), bits 6-11 the index of the end square and bits
+# 12-15 the type of the piece a pawn promotes to (0 if the move isn't
+# a promotion).
+END_SQUARE_SHIFT = 6
+PROMOTION_SHIFT = 12
+SQUARES_MASK = (1 << PROMOTION_SHIFT) - 1
+
 
 class ChessMove(Move):
     """
@@ -26,8 +34,20 @@ class ChessMove(Move):
     _end_row : int
         an integer representing the row of a square
         that is the destination of the move
+
+    _code : int
+        an integer encoding both of the squares of the move (see the
+        code method)
     """
 
+    __slots__ = (
+        "_start_column",
+        "_start_row",
+        "_end_column",
+        "_end_row",
+        "_code",
+    )
+
     def __init__(
         self,
         start_column: int,
@@ -60,17 +80,38 @@ class ChessMove(Move):
             that is the destination of the move
         """
 
-        if all(
-            coordinate in range(8)
-            for coordinate in (start_column, start_row, end_column, end_row)
+        if (
+            0 <= start_column < 8
+            and 0 <= start_row < 8
+            and 0 <= end_column < 8
+            and 0 <= end_row < 8
         ):
             self._start_column = start_column
             self._start_row = start_row
             self._end_column = end_column
             self._end_row = end_row
+            self._code = (
+                8 * start_row
+                + start_column
+                + ((8 * end_row + end_column) << END_SQUARE_SHIFT)
+            )
         else:
             raise CoordinatesOutOfBoundsException
 
+    @classmethod
+    def from_code(cls, code: int) -> "ChessMove":
+        """
+        Returns the shared ChessMove object with the squares encoded in
+        a given int. The promotion bits of the code are ignored.
+
+
+        Parameters:
+
+        code : int
+            an int representing an encoded move (see the code method)
+        """
+        return MOVE_TABLE[code & SQUARES_MASK]
+
     def start_column(self) -> int:
         """Returns the column of an originating square."""
         return self._start_column
@@ -87,16 +128,22 @@ class ChessMove(Move):
         """Returns the row of a destination square."""
         return self._end_row
 
+    def code(self) -> int:
+        """Returns an int encoding the move: the index of the originating
+        square in the lowest six bits and the index of the destination square
+        in the next six bits."""
+        return self._code
+
     def __eq__(self, other: object) -> bool:
         """Checks if two moves are equal."""
         if not isinstance(other, ChessMove):
             return False
-        return (
-            self._start_column == other._start_column
-            and self._start_row == other._start_row
-            and self._end_column == other._end_column
-            and self._end_row == other._end_row
-        )
+        return self._code == other._code
+
+    def __hash__(self) -> int:
+        """Returns a hash of the move consistent with the __eq__ method (the
+        code of the move)."""
+        return self._code
 
     def __repr__(self) -> str:
         """
@@ -104,3 +151,36 @@ class ChessMove(Move):
         """
         return f"{chr(self._start_column + ord('a'))}{self._start_row + 1} move to \
 {chr(self._end_column + ord('a'))}{self._end_row + 1}"
+
+
+# ChessMove objects for every pair of squares, indexed by the code of the
+# move. Move generation takes its moves from this table instead of creating
+# new objects.
+MOVE_TABLE = [
+    ChessMove(start & 7, start >> 3, end & 7, end >> 3)
+    for end in range(64)
+    for start in range(64)
+]
+
+
+def code_to_uci(code: int) -> str:
+    """
+    Returns a string describing an encoded move in the notation used by the
+    Universal Chess Interface (eg. "e2e4" or "e7e8q" for a promotion).
+
+
+    Parameters:
+
+    code : int
+        an int representing an encoded move (see the ChessMove.code method)
+    """
+    start = code & 63
+    end = code >> END_SQUARE_SHIFT & 63
+    result = (
+        f"{chr((start & 7) + ord('a'))}{(start >> 3) + 1}"
+        f"{chr((end & 7) + ord('a'))}{(end >> 3) + 1}"
+    )
+    promotion_kind = code >> PROMOTION_SHIFT
+    if promotion_kind:
+        result += "pnbrqk"[promotion_kind]
+    return result
@@ -0,0 +1,237 @@
+from chess_game_interface.chess_state import MutableChessState
+from chess_game_interface.chess_bitboards import KING, PAWN
+from chess_game_interface.chess_move import (
+    END_SQUARE_SHIFT,
+    PROMOTION_SHIFT,
+    SQUARES_MASK,
+)
+from array import array
+from typing import Iterator, Optional
+
+# the number of plies from the root for which the killer moves are kept
+MAX_PLY = 128
+
+# the number of killer moves kept for each ply
+KILLERS_PER_PLY = 2
+
+# History scores are halved once they reach this value, so that the old
+# cutoffs weigh less than the recent ones and the scores stay small.
+MAX_HISTORY_SCORE = 1 << 20
+
+
+def get_taken_type(state: MutableChessState, code: int) -> Optional[int]:
+    """
+    Returns the type of the piece taken by a move (a pawn in the case of an
+    en passant capture) or None if the move isn't a capture.
+
+
+    Parameters:
+
+    state : MutableChessState
+        a MutableChessState object representing the position before the move
+
+    code : int
+        an int representing the encoded move (see the ChessMove.code method)
+    """
+    end = code >> END_SQUARE_SHIFT & 63
+    bitboards = state._bitboards
+    enemy_offset = 6 - 6 * state._colour
+    for piece_type in range(KING):
+        if bitboards[enemy_offset + piece_type] >> end & 1:
+            return piece_type
+    if (
+        end == state._en_passant
+        and bitboards[6 * state._colour + PAWN] >> (code & 63) & 1
+    ):
+        return PAWN
+    return None
+
+
+def capture_score(state: MutableChessState, code: int) -> int:
+    """
+    Returns the score of a capture or a promotion according to the MVV-LVA
+    rule (most valuable victim, least valuable attacker): the captures of
+    the more valuable pieces go first and among the captures of the same
+    piece, the ones made by the less valuable pieces go first. The piece
+    types are ordered by their value, so the types are used as the values.
+    A promotion counts as taking the piece the pawn promotes to.
+
+
+    Parameters:
+
+    state : MutableChessState
+        a MutableChessState object representing the position before the move
+
+    code : int
+        an int representing the encoded move (see the ChessMove.code method)
+    """
+    start = code & 63
+    bitboards = state._bitboards
+    offset = 6 * state._colour
+
+    attacker = KING
+    for piece_type in range(KING):
+        if bitboards[offset + piece_type] >> start & 1:
+            attacker = piece_type
+            break
+    victim = get_taken_type(state, code)
+    if victim is None:
+        victim = -1
+    victim += code >> PROMOTION_SHIFT
+    return 8 * (victim + 1) - attacker
+
+
+class MoveOrdering:
+    """
+    A class deciding the order in which the moves are searched. The move
+    most likely to be the best one (eg. stored in the transposition table)
+    goes first, then the captures and the promotions by their MVV-LVA score
+    (see the capture_score function), then the killer moves (the quiet
+    moves which have caused a cutoff at the same ply in another part of the
+    tree) and then the rest of the moves by their history score (how often
+    and how deep a move with the same squares has caused a cutoff).
+
+
+    Attributes:
+
+    _killers : List[List[int]]
+        a list of the killer moves (their codes) for each ply, the most
+        recent one first
+
+    _history : array
+        an array of the history scores of the moves indexed by the squares
+        of the move (the lowest twelve bits of its code)
+    """
+
+    def __init__(self):
+        """MoveOrdering class constructor."""
+        self._killers = [[0] * KILLERS_PER_PLY for _ in range(MAX_PLY)]
+        self._history = array("L", [0]) * (SQUARES_MASK + 1)
+
+    def new_search(self):
+        """Forgets the killer moves and halves the history scores. Called
+        before each search, as the killer moves are only valid in the
+        positions of one game tree."""
+        for killers in self._killers:
+            for index in range(KILLERS_PER_PLY):
+                killers[index] = 0
+        history = self._history
+        for index in range(len(history)):
+            history[index] >>= 1
+
+    def is_quiet(self, state: MutableChessState, code: int) -> bool:
+        """
+        Returns True if a move is neither a capture nor a promotion.
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position before
+            the move
+
+        code : int
+            an int representing the encoded move
+        """
+        end = code >> END_SQUARE_SHIFT & 63
+        if code >> PROMOTION_SHIFT:
+            return False
+        if state._occupancy[1 - state._colour] >> end & 1:
+            return False
+        return not (
+            end == state._en_passant
+            and state._bitboards[6 * state._colour + PAWN] >> (code & 63) & 1
+        )
+
+    def add_cutoff(
+        self, state: MutableChessState, code: int, depth: int, ply: int
+    ):
+        """
+        Remembers a move that has caused a cutoff (was too good for the
+        other player to allow it). Only the quiet moves are remembered, the
+        captures are ordered well enough by their MVV-LVA score.
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position before
+            the move
+
+        code : int
+            an int representing the encoded move
+
+        depth : int
+            an int representing the depth of the search of the position
+
+        ply : int
+            an int representing the number of moves made since the root
+        """
+        if not self.is_quiet(state, code):
+            return
+        if ply < MAX_PLY:
+            killers = self._killers[ply]
+            if killers[0] != code:
+                killers[1:] = killers[:-1]
+                killers[0] = code
+        history = self._history
+        squares = code & SQUARES_MASK
+        history[squares] += depth * depth
+        if history[squares] >= MAX_HISTORY_SCORE:
+            for index in range(len(history)):
+                history[index] >>= 1
+
+    def iterate_moves(
+        self,
+        state: MutableChessState,
+        codes: array,
+        ply: int,
+        first_code: int = 0,
+    ) -> Iterator[int]:
+        """
+        Yields the codes of given moves in the order in which they should be
+        searched. The first move is yielded before the other ones are
+        scored, so nothing is sorted if it causes a cutoff.
+
+
+        Parameters:
+
+        state : MutableChessState
+            a MutableChessState object representing the position
+
+        codes : array
+            an array of the codes of the legal moves in the position
+
+        ply : int
+            an int representing the number of moves made since the root
+
+        first_code : int
+            an int representing the code of the move to be searched first
+            (0 if there is none)
+        """
+        if first_code and first_code in codes:
+            yield first_code
+
+        captures = []
+        quiets = []
+        for code in codes:
+            if code == first_code:
+                continue
+            if self.is_quiet(state, code):
+                quiets.append(code)
+            else:
+                captures.append((capture_score(state, code), code))
+        captures.sort(reverse=True)
+        for _, code in captures:
+            yield code
+
+        if ply < MAX_PLY:
+            for killer in self._killers[ply]:
+                if killer and killer in quiets:
+                    quiets.remove(killer)
+                    yield killer
+        history = self._history
+        quiets.sort(
+            key=lambda code: history[code & SQUARES_MASK], reverse=True
+        )
+        yield from quiets
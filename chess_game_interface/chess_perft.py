@@ -0,0 +1,367 @@
+from chess_game_interface.chess_state import (
+    ChessState,
+    MutableChessState,
+    FEN_BLACK_CHAR,
+    FEN_WHITE_CHAR,
+)
+from chess_game_interface.chess_move import code_to_uci
+from chess_game_interface.chess_bitboards import WHITE_INDEX
+from chess_game_interface.two_player_games.two_player_games.player import (
+    Player,
+)
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from time import perf_counter
+import argparse
+import os
+
+# a position sent to the worker processes of the parallel perft: a tuple of
+# the twelve bitboards, the colour of the current player, the castling
+# rights and the en passant square
+PackedState = Tuple[Tuple[int, ...], int, int, Optional[int]]
+
+# the least number of subtrees per worker process for which the game tree of
+# the parallel perft is split after the first move instead of the second one
+SUBTREES_PER_PROCESS = 4
+
+# Standard test positions with their published perft results (the numbers
+# of leaf nodes at depths 1, 2, 3 and so on). They cover castling, en
+# passant (including an en passant capture that would expose the king),
+# promotions and checks.
+PERFT_POSITIONS = [
+    (
+        "initial position",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        [20, 400, 8902, 197281, 4865609, 119060324],
+    ),
+    (
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - "
+        "0 1",
+        [48, 2039, 97862, 4085603, 193690690],
+    ),
+    (
+        "en passant and pins",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        [14, 191, 2812, 43238, 674624, 11030083],
+    ),
+    (
+        "promotions",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        [6, 264, 9467, 422333, 15833292],
+    ),
+    (
+        "promotions with check",
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        [44, 1486, 62379, 2103487, 89941194],
+    ),
+    (
+        "middlegame",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - "
+        "0 10",
+        [46, 2079, 89890, 3894594, 164075551],
+    ),
+]
+
+
+def _perft(state: MutableChessState, depth: int) -> int:
+    """
+    Returns the number of leaf nodes of the game tree of a given depth
+    starting from a given state. The moves are made and taken back in place,
+    the state is the same after the function returns.
+
+
+    Parameters:
+
+    state : MutableChessState
+        a MutableChessState object representing the root of the game tree
+
+    depth : int
+        an int representing the depth of the game tree (at least 1)
+    """
+    codes = state.get_legal_move_codes()
+    if depth == 1:
+        return len(codes)
+    nodes = 0
+    for code in codes:
+        state.push_code(code)
+        nodes += _perft(state, depth - 1)
+        state.pop()
+    return nodes
+
+
+def perft(state: ChessState, depth: int) -> int:
+    """
+    Returns the number of leaf nodes of the game tree of a given depth
+    starting from a given state (the number of all the sequences of legal
+    moves of a given length). Each promotion to a different piece counts as
+    a separate move. The given state isn't modified.
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the root of the game tree
+
+    depth : int
+        an int representing the depth of the game tree
+    """
+    if depth <= 0:
+        return 1
+    return _perft(MutableChessState.from_state(state), depth)
+
+
+def divide(state: ChessState, depth: int) -> Dict[str, int]:
+    """
+    Returns a dictionary that maps each of the legal moves in a given state
+    (in the UCI notation, eg. "e2e4") onto the number of leaf nodes of the
+    game tree of a given depth that follow this move. The values add up to
+    perft(state, depth). Used to find the move for which the move generator
+    gives a wrong result.
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the root of the game tree
+
+    depth : int
+        an int representing the depth of the game tree (at least 1)
+    """
+    mutable_state = MutableChessState.from_state(state)
+    result = {}
+    for code in mutable_state.get_legal_move_codes():
+        mutable_state.push_code(code)
+        result[code_to_uci(code)] = (
+            _perft(mutable_state, depth - 1) if depth > 1 else 1
+        )
+        mutable_state.pop()
+    return result
+
+
+def _pack_state(state: ChessState) -> PackedState:
+    """
+    Returns a compact tuple describing the position of a given state, which
+    can be sent to another process much faster than the state itself (the
+    players, the board view and the cached data are left out).
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the position to be packed
+    """
+    return (
+        tuple(state._bitboards),
+        state._colour,
+        state._castling,
+        state._en_passant,
+    )
+
+
+def _unpack_state(packed_state: PackedState) -> MutableChessState:
+    """
+    Returns a new MutableChessState object with the position described by
+    a tuple returned by the _pack_state function. New players are created
+    for the state.
+
+
+    Parameters:
+
+    packed_state : PackedState
+        a tuple describing the position (see the _pack_state function)
+    """
+    bitboards, colour, castling, en_passant = packed_state
+    white = Player(FEN_WHITE_CHAR)
+    black = Player(FEN_BLACK_CHAR)
+    current_player, other_player = (
+        (white, black) if colour == WHITE_INDEX else (black, white)
+    )
+    return MutableChessState._from_position(
+        current_player,
+        other_player,
+        white,
+        list(bitboards),
+        castling,
+        en_passant,
+    )
+
+
+def _perft_task(task: Tuple[PackedState, int]) -> int:
+    """
+    Returns the result of perft for a single subtree. Run by the worker
+    processes of the parallel_perft function.
+
+
+    Parameters:
+
+    task : Tuple[PackedState, int]
+        a tuple containing the packed root of the subtree and its depth
+    """
+    packed_state, depth = task
+    if depth <= 0:
+        return 1
+    return _perft(_unpack_state(packed_state), depth)
+
+
+def _split_tree(
+    state: MutableChessState, plies: int, subtrees: List[PackedState]
+):
+    """
+    Appends the packed positions reached after each sequence of legal moves
+    of a given length from a given state to a given list.
+
+
+    Parameters:
+
+    state : MutableChessState
+        a MutableChessState object representing the root of the game tree
+
+    plies : int
+        an int representing the number of moves made before a position is
+        packed
+
+    subtrees : List[PackedState]
+        a list to which the packed positions are appended
+    """
+    if plies == 0:
+        subtrees.append(_pack_state(state))
+        return
+    for code in state.get_legal_move_codes():
+        state.push_code(code)
+        _split_tree(state, plies - 1, subtrees)
+        state.pop()
+
+
+def parallel_perft(
+    state: ChessState, depth: int, processes: Optional[int] = None
+) -> int:
+    """
+    Returns the same result as the perft function, but splits the game tree
+    into subtrees and counts their nodes in a pool of worker processes.
+    The tree is split after the first move, or after the second one if there
+    are too few first moves to keep all the workers busy until the end.
+
+
+    Parameters:
+
+    state : ChessState
+        a ChessState object representing the root of the game tree
+
+    depth : int
+        an int representing the depth of the game tree
+
+    processes : int
+        an int representing the number of worker processes. Defaults to the
+        number of processors of the machine
+    """
+    processes = processes or os.cpu_count() or 1
+    if depth <= 1 or processes == 1:
+        return perft(state, depth)
+
+    mutable_state = MutableChessState.from_state(state)
+    plies = 1
+    if (
+        depth > 2
+        and len(mutable_state.get_legal_move_codes())
+        < SUBTREES_PER_PROCESS * processes
+    ):
+        plies = 2
+    subtrees = []
+    _split_tree(mutable_state, plies, subtrees)
+
+    tasks = [(subtree, depth - plies) for subtree in subtrees]
+    with ProcessPoolExecutor(processes) as executor:
+        return sum(executor.map(_perft_task, tasks))
+
+
+def run_benchmark(
+    max_depth: int = 3,
+    positions: List[Tuple[str, str, List[int]]] = None,
+    max_nodes: Optional[int] = None,
+    processes: int = 1,
+) -> List[Tuple[str, int, int, int, float]]:
+    """
+    Runs perft on each of the test positions at each depth up to a given
+    one and returns a list of tuples containing the name of the position,
+    the depth, the number of nodes found, the expected number of nodes and
+    the time taken in seconds.
+
+
+    Parameters:
+
+    max_depth : int
+        an int representing the greatest depth to be searched
+
+    positions : List[Tuple[str, str, List[int]]]
+        a list of tuples containing the name of a position, the position in
+        the Forsyth-Edwards Notation and the expected numbers of nodes.
+        Defaults to PERFT_POSITIONS
+
+    max_nodes : int
+        an int representing the greatest expected number of nodes of
+        a search to be run. Deeper searches of a position are skipped
+
+    processes : int
+        an int representing the number of worker processes used by each of
+        the searches (see the parallel_perft function)
+    """
+    results = []
+    for name, fen, expected_nodes in positions or PERFT_POSITIONS:
+        state = ChessState.from_fen(fen)
+        for depth, expected in enumerate(expected_nodes[:max_depth], 1):
+            if max_nodes is not None and expected > max_nodes:
+                break
+            start_time = perf_counter()
+            nodes = parallel_perft(state, depth, processes)
+            results.append(
+                (name, depth, nodes, expected, perf_counter() - start_time)
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Checks the move generator against the published perft "
+        "results of the standard test positions and measures its speed."
+    )
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--max-nodes", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--fen", help="run divide on a given position")
+    arguments = parser.parse_args()
+
+    if arguments.fen:
+        moves = divide(ChessState.from_fen(arguments.fen), arguments.depth)
+        for move, nodes in sorted(moves.items()):
+            print(f"{move}: {nodes}")
+        print(f"total: {sum(moves.values())}")
+        return
+
+    total_nodes = 0
+    total_time = 0
+    failed = False
+    for name, depth, nodes, expected, seconds in run_benchmark(
+        arguments.depth, None, arguments.max_nodes, arguments.processes
+    ):
+        status = "ok"
+        if nodes != expected:
+            status = f"FAILED (expected {expected})"
+            failed = True
+        nodes_per_second = nodes / seconds if seconds else 0
+        print(
+            f"{name:24} depth {depth}: {nodes:>10} nodes "
+            f"{seconds:8.3f} s {nodes_per_second:>10.0f} nps {status}"
+        )
+        total_nodes += nodes
+        total_time += seconds
+    if total_time:
+        print(
+            f"total: {total_nodes} nodes, {total_nodes / total_time:.0f} nps"
+        )
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,27 @@ from chess_game_interface.chess_exceptions import (
 from chess_game_interface.two_player_games.two_player_games.player import (
     Player,
 )
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, List, Tuple
 from itertools import product
 from chess_game_interface.chess_move import ChessMove
+from chess_game_interface.chess_bitboards import (
+    PAWN,
+    KNIGHT,
+    BISHOP,
+    ROOK,
+    QUEEN,
+    KING,
+    WHITE_INDEX,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+    BLACK_KINGSIDE,
+    BLACK_QUEENSIDE,
+    RANK_MASKS,
+    build_rays,
+    ray_attacks,
+    shift_attacks,
+    square_index,
+)
 from chess_game_interface.load_svg import load_svg_resize
 from chess_game_interface.chess_utils import PIECE_SIZE
 
@@ -18,11 +36,57 @@ class ChessState:
     pass
 
 
+# Lookup tables of the squares that the pieces can move to or attack from
+# each of the squares. They are computed once when the module is loaded, so
+# that generating moves doesn't have to check the bounds of the board.
+
+KNIGHT_SHIFTS = tuple(product((-2, 2), (-1, 1))) + tuple(
+    product((-1, 1), (-2, 2))
+)
+KING_SHIFTS = tuple(
+    shift for shift in product((1, 0, -1), (1, 0, -1)) if shift != (0, 0)
+)
+PAWN_CAPTURE_SHIFTS = (((-1, 1), (1, 1)), ((-1, -1), (1, -1)))
+DIAGONAL_DIRECTIONS = tuple(product((-1, 1), (-1, 1)))
+STRAIGHT_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+KNIGHT_TARGETS = [
+    shift_attacks(1 << square, KNIGHT_SHIFTS) for square in range(64)
+]
+KING_TARGETS = [
+    shift_attacks(1 << square, KING_SHIFTS) for square in range(64)
+]
+PAWN_CAPTURE_TARGETS = [
+    [shift_attacks(1 << square, shifts) for square in range(64)]
+    for shifts in PAWN_CAPTURE_SHIFTS
+]
+# pushes by one and by two squares forward for each of the colours (empty
+# bitboards where a pawn can't make such a push)
+PAWN_PUSH_TARGETS = [
+    [1 << (square + 8) if square < 56 else 0 for square in range(64)],
+    [1 << (square - 8) if square >= 8 else 0 for square in range(64)],
+]
+PAWN_DOUBLE_PUSH_TARGETS = [
+    [1 << (square + 16) if 8 <= square < 16 else 0 for square in range(64)],
+    [1 << (square - 16) if 48 <= square < 56 else 0 for square in range(64)],
+]
+RAYS = {
+    direction: build_rays(direction)
+    for direction in DIAGONAL_DIRECTIONS + STRAIGHT_DIRECTIONS
+}
+DIAGONAL_RAYS = tuple(RAYS[direction] for direction in DIAGONAL_DIRECTIONS)
+STRAIGHT_RAYS = tuple(RAYS[direction] for direction in STRAIGHT_DIRECTIONS)
+
+
 class ChessPiece:
     icons = {True: None, False: None}
+    KIND = None
+    __slots__ = ("_column", "_row", "_player")
     """
     A class that represents a chess piece. Provides attributes and methods for
-    child classes. Shouldn't be called explicitly.
+    child classes. Shouldn't be called explicitly. The pieces are never
+    modified after they are created, so a single piece object can be shared
+    by many states (see the _make_piece method of the ChessState class).
 
 
     Attributes:
@@ -86,12 +150,22 @@ class ChessPiece:
         belongs to."""
         return self._player
 
-    def _get_moves_lines(
-        self, state: ChessState, directions: Iterable[Tuple[int, int]]
-    ) -> Iterable[ChessMove]:
+    def square(self) -> int:
+        """Returns an integer representing the index of a square that the
+        piece resides on (as used by the bitboards in the ChessState class)."""
+        return square_index(self._column, self._row)
+
+    @classmethod
+    def _get_lines_targets(
+        cls,
+        state: ChessState,
+        square: int,
+        colour: int,
+        rays: Iterable[Tuple[List[int], bool]],
+    ) -> int:
         """
-        Returns a list of all possible moves that a piece moving in a line
-        would be able to make. This function ONLY takes into consideration
+        Returns a bitboard of all the squares that a piece moving in a line
+        would be able to move to. This function ONLY takes into consideration
         how a piece moves physically (ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -103,44 +177,34 @@ class ChessPiece:
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
 
-        directions : Iterable[Tuple[int]]
-            a list containing tuples indicating directions of each of the
-            lines. These tuples are of the form (int, int), where both of
-            these integers belong to {-1, 0, 1} and both of the values
-            aren't equal to 0 simultaneously (eg. (0, 1), (-1, 1)). These
-            values correspond to the column and row direction respectively
-        """
-        result = []
-        for direction in directions:
-            dir_column, dir_row = direction
-            for distance in range(1, 8):
-                new_column = self._column + distance * dir_column
-                new_row = self._row + distance * dir_row
-                if new_column not in range(8) or new_row not in range(8):
-                    continue
-                possible_square = state._board[new_row][new_column]
-                if not (
-                    possible_square is not None
-                    and possible_square.player() == self._player
-                ):
-                    result.append(
-                        ChessMove(
-                            self._column,
-                            self._row,
-                            new_column,
-                            new_row,
-                        )
-                    )
-                if possible_square is not None:
-                    break
-        return result
+        square : int
+            an int representing the index of a square that the piece
+            resides on
+
+        colour : int
+            an int representing the colour of the piece (WHITE_INDEX or
+            BLACK_INDEX)
+
+        rays : Iterable[Tuple[List[int], bool]]
+            a list containing the precomputed rays of each of the lines the
+            piece moves along (eg. the RAYS attribute of the Bishop class)
+        """
+        return (
+            ray_attacks(square, state._occupied, rays)
+            & ~state._occupancy[colour]
+        )
 
-    def _get_moves_shifts(
-        self, state: ChessState, shifts: Iterable[Tuple[int, int]]
-    ) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_shifts_targets(
+        cls,
+        state: ChessState,
+        square: int,
+        colour: int,
+        targets: List[int],
+    ) -> int:
         """
-        Returns a list of all possible moves that a piece would be able
-        to make given all the possible shifts it is able to make. This
+        Returns a bitboard of all the squares that a piece would be able
+        to move to given all the possible shifts it is able to make. This
         function ONLY takes into consideration how a piece moves physically
         (ie. if it's blocked by other pieces, if it can take other pieces
         and if it's within the board).
@@ -153,39 +217,93 @@ class ChessPiece:
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
 
-        directions : Iterable[Tuple[int]]
-            a list containing tuples indicating all the possible shifts that
-            a piece can make. These tuples are of the form (int, int),
-            where both of these numbers aren't equal to (eg. (0, 2),
-            (-1, 3)). These values correspond to the column and row shift
-            respectively
-        """
-        result = []
-        for position in shifts:
-            new_column, new_row = position
-            new_column += self._column
-            new_row += self._row
-            if new_column not in range(8) or new_row not in range(8):
-                continue
-            possible_square = state._board[new_row][new_column]
-            if not (
-                possible_square is not None
-                and possible_square.player() == self._player
-            ):
-                result.append(
-                    ChessMove(
-                        self._column,
-                        self._row,
-                        new_column,
-                        new_row,
-                    )
-                )
-        return result
+        square : int
+            an int representing the index of a square that the piece
+            resides on
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
-        """_get_moves method definition for child classes."""
+        colour : int
+            an int representing the colour of the piece (WHITE_INDEX or
+            BLACK_INDEX)
+
+        targets : List[int]
+            a list containing bitboards of the squares reachable by all the
+            possible shifts that a piece can make from each of the squares
+            (eg. the TARGETS attribute of the Knight class)
+        """
+        return targets[square] & ~state._occupancy[colour]
+
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
+        """_get_targets method definition for child classes."""
         pass
 
+    @classmethod
+    def _get_capture_targets(
+        cls, state: ChessState, square: int, colour: int
+    ) -> int:
+        """
+        Returns a bitboard of the squares that a piece would be able to move
+        to taking an enemy piece (a subset of the squares returned by the
+        _get_targets method).
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the current state of the game
+
+        square : int
+            an int representing the index of a square that the piece
+            resides on
+
+        colour : int
+            an int representing the colour of the piece (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        return cls._get_targets(state, square, colour) & state._occupancy[
+            1 - colour
+        ]
+
+    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+        """
+        Returns a list of all possible moves that the piece would be able
+        to make. This function ONLY takes into consideration how a piece
+        moves physically (ie. if it's blocked by other pieces, if it can
+        take other pieces and if it's within the board).
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the current state of the game
+            (the situation on the board, the current player, etc. (more
+            info in the ChessState class docs in the chess_state.py file))
+        """
+        square = self.square()
+        return state._get_moves_from_targets(
+            square,
+            self._get_targets(state, square, state._get_colour(self._player)),
+        )
+
+    def _iterate_moves(self, state: ChessState) -> Iterator[ChessMove]:
+        """
+        Yields all possible moves that the piece would be able to make one by
+        one (a generator variant of the _get_moves method).
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the current state of the game
+            (the situation on the board, the current player, etc. (more
+            info in the ChessState class docs in the chess_state.py file))
+        """
+        square = self.square()
+        return state._iterate_moves_from_targets(
+            square,
+            self._get_targets(state, square, state._get_colour(self._player)),
+        )
+
     @classmethod
     def draw(
         self,
@@ -211,6 +329,10 @@ class Pawn(ChessPiece):
         True: load_svg_resize("chess_icons/white_pawn.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_pawn.svg", PIECE_SIZE),
     }
+    KIND = PAWN
+    CAPTURE_SHIFTS = PAWN_CAPTURE_SHIFTS
+    CAPTURE_TARGETS = PAWN_CAPTURE_TARGETS
+    __slots__ = ("_first_move", "_is_en_passantable")
     """
     A class that represents a pawn.
 
@@ -286,10 +408,11 @@ class Pawn(ChessPiece):
         of the ChessState class. Indicates the pawn's player."""
         return f"P{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a pawn would be able
-        to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a pawn would be able
+        to move to. This function ONLY takes into consideration how a
         piece moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -300,116 +423,82 @@ class Pawn(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
+
+        square : int
+            an int representing the index of a square that the pawn
+            resides on
+
+        colour : int
+            an int representing the colour of the pawn (WHITE_INDEX or
+            BLACK_INDEX)
         """
-        result = []
-        row_shift = 1 if self._player == state._white else -1
-        right_column = self._column + 1
-        left_column = self._column - 1
-
-        if state._board[self._row + row_shift][self._column] is None:
-            result.append(
-                ChessMove(
-                    self._column,
-                    self._row,
-                    self._column,
-                    self._row + row_shift,
-                )
-            )
-        if (
-            self._first_move
-            and state._board[self._row + row_shift][self._column] is None
-            and state._board[self._row + 2 * row_shift][self._column] is None
-        ):
-            result.append(
-                ChessMove(
-                    self._column,
-                    self._row,
-                    self._column,
-                    self._row + 2 * row_shift,
-                )
-            )
-        if right_column in range(8):
-            right_diagonal = state._board[self._row + row_shift][right_column]
-            if (
-                right_diagonal is not None
-                and right_diagonal.player() != self._player
-            ):
-                result.append(
-                    ChessMove(
-                        self._column,
-                        self._row,
-                        right_column,
-                        self._row + row_shift,
-                    )
-                )
-
-            right_square = state._board[self._row][right_column]
-            if (
-                right_square is not None
-                and type(right_square) == Pawn
-                and right_square.player() != self._player
-                and right_square.is_en_passantable
-                and right_diagonal is None
-            ):
-                result.append(
-                    ChessMove(
-                        self._column,
-                        self._row,
-                        right_column,
-                        self._row + row_shift,
-                    )
-                )
-
-        if left_column in range(8):
-            left_diagonal = state._board[self._row + row_shift][left_column]
-            if (
-                left_diagonal is not None
-                and left_diagonal.player() != self._player
-            ):
-                result.append(
-                    ChessMove(
-                        self._column,
-                        self._row,
-                        left_column,
-                        self._row + row_shift,
-                    )
-                )
-
-            left_square = state._board[self._row][left_column]
-            if (
-                left_square is not None
-                and type(left_square) == Pawn
-                and left_square.player() != self._player
-                and left_square.is_en_passantable
-                and left_diagonal is None
-            ):
-                result.append(
-                    ChessMove(
-                        self._column,
-                        self._row,
-                        left_column,
-                        self._row + row_shift,
-                    )
-                )
+        empty = ~state._occupied
+
+        result = PAWN_PUSH_TARGETS[colour][square] & empty
+        if result:
+            result |= PAWN_DOUBLE_PUSH_TARGETS[colour][square] & empty
+
+        takeable = state._occupancy[1 - colour]
+        if state._en_passant is not None and colour == state._colour:
+            takeable |= 1 << state._en_passant
+        result |= cls.CAPTURE_TARGETS[colour][square] & takeable
 
         return result
 
+    @classmethod
+    def _get_capture_targets(
+        cls, state: ChessState, square: int, colour: int
+    ) -> int:
+        """
+        Returns a bitboard of the squares that a pawn would be able to move
+        to taking an enemy piece (including en passant) or promoting. The
+        pushes that don't promote aren't generated at all.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the current state of the game
+
+        square : int
+            an int representing the index of a square that the pawn
+            resides on
+
+        colour : int
+            an int representing the colour of the pawn (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        takeable = state._occupancy[1 - colour]
+        if state._en_passant is not None and colour == state._colour:
+            takeable |= 1 << state._en_passant
+        return (
+            cls.CAPTURE_TARGETS[colour][square] & takeable
+            | PAWN_PUSH_TARGETS[colour][square]
+            & ~state._occupied
+            & (RANK_MASKS[0] | RANK_MASKS[7])
+        )
+
 
 class Knight(ChessPiece):
     icons = {
         True: load_svg_resize("chess_icons/white_knight.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_knight.svg", PIECE_SIZE),
     }
+    KIND = KNIGHT
+    __slots__ = ()
+    SHIFTS = KNIGHT_SHIFTS
+    TARGETS = KNIGHT_TARGETS
 
     def __str__(self) -> str:
         """Returns a string representing a knight. Used in the __str__ function
         of the ChessState class. Indicates the knight's player."""
         return f"N{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a bishop would be
-        able to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a knight would be
+        able to move to. This function ONLY takes into consideration how a
         knight moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -420,12 +509,16 @@ class Knight(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
-        """
 
-        possible_shifts = list(product((-2, 2), (-1, 1))) + list(
-            product((-1, 1), (-2, 2))
-        )
-        return self._get_moves_shifts(state, possible_shifts)
+        square : int
+            an int representing the index of a square that the knight
+            resides on
+
+        colour : int
+            an int representing the colour of the knight (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        return cls._get_shifts_targets(state, square, colour, cls.TARGETS)
 
 
 class Bishop(ChessPiece):
@@ -433,16 +526,21 @@ class Bishop(ChessPiece):
         True: load_svg_resize("chess_icons/white_bishop.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_bishop.svg", PIECE_SIZE),
     }
+    KIND = BISHOP
+    __slots__ = ()
+    DIRECTIONS = DIAGONAL_DIRECTIONS
+    RAYS = DIAGONAL_RAYS
 
     def __str__(self) -> str:
         """Returns a string representing a bishop. Used in the __str__ function
         of the ChessState class. Indicates the bishop's player."""
         return f"B{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a bishop would be
-        able to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a bishop would be
+        able to move to. This function ONLY takes into consideration how a
         bishop moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -453,8 +551,16 @@ class Bishop(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
+
+        square : int
+            an int representing the index of a square that the bishop
+            resides on
+
+        colour : int
+            an int representing the colour of the bishop (WHITE_INDEX or
+            BLACK_INDEX)
         """
-        return self._get_moves_lines(state, product((-1, 1), (-1, 1)))
+        return cls._get_lines_targets(state, square, colour, cls.RAYS)
 
 
 class Rook(ChessPiece):
@@ -462,6 +568,10 @@ class Rook(ChessPiece):
         True: load_svg_resize("chess_icons/white_rook.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_rook.svg", PIECE_SIZE),
     }
+    KIND = ROOK
+    DIRECTIONS = STRAIGHT_DIRECTIONS
+    RAYS = STRAIGHT_RAYS
+    __slots__ = ("_can_castle",)
     """
     A class that represents a rook.
 
@@ -523,10 +633,11 @@ class Rook(ChessPiece):
         of the ChessState class. Indicates the rook's player."""
         return f"R{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a rook would be
-        able to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a rook would be
+        able to move to. This function ONLY takes into consideration how a
         rook moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -537,10 +648,16 @@ class Rook(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
-        """
 
-        directions = ((1, 0), (0, 1), (-1, 0), (0, -1))
-        return self._get_moves_lines(state, directions)
+        square : int
+            an int representing the index of a square that the rook
+            resides on
+
+        colour : int
+            an int representing the colour of the rook (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        return cls._get_lines_targets(state, square, colour, cls.RAYS)
 
 
 class Queen(ChessPiece):
@@ -548,16 +665,21 @@ class Queen(ChessPiece):
         True: load_svg_resize("chess_icons/white_queen.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_queen.svg", PIECE_SIZE),
     }
+    KIND = QUEEN
+    __slots__ = ()
+    DIRECTIONS = Bishop.DIRECTIONS + Rook.DIRECTIONS
+    RAYS = Bishop.RAYS + Rook.RAYS
 
     def __str__(self) -> str:
         """Returns a string representing a queen. Used in the __str__ function
         of the ChessState class. Indicates the queen's player."""
         return f"Q{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a queen would be
-        able to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a queen would be
+        able to move to. This function ONLY takes into consideration how a
         queen moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board).
 
@@ -568,11 +690,16 @@ class Queen(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
-        """
 
-        directions = list(product((1, 0, -1), (1, 0, -1)))
-        directions.remove((0, 0))
-        return self._get_moves_lines(state, directions)
+        square : int
+            an int representing the index of a square that the queen
+            resides on
+
+        colour : int
+            an int representing the colour of the queen (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        return cls._get_lines_targets(state, square, colour, cls.RAYS)
 
 
 class King(ChessPiece):
@@ -580,6 +707,14 @@ class King(ChessPiece):
         True: load_svg_resize("chess_icons/white_king.svg", PIECE_SIZE),
         False: load_svg_resize("chess_icons/black_king.svg", PIECE_SIZE),
     }
+    KIND = KING
+    SHIFTS = KING_SHIFTS
+    TARGETS = KING_TARGETS
+    CASTLING_RIGHTS = (
+        (WHITE_KINGSIDE, WHITE_QUEENSIDE),
+        (BLACK_KINGSIDE, BLACK_QUEENSIDE),
+    )
+    __slots__ = ("_can_castle",)
     """
     A class that represents a king.
 
@@ -641,10 +776,11 @@ class King(ChessPiece):
         of the ChessState class. Indicates the king's player."""
         return f"K{self._player.char}"
 
-    def _get_moves(self, state: ChessState) -> Iterable[ChessMove]:
+    @classmethod
+    def _get_targets(cls, state: ChessState, square: int, colour: int) -> int:
         """
-        Returns a list of all possible moves that a king would be
-        able to make. This function ONLY takes into consideration how a
+        Returns a bitboard of all the squares that a king would be able
+        to move to. This function ONLY takes into consideration how a
         king moves physically ((ie. if it's blocked by other pieces,
         if it can take other pieces and if it's within the board) and if
         it can castle.
@@ -656,38 +792,37 @@ class King(ChessPiece):
             a ChessState object representing the current state of the game
             (the situation on the board, the current player, etc. (more
             info in the ChessState class docs in the chess_state.py file))
-        """
 
-        possible_shifts = list(product((1, 0, -1), (1, 0, -1)))
-        possible_shifts.remove((0, 0))
-        result = self._get_moves_shifts(state, possible_shifts)
+        square : int
+            an int representing the index of a square that the king
+            resides on
 
-        if self._column == 4 and self._can_castle:
+        colour : int
+            an int representing the colour of the king (WHITE_INDEX or
+            BLACK_INDEX)
+        """
+        result = cls._get_shifts_targets(state, square, colour, cls.TARGETS)
+
+        kingside, queenside = cls.CASTLING_RIGHTS[colour]
+        home_square = 4 if colour == WHITE_INDEX else 60
+        if square == home_square and state._castling & (kingside | queenside):
+            rooks = state._bitboards[6 * colour + ROOK]
 
-            left_corner = state._board[self._row][0]
             if (
-                left_corner
-                and type(left_corner) == Rook
-                and left_corner.player() == self._player
-                and left_corner.can_castle()
-                and all(
-                    state._board[self._row][column] is None
-                    for column in range(1, 4)
-                )
+                state._castling & queenside
+                and rooks >> (square - 4) & 1
+                and not state._occupied & (0b1110 << (square - 4))
             ):
-                result.append(ChessMove(self._column, self._row, 2, self._row))
+                result |= 1 << (square - 2)
 
-            right_corner = state._board[self._row][7]
             if (
-                right_corner
-                and type(right_corner) == Rook
-                and right_corner.player() == self._player
-                and right_corner.can_castle()
-                and all(
-                    state._board[self._row][column] is None
-                    for column in range(5, 7)
-                )
+                state._castling & kingside
+                and rooks >> (square + 3) & 1
+                and not state._occupied & (0b110 << square)
             ):
-                result.append(ChessMove(self._column, self._row, 6, self._row))
+                result |= 1 << (square + 2)
 
         return result
+
+
+PIECE_TYPES = (Pawn, Knight, Bishop, Rook, Queen, King)
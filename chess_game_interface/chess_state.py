@@ -5,6 +5,7 @@ from chess_game_interface.two_player_games.two_player_games.player import (
 from chess_game_interface.chess_exceptions import (
     InvalidMoveException,
     IncorrectPieceTypeException,
+    InvalidFENException,
     WhitePlayerNotInTheGameException,
 )
 from chess_game_interface.chess_pieces import (
@@ -15,9 +16,56 @@ from chess_game_interface.chess_pieces import (
     Rook,
     Queen,
     King,
+    PIECE_TYPES,
 )
-from chess_game_interface.chess_move import ChessMove
-from typing import Iterable, List, Optional
+from chess_game_interface.chess_bitboards import (
+    PAWN,
+    KNIGHT,
+    BISHOP,
+    ROOK,
+    QUEEN,
+    KING,
+    WHITE_INDEX,
+    BLACK_INDEX,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+    BLACK_KINGSIDE,
+    BLACK_QUEENSIDE,
+    ALL_CASTLING_RIGHTS,
+    CASTLING_RIGHTS_MASKS,
+    FULL_BOARD,
+    RANK_MASKS,
+    iterate_squares,
+    line_attacks,
+    ray_attacks,
+    shift_attacks,
+    square_column,
+    square_index,
+    square_row,
+)
+from chess_game_interface.chess_zobrist import (
+    BLACK_TO_MOVE_KEY,
+    CASTLING_KEYS,
+    EN_PASSANT_KEYS,
+    PIECE_KEYS,
+    compute_hash,
+)
+from chess_game_interface.chess_evaluation import (
+    ENDGAME_SCORES,
+    MIDDLEGAME_SCORES,
+    PHASE_WEIGHTS,
+    compute_scores,
+    tapered_score,
+)
+from chess_game_interface.chess_move import (
+    ChessMove,
+    END_SQUARE_SHIFT,
+    MOVE_TABLE,
+    PROMOTION_SHIFT,
+)
+from array import array
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import pygame
 from chess_game_interface.chess_utils import (
     PIECE_SIZE,
@@ -25,6 +73,37 @@ from chess_game_interface.chess_utils import (
     DARK_BROWN,
 )
 
+# characters used by the Forsyth-Edwards Notation for the piece types (in the
+# order of PAWN, KNIGHT, etc.) and the castling rights (in the order of the
+# bits of the WHITE_KINGSIDE, WHITE_QUEENSIDE, etc. constants)
+FEN_PIECE_CHARS = "pnbrqk"
+FEN_CASTLING_CHARS = "KQkq"
+FEN_WHITE_CHAR = "W"
+FEN_BLACK_CHAR = "B"
+
+
+class GameStatus(Enum):
+    """
+    An enumeration of the possible statuses of a game in a given state.
+
+
+    Values:
+
+    ONGOING
+        the current player has at least one legal move
+
+    CHECKMATE
+        the current player has no legal moves and their king is under check
+
+    STALEMATE
+        the current player has no legal moves and their king isn't under
+        check
+    """
+
+    ONGOING = 0
+    CHECKMATE = 1
+    STALEMATE = 2
+
 
 class ChessState(State):
     """
@@ -34,7 +113,92 @@ class ChessState(State):
     Attributes:
 
     _current_player : Player
-        represents
+        a Player object which represents the player whose move is now
+
+    _other_player : Player
+        a Player object which represents the player who is waiting for
+        their move
+
+    _white : Player
+        a Player object which represents the player playing white pieces
+
+    _colour : int
+        an int representing the colour of the current player (WHITE_INDEX or
+        BLACK_INDEX)
+
+    _bitboards : List[int]
+        a list of twelve bitboards, one for each piece type of each colour.
+        The bitboard of a given piece type and colour is stored under the
+        index 6 * colour + piece type (see chess_bitboards.py)
+
+    _occupancy : List[int]
+        a list of two bitboards representing the squares occupied by the
+        white and the black pieces respectively
+
+    _occupied : int
+        a bitboard representing all the occupied squares
+
+    _castling : int
+        an int whose bits represent the castling rights of both of the
+        players (see the WHITE_KINGSIDE and similar constants)
+
+    _en_passant : int
+        an int representing the index of a square onto which the current
+        player can take en passant or None if there is no such square
+
+    _hash : int
+        an int representing the 64-bit Zobrist hash of the position (see
+        chess_zobrist.py)
+
+    _scores : Tuple[int, int, int]
+        a tuple containing the middlegame and the endgame score of the
+        material and the placement of the pieces and the phase of the game
+        (see chess_evaluation.py). Updated with each move from the pieces
+        it moves, takes and promotes
+
+    _board_view : Tuple[Tuple[ChessPiece]]
+        a tuple of eight tuples (rows) of ChessPiece objects built from the
+        bitboards on first access of the _board attribute (None until then).
+        The rows are never modified, so a row that hasn't been changed by
+        a move is the same object in the board views of both of the states
+
+    _board_source : Tuple[Tuple[Tuple[ChessPiece]], int]
+        a tuple containing the board view of the state this state comes from
+        and a bitboard of the squares changed by the move (None if the board
+        view of the previous state hadn't been built when the move was made).
+        Only the rows containing the changed squares are built, the other
+        ones are taken from the previous board view
+
+    _attack_maps : List[int]
+        a list of two bitboards representing the squares attacked by the
+        white and the black pieces respectively. Each of them is computed
+        the first time it is needed (None until then)
+
+    _legal_moves : Tuple[ChessMove]
+        a tuple of all the legal moves of the current player, generated the
+        first time it is needed (None until then)
+
+    _status : GameStatus
+        a GameStatus value describing if the game is over, determined the
+        first time it is needed (None until then)
+
+    _king_squares : Tuple[int, int]
+        a tuple of the indices of the squares of the white and the black king
+        respectively (None if there is no king of a given colour on the
+        board). Updated with each move instead of being searched for
+
+    _pieces : Dict[tuple, ChessPiece]
+        a dictionary of all the ChessPiece objects created for the board
+        views, shared by a state and all the states that follow it. Since
+        the pieces never change, a piece that stays on its square is the
+        same object in the board view of every state
+
+    A ChessState object never changes the position it describes (making
+    a move returns a new state and leaves this one untouched), so it can be
+    used from many threads at once. The only attributes set after the state
+    is created are the values computed on first use (the board view, the
+    attack maps, the legal moves and the status), and since they only depend
+    on the position, each thread computes the same values.
     """
 
     def __init__(
@@ -67,62 +231,596 @@ class ChessState(State):
             chess board (empty fields are represented by the None values)
         """
         if board:
-            self._board = board
+            white = white or current_player
+            bitboards, castling, en_passant = self._read_board(
+                board, white, current_player
+            )
         else:
             if white not in (current_player, other_player, None):
                 raise WhitePlayerNotInTheGameException
             white = white or current_player
-            black = other_player if current_player == white else current_player
-            self._board = [
-                [
-                    Rook(0, 0, white),
-                    Knight(1, 0, white),
-                    Bishop(2, 0, white),
-                    Queen(3, 0, white),
-                    King(4, 0, white),
-                    Bishop(5, 0, white),
-                    Knight(6, 0, white),
-                    Rook(7, 0, white),
-                ],
-                [Pawn(column_index, 1, white) for column_index in range(8)],
-                [None for column in range(8)],
-                [None for column in range(8)],
-                [None for column in range(8)],
-                [None for column in range(8)],
-                [Pawn(column_index, 6, black) for column_index in range(8)],
-                [
-                    Rook(0, 7, black),
-                    Knight(1, 7, black),
-                    Bishop(2, 7, black),
-                    Queen(3, 7, black),
-                    King(4, 7, black),
-                    Bishop(5, 7, black),
-                    Knight(6, 7, black),
-                    Rook(7, 7, black),
-                ],
+            bitboards = [
+                0xFF00,
+                0x42,
+                0x24,
+                0x81,
+                0x8,
+                0x10,
+                0xFF000000000000,
+                0x4200000000000000,
+                0x2400000000000000,
+                0x8100000000000000,
+                0x800000000000000,
+                0x1000000000000000,
             ]
+            castling = ALL_CASTLING_RIGHTS
+            en_passant = None
+
+        self._set_position(
+            current_player,
+            other_player,
+            white,
+            bitboards,
+            castling,
+            en_passant,
+        )
+
+    def _set_position(
+        self,
+        current_player: Player,
+        other_player: Player,
+        white: Player,
+        bitboards: List[int],
+        castling: int,
+        en_passant: Optional[int],
+        key: Optional[int] = None,
+        pieces: Optional[Dict[tuple, ChessPiece]] = None,
+        king_squares: Optional[Tuple[int, int]] = None,
+        scores: Optional[Tuple[int, int, int]] = None,
+    ):
+        """
+        Sets all the attributes describing the position. Used by the
+        constructor and when creating the states that follow a move.
+
+
+        Parameters:
+
+        current_player : Player
+            a Player object which represents the player whose move is now
+
+        other_player : Player
+            a Player object which represents the player who is waiting for
+            their move
+
+        white : Player
+            a Player object which represents the player playing white pieces
+
+        bitboards : List[int]
+            a list of twelve bitboards, one for each piece type of each colour
+
+        castling : int
+            an int whose bits represent the castling rights of both of the
+            players
+
+        en_passant : int
+            an int representing the index of a square onto which the current
+            player can take en passant or None if there is no such square
+
+        key : int
+            an int representing the Zobrist hash of the position. It is
+            computed from the other parameters if it isn't given
 
+        pieces : Dict[tuple, ChessPiece]
+            a dictionary of the piece objects to be shared with another state
+            (a new one is created if it isn't given)
+
+        king_squares : Tuple[int, int]
+            a tuple of the indices of the squares of both of the kings. It is
+            computed from the bitboards if it isn't given
+
+        scores : Tuple[int, int, int]
+            a tuple containing the middlegame score, the endgame score and
+            the phase of the position. It is computed from the bitboards if
+            it isn't given
+        """
         self._current_player = current_player
         self._other_player = other_player
+        self._white = white
+        self._colour = WHITE_INDEX if current_player == white else BLACK_INDEX
+
+        self._bitboards = bitboards
+        self._castling = castling
+        self._en_passant = en_passant
+        if key is None:
+            key = compute_hash(bitboards, self._colour, castling, en_passant)
+        self._hash = key
+        self._pieces = {} if pieces is None else pieces
+        if king_squares is None:
+            king_squares = tuple(
+                king.bit_length() - 1 if king else None
+                for king in (bitboards[KING], bitboards[6 + KING])
+            )
+        self._king_squares = king_squares
+        if scores is None:
+            scores = compute_scores(bitboards)
+        self._scores = scores
+        self._update_occupancy()
 
-        self._white = white or current_player
-
-    def get_moves(self) -> Iterable[ChessMove]:
+    def _update_occupancy(self):
         """
-        Returns a list of moves generated by _get_moves method by each of
-        the ChessPiece object on the board belonging to the current player.
+        Computes the occupancy bitboards from the bitboards of the pieces and
+        clears all the data computed from the previous position.
         """
-        result = []
+        bitboards = self._bitboards
+        self._occupancy = [
+            bitboards[0]
+            | bitboards[1]
+            | bitboards[2]
+            | bitboards[3]
+            | bitboards[4]
+            | bitboards[5],
+            bitboards[6]
+            | bitboards[7]
+            | bitboards[8]
+            | bitboards[9]
+            | bitboards[10]
+            | bitboards[11],
+        ]
+        self._occupied = self._occupancy[0] | self._occupancy[1]
+        self._board_view = None
+        self._board_source = None
+        self._attack_maps = [None, None]
+        self._legal_moves = None
+        self._status = None
+
+    @staticmethod
+    def _read_board(
+        board: List[List[ChessPiece]], white: Player, current_player: Player
+    ):
+        """
+        Returns a tuple containing the list of bitboards, the castling rights
+        and the en passant square described by a two-dimensional list of
+        ChessPiece objects.
+
+
+        Parameters:
+
+        board : List[List[ChessPiece]]
+            a two-dimensional list with ChessPiece objects representing the
+            chess board (empty fields are represented by the None values)
+
+        white : Player
+            a Player object which represents the player playing white pieces
 
-        for row in self._board:
+        current_player : Player
+            a Player object which represents the player whose move is now
+        """
+        bitboards = [0 for _ in range(12)]
+        castling = 0
+        en_passant = None
+        corners = {
+            0: WHITE_QUEENSIDE,
+            7: WHITE_KINGSIDE,
+            56: BLACK_QUEENSIDE,
+            63: BLACK_KINGSIDE,
+        }
+        castling_kings = 0
+
+        for row in board:
             for piece in row:
-                piece_moves = []
-                if (
-                    piece is not None
-                    and piece.player() == self._current_player
+                if piece is None:
+                    continue
+                colour = (
+                    WHITE_INDEX if piece.player() == white else BLACK_INDEX
+                )
+                square = piece.square()
+                bitboards[6 * colour + piece.KIND] |= 1 << square
+
+                if type(piece) == Rook and piece.can_castle():
+                    castling |= corners.get(square, 0)
+                elif type(piece) == King and piece.can_castle():
+                    if square == (4 if colour == WHITE_INDEX else 60):
+                        castling_kings |= (
+                            WHITE_KINGSIDE | WHITE_QUEENSIDE
+                            if colour == WHITE_INDEX
+                            else BLACK_KINGSIDE | BLACK_QUEENSIDE
+                        )
+                elif (
+                    type(piece) == Pawn
+                    and piece.is_en_passantable()
+                    and piece.player() != current_player
                 ):
-                    piece_moves = piece._get_moves(self)
-                result += piece_moves
+                    en_passant = square + (-8 if colour == WHITE_INDEX else 8)
+
+        return bitboards, castling & castling_kings, en_passant
+
+    @classmethod
+    def _from_position(
+        cls,
+        current_player: Player,
+        other_player: Player,
+        white: Player,
+        bitboards: List[int],
+        castling: int,
+        en_passant: Optional[int],
+        key: Optional[int] = None,
+        pieces: Optional[Dict[tuple, ChessPiece]] = None,
+        king_squares: Optional[Tuple[int, int]] = None,
+        scores: Optional[Tuple[int, int, int]] = None,
+    ) -> "ChessState":
+        """
+        Returns a new state with the given position without going through
+        the constructor (which reads the position from a two-dimensional
+        list). The parameters are the same as in the _set_position method.
+        """
+        state = cls.__new__(cls)
+        state._set_position(
+            current_player,
+            other_player,
+            white,
+            bitboards,
+            castling,
+            en_passant,
+            key,
+            pieces,
+            king_squares,
+            scores,
+        )
+        return state
+
+    @classmethod
+    def from_fen(
+        cls, fen: str, white: Player = None, black: Player = None
+    ) -> "ChessState":
+        """
+        Returns a new state with the position described by a string in the
+        Forsyth-Edwards Notation. The halfmove clock and the fullmove number
+        are optional and ignored. Raises an exception if the string isn't
+        a valid FEN string.
+
+
+        Parameters:
+
+        fen : str
+            a string describing the position (eg. the initial position is
+            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+
+        white : Player
+            a Player object which represents the player playing white pieces.
+            A new player is created if it isn't given
+
+        black : Player
+            a Player object which represents the player playing black pieces.
+            A new player is created if it isn't given
+        """
+        white = white or Player(FEN_WHITE_CHAR)
+        black = black or Player(FEN_BLACK_CHAR)
+        fields = fen.split()
+        if len(fields) not in range(4, 7) or fields[1] not in ("w", "b"):
+            raise InvalidFENException
+        placement, colour, castling_field, en_passant_field = fields[:4]
+
+        bitboards = [0 for _ in range(12)]
+        rows = placement.split("/")
+        if len(rows) != 8:
+            raise InvalidFENException
+        for row, row_field in zip(range(7, -1, -1), rows):
+            column = 0
+            for char in row_field:
+                if char in "12345678":
+                    column += int(char)
+                elif char.lower() in FEN_PIECE_CHARS and column < 8:
+                    piece_colour = (
+                        BLACK_INDEX if char.islower() else WHITE_INDEX
+                    )
+                    bitboards[
+                        6 * piece_colour + FEN_PIECE_CHARS.index(char.lower())
+                    ] |= 1 << square_index(column, row)
+                    column += 1
+                else:
+                    raise InvalidFENException
+            if column != 8:
+                raise InvalidFENException
+
+        castling = 0
+        if castling_field != "-":
+            for char in castling_field:
+                if char not in FEN_CASTLING_CHARS:
+                    raise InvalidFENException
+                castling |= 1 << FEN_CASTLING_CHARS.index(char)
+
+        en_passant = None
+        if en_passant_field != "-":
+            if (
+                len(en_passant_field) != 2
+                or en_passant_field[0] not in "abcdefgh"
+                or en_passant_field[1] != ("6" if colour == "w" else "3")
+            ):
+                raise InvalidFENException
+            en_passant = square_index(
+                ord(en_passant_field[0]) - ord("a"),
+                int(en_passant_field[1]) - 1,
+            )
+            # the pawn that has just moved by two squares stands behind the
+            # en passant square, which it has passed over
+            if colour == "w":
+                pawns, pawn_square = bitboards[6 + PAWN], en_passant - 8
+            else:
+                pawns, pawn_square = bitboards[PAWN], en_passant + 8
+            occupied = 0
+            for bitboard in bitboards:
+                occupied |= bitboard
+            if not pawns >> pawn_square & 1 or occupied >> en_passant & 1:
+                raise InvalidFENException
+
+        if colour == "w":
+            current_player, other_player = white, black
+        else:
+            current_player, other_player = black, white
+        return cls._from_position(
+            current_player,
+            other_player,
+            white,
+            bitboards,
+            castling,
+            en_passant,
+        )
+
+    def to_fen(self) -> str:
+        """
+        Returns a string describing the position in the Forsyth-Edwards
+        Notation. The halfmove clock and the fullmove number aren't kept by
+        the state, so they are always 0 and 1.
+        """
+        rows = []
+        for row in range(7, -1, -1):
+            row_field = ""
+            empty = 0
+            for column in range(8):
+                square = square_index(column, row)
+                char = None
+                for index, bitboard in enumerate(self._bitboards):
+                    if bitboard >> square & 1:
+                        char = FEN_PIECE_CHARS[index % 6]
+                        if index < 6:
+                            char = char.upper()
+                        break
+                if char is None:
+                    empty += 1
+                    continue
+                if empty:
+                    row_field += str(empty)
+                    empty = 0
+                row_field += char
+            if empty:
+                row_field += str(empty)
+            rows.append(row_field)
+
+        castling_field = "".join(
+            char
+            for index, char in enumerate(FEN_CASTLING_CHARS)
+            if self._castling >> index & 1
+        )
+        en_passant_field = "-"
+        if self._en_passant is not None:
+            en_passant_field = chr(
+                square_column(self._en_passant) + ord("a")
+            ) + str(square_row(self._en_passant) + 1)
+        return " ".join(
+            (
+                "/".join(rows),
+                "w" if self._colour == WHITE_INDEX else "b",
+                castling_field or "-",
+                en_passant_field,
+                "0",
+                "1",
+            )
+        )
+
+    @property
+    def _board(self) -> Tuple[Tuple[ChessPiece]]:
+        """
+        Returns a tuple of eight tuples (rows) of ChessPiece objects
+        representing the chess board (empty fields are represented by the
+        None values). The board is built from the bitboards the first time
+        it is needed.
+        """
+        if self._board_view is None:
+            self._board_view = self._build_board()
+            self._board_source = None
+        return self._board_view
+
+    def _build_board(self) -> Tuple[Tuple[ChessPiece]]:
+        """
+        Returns a tuple of eight tuples (rows) of ChessPiece objects
+        representing the position described by the bitboards. If the board
+        view of the previous state is known (see the _board_source
+        attribute), only the rows changed by the move are built and the rest
+        of them is shared with the previous board view.
+        """
+        previous_rows, changed = None, FULL_BOARD
+        if self._board_source is not None:
+            previous_rows, changed = self._board_source
+        rows = {
+            row: [None for _ in range(8)]
+            for row in range(8)
+            if changed & RANK_MASKS[row]
+        }
+        rows_mask = 0
+        for row in rows:
+            rows_mask |= RANK_MASKS[row]
+
+        black = (
+            self._other_player
+            if self._current_player == self._white
+            else self._current_player
+        )
+        en_passantable_pawn = None
+        if self._en_passant is not None:
+            en_passantable_pawn = self._en_passant + (
+                -8 if self._colour == WHITE_INDEX else 8
+            )
+
+        for colour, player in (
+            (WHITE_INDEX, self._white),
+            (BLACK_INDEX, black),
+        ):
+            kingside, queenside = King.CASTLING_RIGHTS[colour]
+            for piece_type in PIECE_TYPES:
+                bitboard = self._bitboards[6 * colour + piece_type.KIND]
+                for square in iterate_squares(bitboard & rows_mask):
+                    column, row = square_column(square), square_row(square)
+                    first_move_or_can_castle = False
+                    if piece_type == Pawn:
+                        first_move_or_can_castle = row == (
+                            1 if colour == WHITE_INDEX else 6
+                        )
+                    elif piece_type == King:
+                        first_move_or_can_castle = bool(
+                            self._castling & (kingside | queenside)
+                        )
+                    elif piece_type == Rook:
+                        first_move_or_can_castle = bool(
+                            self._castling
+                            & {
+                                0: WHITE_QUEENSIDE,
+                                7: WHITE_KINGSIDE,
+                                56: BLACK_QUEENSIDE,
+                                63: BLACK_KINGSIDE,
+                            }.get(square, 0)
+                        )
+                    rows[row][column] = self._make_piece(
+                        piece_type,
+                        column,
+                        row,
+                        player,
+                        first_move_or_can_castle,
+                        square == en_passantable_pawn,
+                    )
+        return tuple(
+            tuple(rows[row]) if row in rows else previous_rows[row]
+            for row in range(8)
+        )
+
+    def _get_changed_squares(
+        self, bitboards: List[int], castling: int
+    ) -> int:
+        """
+        Returns a bitboard of the squares whose pieces in the board view
+        differ between this state and the state with a given position that
+        follows it: the squares changed by the move, the square of the pawn
+        that could have been taken en passant and, if the castling rights
+        have changed, the first and the last rank.
+
+
+        Parameters:
+
+        bitboards : List[int]
+            a list of twelve bitboards describing the position after the move
+
+        castling : int
+            an int representing the castling rights after the move
+        """
+        changed = 0
+        for old, new in zip(self._bitboards, bitboards):
+            changed |= old ^ new
+        if self._en_passant is not None:
+            changed |= 1 << (
+                self._en_passant + (-8 if self._colour == WHITE_INDEX else 8)
+            )
+        if castling != self._castling:
+            changed |= RANK_MASKS[0] | RANK_MASKS[7]
+        return changed
+
+    def _get_colour(self, player: Player) -> int:
+        """
+        Returns WHITE_INDEX if a given player plays white and BLACK_INDEX
+        otherwise.
+
+
+        Parameters:
+
+        player : Player
+            a Player object representing one of the players
+        """
+        return WHITE_INDEX if player == self._white else BLACK_INDEX
+
+    def _get_piece_type_at(self, square: int, colour: int) -> Optional[int]:
+        """
+        Returns the type (PAWN, KNIGHT, etc.) of the piece of a given colour
+        that resides on a given square or None if there is no such piece.
+
+
+        Parameters:
+
+        square : int
+            an int representing the index of a square
+
+        colour : int
+            an int representing the colour of the piece
+        """
+        if not self._occupancy[colour] >> square & 1:
+            return None
+        offset = 6 * colour
+        for piece_type in range(6):
+            if self._bitboards[offset + piece_type] >> square & 1:
+                return piece_type
+
+    def _get_moves_from_targets(
+        self, square: int, targets: int
+    ) -> List[ChessMove]:
+        """
+        Returns a list of moves from a given square onto each of the squares
+        of a given bitboard.
+
+
+        Parameters:
+
+        square : int
+            an int representing the index of a square the moves originate from
+
+        targets : int
+            a bitboard representing the destination squares of the moves
+        """
+        return [
+            MOVE_TABLE[square | target << END_SQUARE_SHIFT]
+            for target in iterate_squares(targets)
+        ]
+
+    def _iterate_moves_from_targets(
+        self, square: int, targets: int
+    ) -> Iterator[ChessMove]:
+        """
+        Yields the moves from a given square onto each of the squares of
+        a given bitboard (a generator variant of the _get_moves_from_targets
+        method).
+
+
+        Parameters:
+
+        square : int
+            an int representing the index of a square the moves originate from
+
+        targets : int
+            a bitboard representing the destination squares of the moves
+        """
+        for target in iterate_squares(targets):
+            yield MOVE_TABLE[square | target << END_SQUARE_SHIFT]
+
+    def get_moves(self) -> Iterable[ChessMove]:
+        """
+        Returns a list of moves generated by _get_targets method of each of
+        the ChessPiece classes for each of the pieces belonging to the current
+        player.
+        """
+        result = []
+        colour = self._colour
+        for piece_type in PIECE_TYPES:
+            bitboard = self._bitboards[6 * colour + piece_type.KIND]
+            for square in iterate_squares(bitboard):
+                result += self._get_moves_from_targets(
+                    square, piece_type._get_targets(self, square, colour)
+                )
         return result
 
     def get_current_player(self) -> Player:
@@ -132,14 +830,9 @@ class ChessState(State):
 
     def _get_current_players_king(self) -> King:
         """Returns a King object representing current players king."""
-        for row in self._board:
-            for square in row:
-                if (
-                    square is not None
-                    and type(square) == King
-                    and square.player() == self._current_player
-                ):
-                    return square
+        square = self._king_squares[self._colour]
+        if square is not None:
+            return self._board[square_row(square)][square_column(square)]
 
     def _make_piece(
         self,
@@ -153,8 +846,10 @@ class ChessState(State):
         """
         Returns an object of one of the child classes of the ChessPiece class.
         This method is meant to serve as a unified 'constructor' for each of
-        the aforementioned classes. Raises an exception if a wrong piece type
-        is given.
+        the aforementioned classes. A piece with the same parameters that
+        has already been created for this state or any of the states it
+        comes from is returned instead of a new one. Raises an exception if
+        a wrong piece type is given.
 
 
         Parameters:
@@ -181,8 +876,20 @@ class ChessState(State):
         is_en_passantable : bool
             a bool that determines if a pawn can be taken en passant
         """
+        key = (
+            piece_type,
+            column,
+            row,
+            player,
+            first_move_or_can_castle,
+            is_en_passantable,
+        )
+        piece = self._pieces.get(key)
+        if piece is not None:
+            return piece
+
         if piece_type == Pawn:
-            return Pawn(
+            piece = Pawn(
                 column,
                 row,
                 player,
@@ -190,255 +897,918 @@ class ChessState(State):
                 is_en_passantable,
             )
         elif piece_type in (Rook, King):
-            return piece_type(
+            piece = piece_type(
                 column,
                 row,
                 player,
                 first_move_or_can_castle,
             )
         elif piece_type in (Knight, Bishop, Queen):
-            return piece_type(
+            piece = piece_type(
                 column,
                 row,
                 player,
             )
         else:
             raise IncorrectPieceTypeException
+        # if another thread has created the same piece in the meantime, its
+        # piece is used, so that every state shares a single object
+        return self._pieces.setdefault(key, piece)
 
-    def _piece_shift(
-        self,
-        move: ChessMove,
-        moved_piece: ChessPiece,
-        first_move_or_can_castle=False,
-        is_en_passantable=False,
-    ) -> List[List[ChessPiece]]:
+    def _get_attacked_squares(
+        self, colour: int, occupied: Optional[int] = None
+    ) -> int:
         """
-        Returns a two dimensional list representing a chess board after making
-        a shift of a piece from one square to another. first_move_or_can_castle
-        and is_en_passantable optional arguments allow for passing additional
-        arguments when dealing with pieces that need them (Pawn, Rook, King).
+        Returns a bitboard of all the squares attacked by the pieces of
+        a given colour.
 
 
         Parameters:
 
-        move : ChessMove
-            a ChessMove object representing the move (shift) to be made
+        colour : int
+            an int representing the colour of the attacking pieces
 
-        moved_piece : ChessPiece
-            a ChessPiece object representing the piece being moved
+        occupied : int
+            a bitboard of the squares that block the lines of attack. Defaults
+            to all the occupied squares
+        """
+        if occupied is None:
+            occupied = self._occupied
+        bitboards = self._bitboards[6 * colour : 6 * colour + 6]
+        return (
+            shift_attacks(bitboards[PAWN], Pawn.CAPTURE_SHIFTS[colour])
+            | shift_attacks(bitboards[KNIGHT], Knight.SHIFTS)
+            | line_attacks(
+                bitboards[BISHOP] | bitboards[QUEEN],
+                occupied,
+                Bishop.DIRECTIONS,
+            )
+            | line_attacks(
+                bitboards[ROOK] | bitboards[QUEEN],
+                occupied,
+                Rook.DIRECTIONS,
+            )
+            | shift_attacks(bitboards[KING], King.SHIFTS)
+        )
 
-        first_move_or_can_castle : bool
-            a bool that determines if a pawn has the possibility of making
-            a move by two squares forward (as its first move) or if a king
-            or a rook can castle
+    def _get_attackers(self, square: int, colour: int, occupied: int) -> int:
+        """
+        Returns a bitboard of all the pieces of a given colour that attack
+        a given square.
 
-        is_en_passantable : bool
-            a bool that determines if a pawn can be taken en passant
+
+        Parameters:
+
+        square : int
+            an int representing the index of the attacked square
+
+        colour : int
+            an int representing the colour of the attacking pieces
+
+        occupied : int
+            a bitboard of the squares that block the lines of attack
         """
-        new_board = [[square for square in row] for row in self._board]
-        new_board[move.start_row()][move.start_column()] = None
-        new_board[move.end_row()][move.end_column()] = self._make_piece(
-            type(moved_piece),
-            move.end_column(),
-            move.end_row(),
-            moved_piece.player(),
-            first_move_or_can_castle,
-            is_en_passantable,
+        bitboards = self._bitboards
+        offset = 6 * colour
+        return (
+            Pawn.CAPTURE_TARGETS[1 - colour][square] & bitboards[offset + PAWN]
+            | Knight.TARGETS[square] & bitboards[offset + KNIGHT]
+            | ray_attacks(square, occupied, Bishop.RAYS)
+            & (bitboards[offset + BISHOP] | bitboards[offset + QUEEN])
+            | ray_attacks(square, occupied, Rook.RAYS)
+            & (bitboards[offset + ROOK] | bitboards[offset + QUEEN])
+            | King.TARGETS[square] & bitboards[offset + KING]
         )
-        return new_board
 
-    def _evaluate_pawn_scenarios(
-        self,
-        move: ChessMove,
-        moved_pawn: Pawn,
-        promotion_type: type = None,
-    ) -> List[List[ChessPiece]]:
+    def _get_pins(self, king_square: int) -> Dict[int, int]:
         """
-        A helper method used by the make_move function whenever a pawn move is
-        detected. Returns a two dimensional list representing a board after
-        making a move. This method is used for handling promotion and en
-        passant among regular moves and taking.
+        Returns a dictionary that maps the squares of the current players
+        pieces which are pinned to their king onto bitboards of the squares
+        these pieces can move to without leaving the line of the pin (the
+        squares between the king and the pinning piece and the square of the
+        pinning piece).
 
 
         Parameters:
 
-        move : ChessMove
-            a ChessMove object representing the move being made
+        king_square : int
+            an int representing the index of the current players king square
+        """
+        enemy_offset = 6 * (1 - self._colour)
+        own_pieces = self._occupancy[self._colour]
+        queens = self._bitboards[enemy_offset + QUEEN]
+        pins = {}
+        for rays, sliders in (
+            (Bishop.RAYS, self._bitboards[enemy_offset + BISHOP]),
+            (Rook.RAYS, self._bitboards[enemy_offset + ROOK]),
+        ):
+            sliders |= queens
+            if not sliders:
+                continue
+            for direction_rays in rays:
+                if not direction_rays[0][king_square] & sliders:
+                    continue
+                ray = ray_attacks(
+                    king_square, self._occupied, (direction_rays,)
+                )
+                blocker = ray & own_pieces
+                if not blocker:
+                    continue
+                ray = ray_attacks(
+                    king_square, self._occupied ^ blocker, (direction_rays,)
+                )
+                if ray & sliders:
+                    pins[blocker.bit_length() - 1] = ray
+        return pins
 
-        moved_pawn : Pawn
-            a Pawn object representing the pawn being moved
+    def _get_check_mask(self, king_square: int, checker: int) -> int:
+        """
+        Returns a bitboard of the squares onto which a piece other than the
+        king can move to stop a check given by a single piece (the square of
+        the checking piece and the squares between it and the king).
 
-        promotion_type : type
-            a type that represents the class of a piece to which the pawn will
-            promote
-        """
-        row_shift = move.end_row() - move.start_row()
-        column_shift = move.end_column() - move.start_column()
-
-        if self.is_promotion(move):
-            if promotion_type in (Knight, Bishop, Rook, Queen):
-                moved_pawn = self._make_piece(
-                    promotion_type,
-                    moved_pawn.column(),
-                    moved_pawn.row(),
-                    moved_pawn.player(),
-                    False,
-                )
-            else:
-                raise IncorrectPieceTypeException
 
-        # first move
-        if row_shift in (-2, 2):
-            new_board = self._piece_shift(
-                move,
-                moved_pawn,
-                False,
-                True,
-            )
+        Parameters:
 
-        # en passant and taking
-        elif column_shift in (-1, 1):
-            piece_next_to_the_pawn = self._board[moved_pawn.row()][
-                move.end_column()
-            ]
-            piece_pawn_end_position = self._board[move.end_row()][
-                move.end_column()
-            ]
-            if (
-                piece_next_to_the_pawn is not None
-                and type(piece_next_to_the_pawn) == Pawn
-                and piece_next_to_the_pawn.player() != moved_pawn.player()
-                and piece_next_to_the_pawn.is_en_passantable()
-            ):
-                new_board = self._piece_shift(
-                    move,
-                    moved_pawn,
+        king_square : int
+            an int representing the index of the current players king square
+
+        checker : int
+            a bitboard with a single square set representing the checking
+            piece
+        """
+        for direction_rays in Queen.RAYS:
+            if direction_rays[0][king_square] & checker:
+                return ray_attacks(
+                    king_square, self._occupied, (direction_rays,)
                 )
-                new_board[moved_pawn.row()][move.end_column()] = None
-            elif (
-                piece_pawn_end_position is not None
-                and piece_pawn_end_position.player() == self._other_player
-            ):
-                new_board = self._piece_shift(
-                    move,
-                    moved_pawn,
+        return checker
+
+    def _is_legal_en_passant(self, start: int, king_square: int) -> bool:
+        """
+        Returns True if taking en passant with a pawn from a given square
+        doesn't leave the current players king under check. Both the moving
+        and the taken pawn leave their squares, so this is checked
+        separately from the other moves.
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of the square of the moving pawn
+
+        king_square : int
+            an int representing the index of the current players king square
+        """
+        taken = 1 << (
+            self._en_passant + (-8 if self._colour == WHITE_INDEX else 8)
+        )
+        occupied = (self._occupied ^ (1 << start) ^ taken) | (
+            1 << self._en_passant
+        )
+        return not (
+            self._get_attackers(king_square, 1 - self._colour, occupied)
+            & ~taken
+        )
+
+    def _iterate_legal_targets(
+        self, captures_only: bool = False
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yields tuples containing the square of each of the current players
+        pieces and a bitboard of the squares the piece can legally move to,
+        starting with the king. Instead of making each of the moves and
+        checking if the king is left under check, the pieces checking the
+        king and the pieces pinned to it are found first and each piece only
+        generates the moves allowed by them.
+
+
+        Parameters:
+
+        captures_only : bool
+            a bool that determines if only the captures and the promotions
+            are generated (see the _get_capture_targets method of the
+            ChessPiece class)
+        """
+        colour = self._colour
+        enemy = 1 - colour
+        king_square = self._king_squares[colour]
+        if king_square is None:
+            for piece_type in PIECE_TYPES:
+                get_targets = (
+                    piece_type._get_capture_targets
+                    if captures_only
+                    else piece_type._get_targets
                 )
-            else:
-                raise InvalidMoveException
+                for square in iterate_squares(
+                    self._bitboards[6 * colour + piece_type.KIND]
+                ):
+                    yield square, get_targets(self, square, colour)
+            return
+        king = 1 << king_square
 
-        else:  # move forward by one square
-            new_board = self._piece_shift(
-                move,
-                moved_pawn,
+        checkers = self._get_attackers(king_square, enemy, self._occupied)
+        danger = self._get_attacked_squares(enemy, self._occupied ^ king)
+
+        if captures_only:
+            king_targets = King._get_capture_targets(self, king_square, colour)
+        else:
+            king_targets = King._get_targets(self, king_square, colour)
+        if king_square == (4 if colour == WHITE_INDEX else 60):
+            for castling_step in (-1, 1):
+                if king_targets >> (king_square + 2 * castling_step) & 1 and (
+                    checkers or danger >> (king_square + castling_step) & 1
+                ):
+                    king_targets ^= 1 << (king_square + 2 * castling_step)
+        yield king_square, king_targets & ~danger
+
+        if checkers & (checkers - 1):
+            return
+        yield from self._iterate_legal_piece_targets(
+            king_square, checkers, self._get_pins(king_square), captures_only
+        )
+
+    def _iterate_legal_piece_targets(
+        self,
+        king_square: int,
+        checkers: int,
+        pins: Dict[int, int],
+        captures_only: bool = False,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yields tuples containing the square of each of the current players
+        pieces other than the king and a bitboard of the squares the piece
+        can legally move to. Used when the king isn't checked by two pieces
+        at once (in which case only the king can move).
+
+
+        Parameters:
+
+        king_square : int
+            an int representing the index of the current players king square
+
+        checkers : int
+            a bitboard of the enemy pieces checking the king
+
+        pins : Dict[int, int]
+            a dictionary of the pinned pieces (as returned by the _get_pins
+            method)
+
+        captures_only : bool
+            a bool that determines if only the captures and the promotions
+            are generated
+        """
+        colour = self._colour
+        mask = FULL_BOARD
+        if checkers:
+            mask = self._get_check_mask(king_square, checkers)
+
+        for piece_type in PIECE_TYPES[:KING]:
+            bitboard = self._bitboards[6 * colour + piece_type.KIND]
+            get_targets = (
+                piece_type._get_capture_targets
+                if captures_only
+                else piece_type._get_targets
+            )
+            for square in iterate_squares(bitboard):
+                targets = get_targets(self, square, colour)
+                en_passant = False
+                if (
+                    piece_type == Pawn
+                    and self._en_passant is not None
+                    and targets >> self._en_passant & 1
+                ):
+                    targets ^= 1 << self._en_passant
+                    en_passant = self._is_legal_en_passant(square, king_square)
+                targets &= mask
+                if square in pins:
+                    targets &= pins[square]
+                if en_passant:
+                    targets |= 1 << self._en_passant
+                yield square, targets
+
+    def has_legal_move(self) -> bool:
+        """
+        Returns True if the current player has at least one legal move. Stops
+        at the first legal move found and tries the moves which are the most
+        likely to be legal first: the moves of the king (each checked on its
+        own instead of computing all the squares attacked by the enemy), then
+        the captures of the checking piece and then the moves of the other
+        pieces.
+        """
+        if self._legal_moves is not None:
+            return bool(self._legal_moves)
+        colour = self._colour
+        enemy = 1 - colour
+        king_square = self._king_squares[colour]
+        if king_square is None:
+            return any(targets for _, targets in self._iterate_legal_targets())
+
+        occupied = self._occupied ^ (1 << king_square)
+        for target in iterate_squares(
+            King.TARGETS[king_square] & ~self._occupancy[colour]
+        ):
+            if not self._is_attacked(target, enemy, occupied):
+                return True
+
+        checkers = self._get_attackers(king_square, enemy, self._occupied)
+        if checkers & (checkers - 1):
+            return False
+        pins = self._get_pins(king_square)
+        if checkers:
+            # a pinned piece can never take the checking piece, as it isn't
+            # on the line of the pin
+            pinned = sum(1 << square for square in pins)
+            defenders = self._get_attackers(
+                checkers.bit_length() - 1, colour, self._occupied
+            )
+            if defenders & ~pinned & ~(1 << king_square):
+                return True
+        return any(
+            targets
+            for _, targets in self._iterate_legal_piece_targets(
+                king_square, checkers, pins
             )
+        )
+
+    def get_legal_moves(self) -> Tuple[ChessMove]:
+        """
+        Returns a tuple of all the legal moves of the current player (see the
+        _iterate_legal_targets method). The moves are generated only once for
+        each position, the following calls return the same tuple.
+        """
+        if self._legal_moves is None:
+            result = []
+            for square, targets in self._iterate_legal_targets():
+                result += self._get_moves_from_targets(square, targets)
+            self._legal_moves = tuple(result)
+        return self._legal_moves
+
+    def iterate_legal_moves(self) -> Iterator[ChessMove]:
+        """
+        Yields the legal moves of the current player one by one, generating
+        the moves of each piece only when the moves of the previous one have
+        been used up. Starts with the moves of the king.
+        """
+        if self._legal_moves is not None:
+            yield from self._legal_moves
+            return
+        for square, targets in self._iterate_legal_targets():
+            yield from self._iterate_moves_from_targets(square, targets)
+
+    def get_legal_move_codes(self) -> array:
+        """
+        Returns an array of 16-bit ints encoding all the legal moves of the
+        current player (see the ChessMove.code method). Unlike in the case of
+        the get_legal_moves method, each pawn move that results in a promotion
+        is included four times, once for every type of piece the pawn can
+        promote to (encoded in the highest four bits).
+        """
+        return self._get_move_codes(self._iterate_legal_targets())
+
+    def get_capture_codes(self) -> array:
+        """
+        Returns an array of 16-bit ints encoding the legal captures and
+        promotions of the current player, in the same way as the
+        get_legal_move_codes method. The other moves aren't generated at all
+        (each piece only looks for the enemy pieces it can take).
+        """
+        return self._get_move_codes(self._iterate_legal_targets(True))
+
+    def get_captures(self) -> Tuple[ChessMove]:
+        """
+        Returns a tuple of the legal moves of the current player which take
+        an enemy piece or promote a pawn (see the get_capture_codes method).
+        """
+        result = []
+        for square, targets in self._iterate_legal_targets(True):
+            result += self._get_moves_from_targets(square, targets)
+        return tuple(result)
+
+    def _get_move_codes(
+        self, legal_targets: Iterable[Tuple[int, int]]
+    ) -> array:
+        """
+        Returns an array of 16-bit ints encoding the moves onto given
+        squares, with four codes for each of the promoting pawn moves (see
+        the get_legal_move_codes method).
+
+
+        Parameters:
+
+        legal_targets : Iterable[Tuple[int, int]]
+            tuples containing the square of a piece and a bitboard of the
+            squares it can move to (see the _iterate_legal_targets method)
+        """
+        result = array("H")
+        pawns = self._bitboards[6 * self._colour + PAWN]
+        for square, targets in legal_targets:
+            promoting = 0
+            if pawns >> square & 1:
+                promoting = targets & (RANK_MASKS[0] | RANK_MASKS[7])
+                targets ^= promoting
+            result.extend(
+                square | target << END_SQUARE_SHIFT
+                for target in iterate_squares(targets)
+            )
+            for target in iterate_squares(promoting):
+                code = square | target << END_SQUARE_SHIFT
+                result.extend(
+                    code | promotion_type << PROMOTION_SHIFT
+                    for promotion_type in (QUEEN, ROOK, BISHOP, KNIGHT)
+                )
+        return result
+
+    def _is_attacked(self, square: int, colour: int, occupied: int) -> bool:
+        """
+        Returns True if any of the pieces of a given colour attacks a given
+        square. The lines of attack are followed outward from the attacked
+        square, starting with the cheapest ones.
+
+
+        Parameters:
+
+        square : int
+            an int representing the index of the attacked square
 
-        return new_board
+        colour : int
+            an int representing the colour of the attacking pieces
+
+        occupied : int
+            a bitboard of the squares that block the lines of attack
+        """
+        bitboards = self._bitboards
+        offset = 6 * colour
+        return bool(
+            Knight.TARGETS[square] & bitboards[offset + KNIGHT]
+            or Pawn.CAPTURE_TARGETS[1 - colour][square]
+            & bitboards[offset + PAWN]
+            or King.TARGETS[square] & bitboards[offset + KING]
+            or ray_attacks(square, occupied, Rook.RAYS)
+            & (bitboards[offset + ROOK] | bitboards[offset + QUEEN])
+            or ray_attacks(square, occupied, Bishop.RAYS)
+            & (bitboards[offset + BISHOP] | bitboards[offset + QUEEN])
+        )
+
+    def is_square_attacked(self, square: int, by_player: Player) -> bool:
+        """
+        Returns True if any of the pieces of a given player attacks a given
+        square. If the attack map of the player has already been computed
+        it is used instead of looking for the attackers.
+
+
+        Parameters:
+
+        square : int
+            an int representing the index of the square (8 * row + column)
+
+        by_player : Player
+            a Player object representing the player whose pieces attack the
+            square
+        """
+        colour = self._get_colour(by_player)
+        attack_map = self._attack_maps[colour]
+        if attack_map is not None:
+            return bool(attack_map >> square & 1)
+        return self._is_attacked(square, colour, self._occupied)
+
+    def get_attack_map(self, player: Player) -> int:
+        """
+        Returns a bitboard of all the squares attacked by the pieces of
+        a given player. The bitboard is computed once for each of the players
+        and stored in the _attack_maps attribute.
+
+
+        Parameters:
+
+        player : Player
+            a Player object representing the player whose pieces attack the
+            squares
+        """
+        colour = self._get_colour(player)
+        if self._attack_maps[colour] is None:
+            self._attack_maps[colour] = self._get_attacked_squares(colour)
+        return self._attack_maps[colour]
 
     def _is_in_check(self) -> bool:
         """
-        Checks if current players king is under check by checking if an enemy
-        can PHYSICALLY move onto the square that the king occupies. Returns
+        Checks if current players king is under check by checking if any of
+        the enemy pieces attacks the square that the king occupies. Returns
         True if that's the case.
         """
-        state_switched_sides = ChessState(
-            self._other_player,
-            self._current_player,
-            self._white,
-            self._board,
+        king_square = self._king_squares[self._colour]
+        return king_square is not None and self.is_square_attacked(
+            king_square, self._other_player
         )
-        current_king = self._get_current_players_king()
-        current_king_pos = (current_king.column(), current_king.row())
-        state_switched_sides_end_positions = [
-            (move.end_column(), move.end_row())
-            for move in state_switched_sides.get_moves()
-        ]
-        if current_king_pos in state_switched_sides_end_positions:
+
+    def _is_safe_for_king(
+        self, start: int, end: int, moved_type: int
+    ) -> bool:
+        """
+        Returns True if moving the current players piece from one square to
+        another doesn't leave their king under check. Only the lines of
+        attack going through the king square (or the destination square of
+        the king) are followed, no moves are generated and the move isn't
+        made. The move itself has to be possible for the moving piece.
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of a square the move originates from
+
+        end : int
+            an int representing the index of the destination square
+
+        moved_type : int
+            an int representing the type of the moving piece
+        """
+        enemy = 1 - self._colour
+        if moved_type == KING:
+            if end - start in (-2, 2):
+                step = 1 if end > start else -1
+                return not any(
+                    self._is_attacked(square, enemy, self._occupied)
+                    for square in range(start, end + step, step)
+                )
+            return not self._is_attacked(
+                end, enemy, self._occupied ^ (1 << start)
+            )
+
+        king_square = self._king_squares[self._colour]
+        if king_square is None:
             return True
-        return False
+        if moved_type == PAWN and end == self._en_passant:
+            return self._is_legal_en_passant(start, king_square)
+        occupied = self._occupied ^ (1 << start) | (1 << end)
+        return not (
+            self._get_attackers(king_square, enemy, occupied) & ~(1 << end)
+        )
 
-    def _evaluate_castling_scenarios(
-        self,
-        move: ChessMove,
-        moved_piece: King,
-        board: List[List[ChessPiece]],
-    ) -> List[List[ChessPiece]]:
+    def is_legal(self, move: ChessMove) -> bool:
         """
-        A helper method used by the make_move function whenever a castling move
-        is detected. Returns a two dimensional list representing a board after
-        making a move. This method raises an error if the move cannot be made
-        due to the squares between the king and the rook being under attack.
+        Returns True if a move can be made by the current player. Only the
+        moving piece is looked at: the move has to be one of its possible
+        moves and mustn't leave the king under check (see the
+        _is_safe_for_king method), so the other moves aren't generated.
 
 
         Parameters:
 
         move : ChessMove
-            a ChessMove object representing the move being made
+            a ChessMove object representing the move to be checked
+        """
+        start = square_index(move.start_column(), move.start_row())
+        end = square_index(move.end_column(), move.end_row())
+        moved_type = self._get_piece_type_at(start, self._colour)
+        return bool(
+            moved_type is not None
+            and PIECE_TYPES[moved_type]._get_targets(self, start, self._colour)
+            >> end
+            & 1
+            and self._is_safe_for_king(start, end, moved_type)
+        )
 
-        moved_pawn : King
-            a King object representing the king being moved
-
-        board: List[List[ChessPiece]]
-            a two dimensional list representing the board after the initial
-            king move has been made (because the king part of castling move
-            is made in the make_move method there had to be a way to provide
-            an already modified board, with the king already moved, to the
-            function)
-        """
-        new_board = [[square for square in row] for row in board]
-
-        squares_enemy_can_attack = [
-            (enemy_move.end_column(), enemy_move.end_row())
-            for enemy_move in ChessState(
-                self._other_player,
-                self._current_player,
-                self._white,
-                self._board,
-            ).get_moves()
-        ]
+    def _shift_pieces(
+        self,
+        bitboards: List[int],
+        start: int,
+        end: int,
+        promotion_type: Optional[int] = None,
+    ) -> Tuple[int, int, Optional[int], Optional[int]]:
+        """
+        Moves the current players piece from one square to another on a given
+        list of bitboards (which has to describe the same position as this
+        state). Handles taking, en passant, promotion and the rook part of
+        castling. This method doesn't check the legality of the move in any
+        way. Returns a tuple containing the type of the moved piece, the type
+        of the piece placed on the destination square, the type of the taken
+        piece (None if no piece has been taken) and the new en passant square.
 
-        king_shift_dir = move.end_column() - move.start_column()
-        king_shift_dir = king_shift_dir // abs(king_shift_dir)
-        king_row = 0 if self._current_player == self._white else 7
 
-        squares_to_check = (
-            (column, king_row)
-            for column in range(
-                4, move.end_column() + king_shift_dir, king_shift_dir
-            )
-        )
+        Parameters:
 
-        if any(
-            square in squares_enemy_can_attack for square in squares_to_check
-        ):
+        bitboards : List[int]
+            a list of twelve bitboards that will be modified
 
-            raise InvalidMoveException
+        start : int
+            an int representing the index of a square the move originates from
 
-        else:
+        end : int
+            an int representing the index of the destination square
+
+        promotion_type : int
+            an int representing the type of a piece to which a pawn will
+            promote (only used for pawn promotion)
+        """
+        colour = self._colour
+        enemy = 1 - colour
+        offset = 6 * colour
+        enemy_offset = 6 * enemy
+        moved_type = placed_type = self._get_piece_type_at(start, colour)
+        taken_type = self._get_piece_type_at(end, enemy)
+        en_passant = None
+
+        bitboards[offset + moved_type] ^= 1 << start
+        if taken_type is not None:
+            bitboards[enemy_offset + taken_type] ^= 1 << end
+
+        if moved_type == PAWN:
+            if end == self._en_passant:
+                taken_type = PAWN
+                taken_square = end + (-8 if colour == WHITE_INDEX else 8)
+                bitboards[enemy_offset + PAWN] ^= 1 << taken_square
+            elif end - start in (-16, 16):
+                en_passant = (start + end) // 2
+            if promotion_type is not None and (1 << end) & (
+                RANK_MASKS[0] | RANK_MASKS[7]
+            ):
+                placed_type = promotion_type
 
-            new_board[king_row][4 + king_shift_dir] = self._make_piece(
-                Rook, 4 + king_shift_dir, king_row, self._current_player, False
+        elif moved_type == KING and end - start in (-2, 2):
+            bitboards[offset + ROOK] ^= self._get_castling_rook_shift(
+                start, end
             )
 
-            new_board[king_row][int(3.5 + 3.5 * king_shift_dir)] = None
+        bitboards[offset + placed_type] |= 1 << end
+
+        return moved_type, placed_type, taken_type, en_passant
 
-        return new_board
+    def _get_moved_king_squares(self, square: int) -> Tuple[int, int]:
+        """
+        Returns a tuple of the squares of both of the kings after the
+        current players king moves to a given square.
+
+
+        Parameters:
 
-    def _reset_en_passantable_pawns(self):
+        square : int
+            an int representing the index of the new square of the king
         """
-        Sets the is_en_passantable flag on each pawn of the current player that
-        made a move forward by two squares and had the flag on True to False.
+        if self._colour == WHITE_INDEX:
+            return square, self._king_squares[BLACK_INDEX]
+        return self._king_squares[WHITE_INDEX], square
+
+    @staticmethod
+    def _get_castling_rook_shift(start: int, end: int) -> int:
         """
-        row = 3 if self._current_player == self._white else 4
-        for piece in self._board[row]:
-            if (
-                piece is not None
-                and type(piece) == Pawn
-                and piece.player() == self._current_player
-                and piece.is_en_passantable()
+        Returns a bitboard with the starting and the final square of the rook
+        taking part in castling.
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of the square of the castling king
+
+        end : int
+            an int representing the index of the destination square of the
+            castling king
+        """
+        if end > start:
+            return (1 << (start + 3)) | (1 << (start + 1))
+        return (1 << (start - 4)) | (1 << (start - 1))
+
+    def _get_moved_hash(
+        self,
+        start: int,
+        end: int,
+        moved_type: int,
+        placed_type: int,
+        taken_type: Optional[int],
+        castling: int,
+        en_passant: Optional[int],
+    ) -> int:
+        """
+        Returns the Zobrist hash of the position that follows a move, computed
+        from the hash of this state and the changes made by the move (the
+        values returned by the _shift_pieces method).
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of a square the move originates from
+
+        end : int
+            an int representing the index of the destination square
+
+        moved_type : int
+            an int representing the type of the moved piece
+
+        placed_type : int
+            an int representing the type of the piece placed on the
+            destination square
+
+        taken_type : int
+            an int representing the type of the taken piece (None if no piece
+            has been taken)
+
+        castling : int
+            an int representing the castling rights after the move
+
+        en_passant : int
+            an int representing the en passant square after the move
+        """
+        offset = 6 * self._colour
+        key = (
+            self._hash
+            ^ PIECE_KEYS[offset + moved_type][start]
+            ^ PIECE_KEYS[offset + placed_type][end]
+            ^ BLACK_TO_MOVE_KEY
+        )
+        if taken_type is not None:
+            taken_square = end
+            if moved_type == PAWN and end == self._en_passant:
+                taken_square += -8 if self._colour == WHITE_INDEX else 8
+            key ^= PIECE_KEYS[6 * (1 - self._colour) + taken_type][
+                taken_square
+            ]
+        if moved_type == KING and end - start in (-2, 2):
+            rook_keys = PIECE_KEYS[offset + ROOK]
+            for square in iterate_squares(
+                self._get_castling_rook_shift(start, end)
             ):
-                self._board[row][piece.column()] = Pawn(
-                    piece.column(), row, self._current_player, False, False
-                )
+                key ^= rook_keys[square]
+        if castling != self._castling:
+            key ^= CASTLING_KEYS[self._castling] ^ CASTLING_KEYS[castling]
+        if self._en_passant is not None:
+            key ^= EN_PASSANT_KEYS[square_column(self._en_passant)]
+        if en_passant is not None:
+            key ^= EN_PASSANT_KEYS[square_column(en_passant)]
+        return key
+
+    def _get_moved_scores(
+        self,
+        start: int,
+        end: int,
+        moved_type: int,
+        placed_type: int,
+        taken_type: Optional[int],
+    ) -> Tuple[int, int, int]:
+        """
+        Returns the scores of the position that follows a move (see the
+        _scores attribute), computed from the scores of this state and the
+        pieces moved, taken and promoted by the move.
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of a square the move originates from
+
+        end : int
+            an int representing the index of the destination square
+
+        moved_type : int
+            an int representing the type of the moved piece
+
+        placed_type : int
+            an int representing the type of the piece placed on the
+            destination square
+
+        taken_type : int
+            an int representing the type of the taken piece (None if no piece
+            has been taken)
+        """
+        middlegame, endgame, phase = self._scores
+        moved = 6 * self._colour + moved_type
+        placed = 6 * self._colour + placed_type
+        middlegame += MIDDLEGAME_SCORES[placed][end]
+        middlegame -= MIDDLEGAME_SCORES[moved][start]
+        endgame += ENDGAME_SCORES[placed][end] - ENDGAME_SCORES[moved][start]
+        phase += PHASE_WEIGHTS[placed_type] - PHASE_WEIGHTS[moved_type]
+        if taken_type is not None:
+            taken = 6 * (1 - self._colour) + taken_type
+            taken_square = end
+            if moved_type == PAWN and end == self._en_passant:
+                taken_square += -8 if self._colour == WHITE_INDEX else 8
+            middlegame -= MIDDLEGAME_SCORES[taken][taken_square]
+            endgame -= ENDGAME_SCORES[taken][taken_square]
+            phase -= PHASE_WEIGHTS[taken_type]
+        if moved_type == KING and end - start in (-2, 2):
+            rook = 6 * self._colour + ROOK
+            rook_start, rook_end = start + 3, start + 1
+            if end < start:
+                rook_start, rook_end = start - 4, start - 1
+            middlegame += MIDDLEGAME_SCORES[rook][rook_end]
+            middlegame -= MIDDLEGAME_SCORES[rook][rook_start]
+            endgame += ENDGAME_SCORES[rook][rook_end]
+            endgame -= ENDGAME_SCORES[rook][rook_start]
+        return middlegame, endgame, phase
+
+    def evaluate(self) -> int:
+        """
+        Returns the score of the position in centipawns from the point of
+        view of the current player (positive if the current player is
+        ahead): the material and the placement of the pieces of both of the
+        players, blended between the middlegame and the endgame scores
+        according to the phase of the game. The scores are kept up to date
+        with each move, so nothing is computed here but the blend.
+        """
+        score = tapered_score(self._scores)
+        return score if self._colour == WHITE_INDEX else -score
+
+    def _make_successor(
+        self, start: int, end: int, promotion_type: Optional[int] = None
+    ) -> "ChessState":
+        """
+        Returns the state that follows moving the current players piece from
+        one square to another. This method doesn't check the legality of the
+        move in any way.
+
+
+        Parameters:
+
+        start : int
+            an int representing the index of a square the move originates from
+
+        end : int
+            an int representing the index of the destination square
+
+        promotion_type : int
+            an int representing the type of a piece to which a pawn will
+            promote (only used for pawn promotion)
+        """
+        bitboards = self._bitboards.copy()
+        moved_type, placed_type, taken_type, en_passant = self._shift_pieces(
+            bitboards, start, end, promotion_type
+        )
+        castling = (
+            self._castling
+            & CASTLING_RIGHTS_MASKS[start]
+            & CASTLING_RIGHTS_MASKS[end]
+        )
+        king_squares = self._king_squares
+        if moved_type == KING:
+            king_squares = self._get_moved_king_squares(end)
+        new_state = ChessState._from_position(
+            self._other_player,
+            self._current_player,
+            self._white,
+            bitboards,
+            castling,
+            en_passant,
+            self._get_moved_hash(
+                start,
+                end,
+                moved_type,
+                placed_type,
+                taken_type,
+                castling,
+                en_passant,
+            ),
+            self._pieces,
+            king_squares,
+            self._get_moved_scores(
+                start, end, moved_type, placed_type, taken_type
+            ),
+        )
+        if self._board_view is not None:
+            new_state._board_source = (
+                self._board_view,
+                self._get_changed_squares(bitboards, castling),
+            )
+        return new_state
+
+    def try_make_move(
+        self, move: ChessMove, promotion_type: type = None
+    ) -> Optional["ChessState"]:
+        """
+        Returns a new state after making a move or None if the move can't be
+        made (the move isn't legal or a pawn would promote to a wrong piece
+        type). Unlike the make_move method it never raises an exception, so
+        it is meant to be used wherever illegal moves are common.
+
+
+        Parameters:
+
+        move : ChessMove
+            a ChessMove object representing the move being made
+
+        promotion_type : type
+            a type that represents the class of a piece to which the pawn will
+            promote (only used for pawn promotion)
+        """
+        start = square_index(move.start_column(), move.start_row())
+        end = square_index(move.end_column(), move.end_row())
+        moved_type = self._get_piece_type_at(start, self._colour)
+        if moved_type is None or not (
+            PIECE_TYPES[moved_type]._get_targets(self, start, self._colour)
+            >> end
+            & 1
+        ):
+            return None
+
+        promotion_kind = None
+        if moved_type == PAWN and (1 << end) & (RANK_MASKS[0] | RANK_MASKS[7]):
+            if promotion_type not in (Knight, Bishop, Rook, Queen):
+                return None
+            promotion_kind = promotion_type.KIND
+
+        if not self._is_safe_for_king(start, end, moved_type):
+            return None
+        return self._make_successor(start, end, promotion_kind)
 
     def make_move(
         self, move: ChessMove, promotion_type: type = None
@@ -450,8 +1820,8 @@ class ChessState(State):
         a piece has been blocked, king is under check and the move can't be
         made, an en passant can't be made because the enemy pawn made the first
         move by two squares not right before the current players move and so
-        on). It also calls the _reset_en_passantable_pawns method to reset the
-        pawns that had the is_en_passantable flag set to True back to false.
+        on). The move is made by the try_make_move method, the reason why it
+        has failed is only looked for when an exception is to be raised.
 
 
         Parameters:
@@ -463,45 +1833,11 @@ class ChessState(State):
             a type that represents the class of a piece to which the pawn will
             promote (only used for pawn promotion)
         """
-        self._reset_en_passantable_pawns()
-
-        moved_piece = self._board[move.start_row()][move.start_column()]
-        valid_moves = self.get_moves()
-        if move not in valid_moves:
-            raise InvalidMoveException
-
-        if type(moved_piece) == Pawn:
-            new_board = self._evaluate_pawn_scenarios(
-                move, moved_piece, promotion_type
-            )
-
-        else:
-            new_board = self._piece_shift(
-                move,
-                moved_piece,
-            )
-
-        if type(moved_piece) == King and move in (
-            ChessMove(4, 0, 2, 0),
-            ChessMove(4, 0, 6, 0),
-            ChessMove(4, 7, 2, 7),
-            ChessMove(4, 7, 6, 7),
-        ):
-            new_board = self._evaluate_castling_scenarios(
-                move, moved_piece, new_board
-            )
-
-        new_state = ChessState(
-            self._other_player, self._current_player, self._white, new_board
-        )
-
-        new_state_current_player = ChessState(
-            self._current_player, self._other_player, self._white, new_board
-        )
-
-        if new_state_current_player._is_in_check():
+        new_state = self.try_make_move(move, promotion_type)
+        if new_state is None:
+            if self.is_legal(move) and self.is_promotion(move):
+                raise IncorrectPieceTypeException
             raise InvalidMoveException
-
         return new_state
 
     def is_promotion(self, move: ChessMove) -> bool:
@@ -514,42 +1850,72 @@ class ChessState(State):
         move : ChessMove
             a ChessMove object representing a move
         """
-        moved_piece = self._board[move.start_row()][move.start_column()]
+        start = square_index(move.start_column(), move.start_row())
         if (
-            moved_piece is not None
-            and type(moved_piece) == Pawn
-            and move.end_row()
-            == (7 if moved_piece.player() == self._white else 0)
+            self._bitboards[6 * WHITE_INDEX + PAWN] >> start & 1
+            and move.end_row() == 7
+        ) or (
+            self._bitboards[6 * BLACK_INDEX + PAWN] >> start & 1
+            and move.end_row() == 0
         ):
             return True
         return False
 
+    def get_status(self) -> GameStatus:
+        """
+        Returns a GameStatus value describing if the game is still going on
+        or if it has ended with a checkmate or a stalemate. The status is
+        determined only once for each position.
+        """
+        if self._status is None:
+            if self.has_legal_move():
+                self._status = GameStatus.ONGOING
+            elif self._is_in_check():
+                self._status = GameStatus.CHECKMATE
+            else:
+                self._status = GameStatus.STALEMATE
+        return self._status
+
     def is_finished(self) -> bool:
         """
         Returns True if the game has been finished (there are no more legal
         moves to be made).
         """
-        new_state = ChessState(
-            self._current_player, self._other_player, self._white, self._board
-        )
-        get_moves_list = new_state.get_moves()
-        for move in get_moves_list:
-            try:
-                new_state.make_move(move, Queen)
-                return False
-            except InvalidMoveException:
-                continue
-        return True
+        return self.get_status() != GameStatus.ONGOING
 
     def get_winner(self) -> Optional[Player]:
         """
         Returns a Player object that represents the winning player if one
         of the sides won the game or None if there was a draw.
         """
-        if self.is_finished() and self._is_in_check():
+        if self.get_status() == GameStatus.CHECKMATE:
             return self._other_player
         return None
 
+    def zobrist_key(self) -> int:
+        """Returns an int representing the 64-bit Zobrist hash of the
+        position."""
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if two states represent the same position (the same pieces
+        on the same squares, the same player to move, castling rights and en
+        passant square)."""
+        if not isinstance(other, ChessState):
+            return False
+        return (
+            self._hash == other._hash
+            and self._bitboards == other._bitboards
+            and self._current_player == other._current_player
+            and self._white == other._white
+            and self._castling == other._castling
+            and self._en_passant == other._en_passant
+        )
+
+    def __hash__(self) -> int:
+        """Returns the Zobrist hash of the position."""
+        return self._hash
+
     def draw(
         self,
         screen: pygame.Surface,
@@ -626,3 +1992,205 @@ class ChessState(State):
                 for row in reversed(self._board)
             ]
         )
+
+
+class MutableChessState(ChessState):
+    """
+    A class representing a state in a chess game that can be modified in
+    place. Moves are made with the push method and taken back with the pop
+    method, so that searching through the game tree doesn't require creating
+    a new state for every position. Only the changes made by each of the
+    moves are remembered.
+
+
+    Attributes:
+
+    _undo_stack : List[Tuple]
+        a list of tuples describing the moves made with the push method. Each
+        tuple contains the start and the end square of the move, the type of
+        the moved piece, the type of the piece placed on the end square, the
+        type of the taken piece and the castling rights, the en passant
+        square, the Zobrist hash and the scores from before the move
+    """
+
+    # a state that changes in place can't be used as a dictionary key, the
+    # zobrist_key method should be used instead
+    __hash__ = None
+
+    def _set_position(self, *args, **kwargs):
+        """
+        Sets all the attributes describing the position and clears the list
+        of the moves to be taken back. Takes the same parameters as the
+        _set_position method of the ChessState class, so that the
+        MutableChessState objects can be created in the same ways as the
+        ChessState objects.
+        """
+        super()._set_position(*args, **kwargs)
+        self._undo_stack = []
+
+    @classmethod
+    def from_state(cls, state: ChessState) -> "MutableChessState":
+        """
+        Returns a new MutableChessState object describing the same position
+        as a given state.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position to be copied
+        """
+        return cls._from_position(
+            state._current_player,
+            state._other_player,
+            state._white,
+            state._bitboards.copy(),
+            state._castling,
+            state._en_passant,
+            state._hash,
+            state._pieces,
+            state._king_squares,
+            state._scores,
+        )
+
+    def to_state(self) -> ChessState:
+        """Returns an immutable ChessState object describing the current
+        position."""
+        return ChessState._from_position(
+            self._current_player,
+            self._other_player,
+            self._white,
+            self._bitboards.copy(),
+            self._castling,
+            self._en_passant,
+            self._hash,
+            self._pieces,
+            self._king_squares,
+            self._scores,
+        )
+
+    def push(self, move: ChessMove, promotion_type: type = None):
+        """
+        Makes a move in place and remembers how to take it back. The move has
+        to be legal (eg. taken from the get_legal_moves method), as its
+        legality isn't checked.
+
+
+        Parameters:
+
+        move : ChessMove
+            a ChessMove object representing the move being made
+
+        promotion_type : type
+            a type that represents the class of a piece to which the pawn will
+            promote (only used for pawn promotion)
+        """
+        code = move.code()
+        if promotion_type is not None:
+            code |= promotion_type.KIND << PROMOTION_SHIFT
+        self.push_code(code)
+
+    def push_code(self, code: int):
+        """
+        Makes a move encoded as an int (eg. taken from the
+        get_legal_move_codes method) in place and remembers how to take it
+        back. The move has to be legal, as its legality isn't checked.
+
+
+        Parameters:
+
+        code : int
+            an int representing the encoded move (see the ChessMove.code
+            method)
+        """
+        start = code & 63
+        end = code >> END_SQUARE_SHIFT & 63
+        moved_type, placed_type, taken_type, en_passant = self._shift_pieces(
+            self._bitboards,
+            start,
+            end,
+            code >> PROMOTION_SHIFT or None,
+        )
+        self._undo_stack.append(
+            (
+                start,
+                end,
+                moved_type,
+                placed_type,
+                taken_type,
+                self._castling,
+                self._en_passant,
+                self._hash,
+                self._scores,
+            )
+        )
+        self._scores = self._get_moved_scores(
+            start, end, moved_type, placed_type, taken_type
+        )
+        castling = (
+            self._castling
+            & CASTLING_RIGHTS_MASKS[start]
+            & CASTLING_RIGHTS_MASKS[end]
+        )
+        self._hash = self._get_moved_hash(
+            start,
+            end,
+            moved_type,
+            placed_type,
+            taken_type,
+            castling,
+            en_passant,
+        )
+        self._castling = castling
+        self._en_passant = en_passant
+        if moved_type == KING:
+            self._king_squares = self._get_moved_king_squares(end)
+        self._current_player, self._other_player = (
+            self._other_player,
+            self._current_player,
+        )
+        self._colour = 1 - self._colour
+        self._update_occupancy()
+
+    def pop(self) -> ChessMove:
+        """Takes back the last move made with the push method and returns
+        it. Raises an exception if there are no moves to take back."""
+        if not self._undo_stack:
+            raise InvalidMoveException
+        (
+            start,
+            end,
+            moved_type,
+            placed_type,
+            taken_type,
+            castling,
+            en_passant,
+            self._hash,
+            self._scores,
+        ) = self._undo_stack.pop()
+        self._current_player, self._other_player = (
+            self._other_player,
+            self._current_player,
+        )
+        self._colour = 1 - self._colour
+        self._castling = castling
+        self._en_passant = en_passant
+
+        bitboards = self._bitboards
+        offset = 6 * self._colour
+        bitboards[offset + placed_type] ^= 1 << end
+        bitboards[offset + moved_type] |= 1 << start
+        if taken_type is not None:
+            taken_square = end
+            if moved_type == PAWN and end == en_passant:
+                taken_square += -8 if self._colour == WHITE_INDEX else 8
+            bitboards[6 * (1 - self._colour) + taken_type] |= 1 << taken_square
+        if moved_type == KING:
+            self._king_squares = self._get_moved_king_squares(start)
+            if end - start in (-2, 2):
+                bitboards[offset + ROOK] ^= self._get_castling_rook_shift(
+                    start, end
+                )
+        self._update_occupancy()
+
+        return MOVE_TABLE[start | end << END_SQUARE_SHIFT]
@@ -0,0 +1,448 @@
+from chess_game_interface.chess_state import ChessState
+from chess_game_interface.chess_bitboards import (
+    BLACK_INDEX,
+    KING,
+    PAWN,
+    QUEEN,
+    ROOK,
+    WHITE_INDEX,
+    count_squares,
+    iterate_squares,
+    ray_attacks,
+)
+from chess_game_interface.chess_pieces import (
+    DIAGONAL_RAYS,
+    KING_TARGETS,
+    PAWN_CAPTURE_TARGETS,
+    STRAIGHT_RAYS,
+)
+from chess_game_interface.two_player_games.two_player_games.player import (
+    Player,
+)
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+import argparse
+import mmap
+import os
+
+# The endgames covered by the tablebases: a king and a piece (of the
+# "strong" player) against a lone king, named after the piece. A table is
+# generated from the ones its positions can turn into by a promotion, so
+# they are listed in the order of generation.
+ENDGAMES = {"KQK": QUEEN, "KRK": ROOK, "KPK": PAWN}
+PROMOTION_ENDGAMES = {"KPK": ("KQK", "KRK")}
+
+# A table holds one byte for each placement of the pieces and each player
+# to move. The index of a position is built from the player to move (0 for
+# the strong player), the square of the strong king, the square of the
+# weak king and the square of the piece, with six bits for each square.
+# The positions in which the strong player is black are mirrored first, so
+# that the strong player is always white in the tables.
+TABLE_SIZE = 2 << 18
+
+# A byte of a table holds the number of plies to the checkmate plus one.
+# The strong player to move wins and the weak player to move loses. Drawn
+# and impossible positions are stored as DRAW.
+DRAW = 0
+
+TABLE_EXTENSION = ".bin"
+
+_SLIDER_RAYS = {
+    QUEEN: STRAIGHT_RAYS + DIAGONAL_RAYS,
+    ROOK: STRAIGHT_RAYS,
+}
+
+
+def table_index(
+    side: int, strong_king: int, weak_king: int, piece: int
+) -> int:
+    """
+    Returns the index of a position in a table.
+
+
+    Parameters:
+
+    side : int
+        an int representing the player to move (0 for the strong player and
+        1 for the weak one)
+
+    strong_king : int
+        an int representing the index of the square of the strong king
+
+    weak_king : int
+        an int representing the index of the square of the weak king
+
+    piece : int
+        an int representing the index of the square of the piece
+    """
+    return side << 18 | strong_king << 12 | weak_king << 6 | piece
+
+
+def _build_attacks(piece_type: int) -> List[List[int]]:
+    """
+    Returns a list of lists of bitboards of the squares attacked by a white
+    piece of a given type standing on a given square (the first index) when
+    the strong king stands on a given square (the second index). The weak
+    king doesn't block the attacks, so that it can't step back along the
+    line of a check.
+
+
+    Parameters:
+
+    piece_type : int
+        an int representing the type of the piece
+    """
+    if piece_type == PAWN:
+        return [
+            [PAWN_CAPTURE_TARGETS[WHITE_INDEX][piece]] * 64
+            for piece in range(64)
+        ]
+    rays = _SLIDER_RAYS[piece_type]
+    return [
+        [ray_attacks(piece, 1 << king, rays) for king in range(64)]
+        for piece in range(64)
+    ]
+
+
+def _get_piece_sources(
+    piece_type: int, piece: int, occupied: int
+) -> List[int]:
+    """
+    Returns a list of the squares from which a white piece of a given type
+    could have moved to a given square (without capturing or promoting).
+
+
+    Parameters:
+
+    piece_type : int
+        an int representing the type of the piece
+
+    piece : int
+        an int representing the index of the square of the piece
+
+    occupied : int
+        an int representing the set of the squares of the kings
+    """
+    if piece_type != PAWN:
+        sources = ray_attacks(piece, occupied, _SLIDER_RAYS[piece_type])
+        return list(iterate_squares(sources & ~occupied))
+    sources = []
+    if piece >= 16 and not occupied >> (piece - 8) & 1:
+        sources.append(piece - 8)
+        if 24 <= piece < 32 and not occupied >> (piece - 16) & 1:
+            sources.append(piece - 16)
+    return sources
+
+
+def generate_table(
+    name: str, promotion_tables: Optional[Dict[str, bytearray]] = None
+) -> bytearray:
+    """
+    Returns a bytearray representing the table of an endgame (see the
+    comments above the TABLE_SIZE and the DRAW constants), generated by
+    retrograde analysis: starting from the checkmates (and, for the pawn,
+    from the won promotions), the positions a given number of plies from
+    the mate are found by taking back moves from the positions one ply
+    closer to it. A position of the strong player is won as soon as one of
+    its moves leads to a won position, a position of the weak player only
+    once all of its moves do, so the moves of the weak player are counted
+    and crossed off.
+
+
+    Parameters:
+
+    name : str
+        a str representing the name of the endgame (a key of ENDGAMES)
+
+    promotion_tables : Dict[str, bytearray]
+        a dictionary of the tables of the endgames the positions can turn
+        into by a promotion, indexed by their names (needed for the pawn)
+    """
+    piece_type = ENDGAMES[name]
+    attacks = _build_attacks(piece_type)
+    table = bytearray(TABLE_SIZE)
+    move_counts = bytearray(TABLE_SIZE)
+    # positions by the number of plies to the mate, a position can be put
+    # into more than one of the lists if a shorter mate is found later
+    levels: List[List[int]] = [[]]
+    weak_side = 1 << 18
+    pieces = range(8, 56) if piece_type == PAWN else range(64)
+
+    for strong_king in range(64):
+        for weak_king in range(64):
+            if weak_king == strong_king or (
+                KING_TARGETS[strong_king] >> weak_king & 1
+            ):
+                continue
+            king_moves = KING_TARGETS[weak_king] & ~(
+                KING_TARGETS[strong_king] | 1 << strong_king
+            )
+            for piece in pieces:
+                if piece == strong_king or piece == weak_king:
+                    continue
+                piece_attacks = attacks[piece][strong_king]
+                index = table_index(1, strong_king, weak_king, piece)
+                moves = king_moves & ~piece_attacks
+                if moves:
+                    move_counts[index] = count_squares(moves)
+                elif piece_attacks >> weak_king & 1:
+                    table[index] = 1
+                    levels[0].append(index)
+
+                if (
+                    name in PROMOTION_ENDGAMES
+                    and piece >= 48
+                    and not piece_attacks >> weak_king & 1
+                    and piece + 8 != strong_king
+                    and piece + 8 != weak_king
+                ):
+                    promoted_index = table_index(
+                        1, strong_king, weak_king, piece + 8
+                    )
+                    values = [
+                        promotion_tables[promoted][promoted_index]
+                        for promoted in PROMOTION_ENDGAMES[name]
+                    ]
+                    values = [value for value in values if value != DRAW]
+                    if values:
+                        value = min(values) + 1
+                        index ^= weak_side
+                        table[index] = value
+                        while len(levels) < value:
+                            levels.append([])
+                        levels[value - 1].append(index)
+
+    plies = 0
+    while any(levels[plies:]):
+        value = plies + 1
+        if len(levels) == value:
+            levels.append([])
+        next_level = levels[value]
+        for index in levels[plies]:
+            if table[index] != value:
+                continue
+            strong_king = index >> 12 & 63
+            weak_king = index >> 6 & 63
+            piece = index & 63
+            if index & weak_side:
+                # moves of the strong player leading to the position
+                kings = 1 << strong_king | 1 << weak_king
+                for source in iterate_squares(
+                    KING_TARGETS[strong_king]
+                    & ~KING_TARGETS[weak_king]
+                    & ~(kings | 1 << piece)
+                ):
+                    if attacks[piece][source] >> weak_king & 1:
+                        continue
+                    previous = table_index(0, source, weak_king, piece)
+                    if table[previous] == DRAW or table[previous] > value + 1:
+                        table[previous] = value + 1
+                        next_level.append(previous)
+                for source in _get_piece_sources(piece_type, piece, kings):
+                    if attacks[source][strong_king] >> weak_king & 1:
+                        continue
+                    previous = table_index(0, strong_king, weak_king, source)
+                    if table[previous] == DRAW or table[previous] > value + 1:
+                        table[previous] = value + 1
+                        next_level.append(previous)
+            else:
+                # moves of the weak player leading to the position
+                for source in iterate_squares(
+                    KING_TARGETS[weak_king]
+                    & ~KING_TARGETS[strong_king]
+                    & ~(1 << strong_king | 1 << piece)
+                ):
+                    previous = table_index(1, strong_king, source, piece)
+                    move_counts[previous] -= 1
+                    if not move_counts[previous]:
+                        table[previous] = value + 1
+                        next_level.append(previous)
+        plies += 1
+    return table
+
+
+def generate_tablebases(directory: str) -> Dict[str, int]:
+    """
+    Generates the tables of all the endgames and writes them into files
+    in a given directory. Returns a dictionary of the longest distances to
+    the mate (in plies) in the tables, indexed by the names of the endgames.
+
+
+    Parameters:
+
+    directory : str
+        a str representing the path to the directory
+    """
+    os.makedirs(directory, exist_ok=True)
+    tables = {}
+    longest = {}
+    for name in ENDGAMES:
+        tables[name] = generate_table(name, tables)
+        with open(os.path.join(directory, name + TABLE_EXTENSION), "wb") as f:
+            f.write(tables[name])
+        longest[name] = max(tables[name]) - 1
+    return longest
+
+
+class Tablebase:
+    """
+    A class representing the endgame tablebases of a directory. The table
+    files are memory-mapped, so probing a position is a single lookup that
+    reads one byte of a file and the pages are shared by all the processes
+    using the same files. The endgames whose files are missing aren't
+    covered.
+
+
+    Attributes:
+
+    _files : List[BinaryIO]
+        a list of the opened table files
+
+    _tables : Dict[int, mmap.mmap]
+        a dictionary of read-only memory maps of the table files, indexed
+        by the type of the piece of the strong player
+    """
+
+    def __init__(self, directory: str):
+        """
+        Tablebase class constructor.
+
+
+        Parameters:
+
+        directory : str
+            a str representing the path to the directory with the tables
+        """
+        self._files = []
+        self._tables = {}
+        for name, piece_type in ENDGAMES.items():
+            path = os.path.join(directory, name + TABLE_EXTENSION)
+            if not os.path.exists(path):
+                continue
+            table_file = open(path, "rb")
+            self._files.append(table_file)
+            self._tables[piece_type] = mmap.mmap(
+                table_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def close(self):
+        """Closes the table files. The tablebase can't be used
+        afterwards."""
+        for table in self._tables.values():
+            table.close()
+        for table_file in self._files:
+            table_file.close()
+
+    def probe(self, state: ChessState) -> Optional[Tuple[int, int]]:
+        """
+        Returns a tuple containing the result of a position from the point
+        of view of the current player (1 for a win, 0 for a draw and -1 for
+        a loss) and the number of plies to the checkmate (0 for a draw), or
+        None if the position isn't covered.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position
+        """
+        if count_squares(state._occupied) != 3:
+            return None
+        bitboards = state._bitboards
+        for colour in (WHITE_INDEX, BLACK_INDEX):
+            offset = 6 * colour
+            for piece_type in range(KING):
+                if bitboards[offset + piece_type]:
+                    break
+            else:
+                continue
+            break
+        table = self._tables.get(piece_type)
+        if table is None:
+            return None
+
+        # the position is mirrored if the strong player is black
+        mirror = 56 if colour == BLACK_INDEX else 0
+        strong_king = state._king_squares[colour] ^ mirror
+        weak_king = state._king_squares[1 - colour] ^ mirror
+        piece = (bitboards[offset + piece_type].bit_length() - 1) ^ mirror
+        side = 0 if state._colour == colour else 1
+        value = table[table_index(side, strong_king, weak_king, piece)]
+        if value == DRAW:
+            return 0, 0
+        return (1 if side == 0 else -1), value - 1
+
+    def probe_wdl(self, state: ChessState) -> Optional[int]:
+        """
+        Returns the result of a position with the best play from the point
+        of view of the current player: 1 for a win, 0 for a draw and -1 for
+        a loss, or None if the position isn't covered.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position
+        """
+        result = self.probe(state)
+        return None if result is None else result[0]
+
+    def probe_dtm(self, state: ChessState) -> Optional[int]:
+        """
+        Returns the number of plies to the checkmate with the best play of
+        both players (0 if the position is drawn or the current player is
+        already checkmated), or None if the position isn't covered.
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position
+        """
+        result = self.probe(state)
+        return None if result is None else result[1]
+
+    def get_winner(self, state: ChessState) -> Optional[Player]:
+        """
+        Returns a Player object that represents the player winning a covered
+        position with the best play or None if the position is drawn or
+        isn't covered (see the probe_wdl method).
+
+
+        Parameters:
+
+        state : ChessState
+            a ChessState object representing the position
+        """
+        result = self.probe_wdl(state)
+        if result == 1:
+            return state.get_current_player()
+        if result == -1:
+            return state._other_player
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generates the endgame tablebases "
+        + ", ".join(ENDGAMES)
+        + "."
+    )
+    parser.add_argument("directory", help="the directory for the tables")
+    arguments = parser.parse_args()
+
+    start_time = perf_counter()
+    longest = generate_tablebases(arguments.directory)
+    for name, plies in longest.items():
+        print(f"{name}: longest mate in {plies} plies")
+    print(f"time {perf_counter() - start_time:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+from typing import Optional, Tuple
+
+# types of the scores kept in the table: the exact score of a position,
+# a lower bound (the search has been cut off after a move that was too
+# good) or an upper bound (none of the moves reached alpha)
+EXACT_BOUND = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+# An entry takes two 64-bit ints: the check and the data. Bits 0-15 of the
+# data hold the code of the best move, bits 16-23 the depth, bits 24-25 the
+# type of the bound and bits 32-63 the score (shifted by SCORE_OFFSET to be
+# non-negative). An empty entry has all of its data bits cleared (no bound
+# type is 0). The check is the Zobrist hash of the position XOR-ed with the
+# data, so an entry whose two halves have been written by two different
+# processes at the same time doesn't match any position and no locks are
+# needed when the table is shared.
+DEPTH_SHIFT = 16
+BOUND_SHIFT = 24
+SCORE_SHIFT = 32
+SCORE_OFFSET = 1 << 31
+ENTRY_SIZE = 16
+
+DEFAULT_SIZE_MB = 16
+
+
+class TranspositionTable:
+    """
+    A class representing a fixed-size hash table of the results of searching
+    positions, indexed by the Zobrist hashes of the positions. All the
+    entries are allocated up front in a single buffer, so the table never
+    grows, and the buffer can be a block of shared memory used by many
+    processes at once. Each position can be stored in one of two entries
+    of a bucket: the first one is only replaced by a search that is at least
+    as deep as the stored one, the second one is always replaced.
+
+
+    Attributes:
+
+    _buffer : memoryview
+        a memoryview of the bytes of the buffer holding the entries
+
+    _entries : memoryview
+        a memoryview of the buffer as 64-bit ints, four for each bucket
+        (the check and the data of both of its entries, see the comment
+        above the DEPTH_SHIFT constant)
+
+    _mask : int
+        an int used to get the index of a bucket from a hash (the number of
+        buckets minus one, which is a power of two)
+
+    hits : int
+        an int representing the number of probes that have found a position
+
+    misses : int
+        an int representing the number of probes that haven't found
+        a position
+
+    stores : int
+        an int representing the number of stored results
+
+    overwrites : int
+        an int representing the number of stored results that have replaced
+        an entry of a different position
+    """
+
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB, buffer=None):
+        """
+        TranspositionTable class constructor.
+
+
+        Parameters:
+
+        size_mb : float
+            a float representing the greatest size of the table in megabytes.
+            The number of buckets is rounded down to a power of two
+
+        buffer : object
+            an object supporting the buffer protocol (eg. the buf attribute
+            of a multiprocessing.shared_memory.SharedMemory object) in which
+            the entries are kept. It has to be at least as big as the table
+            and it isn't cleared. A new buffer is allocated if it isn't given
+        """
+        size = table_size_in_bytes(size_mb)
+        if buffer is None:
+            buffer = bytearray(size)
+        self._buffer = memoryview(buffer)[:size]
+        self._entries = self._buffer.cast("Q")
+        self._mask = size // (2 * ENTRY_SIZE) - 1
+        self.reset_statistics()
+
+    def __len__(self) -> int:
+        """Returns the number of entries of the table (two per bucket)."""
+        return len(self._entries) // 2
+
+    def size_in_bytes(self) -> int:
+        """Returns the memory taken by the entries of the table."""
+        return len(self._buffer)
+
+    def clear(self):
+        """Removes all the entries and resets the statistics."""
+        self._buffer[:] = bytes(len(self._buffer))
+        self.reset_statistics()
+
+    def close(self):
+        """Releases the buffer of the table (which is needed before a block
+        of shared memory can be closed). The table can't be used
+        afterwards."""
+        self._entries.release()
+        self._buffer.release()
+
+    def reset_statistics(self):
+        """Sets all the counters of the table to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def hit_rate(self) -> float:
+        """Returns the fraction of the probes that have found a position
+        (0 if there haven't been any)."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def usage(self) -> float:
+        """Returns the fraction of the entries of the table that are
+        taken."""
+        taken = sum(1 for data in self._entries[1::2] if data)
+        return taken / len(self)
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Returns a tuple containing the depth, the score, the type of the
+        bound and the code of the best move stored for a position with
+        a given hash, or None if the position isn't in the table.
+
+
+        Parameters:
+
+        key : int
+            an int representing the Zobrist hash of the position
+        """
+        index = 4 * (key & self._mask)
+        entries = self._entries
+        data = entries[index + 1]
+        if not data or entries[index] ^ data != key:
+            data = entries[index + 3]
+            if not data or entries[index + 2] ^ data != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return (
+            data >> DEPTH_SHIFT & 0xFF,
+            (data >> SCORE_SHIFT) - SCORE_OFFSET,
+            data >> BOUND_SHIFT & 3,
+            data & 0xFFFF,
+        )
+
+    def store(
+        self, key: int, depth: int, score: int, bound: int, code: int = 0
+    ):
+        """
+        Stores the result of searching a position. It takes the place of the
+        depth-preferred entry of the bucket if the position is already there
+        or if the search is at least as deep as the one stored in it (the
+        replaced entry is then moved to the always-replaced one), and the
+        place of the always-replaced entry otherwise. If no move is given,
+        the move already stored for the position is kept.
+
+
+        Parameters:
+
+        key : int
+            an int representing the Zobrist hash of the position
+
+        depth : int
+            an int representing the depth of the search (0-255)
+
+        score : int
+            an int representing the score of the position
+
+        bound : int
+            an int representing the type of the score (EXACT_BOUND,
+            LOWER_BOUND or UPPER_BOUND)
+
+        code : int
+            an int representing the code of the best move (0 if there is none)
+        """
+        index = 4 * (key & self._mask)
+        entries = self._entries
+        old_data = entries[index + 1]
+        old_key = entries[index] ^ old_data
+        if old_data and old_key == key:
+            code = code or old_data & 0xFFFF
+        elif not old_data or depth >= old_data >> DEPTH_SHIFT & 0xFF:
+            if old_data:
+                # the replaced entry is moved to the always-replaced one
+                replaced_data = entries[index + 3]
+                if replaced_data and entries[index + 2] ^ replaced_data != key:
+                    self.overwrites += 1
+                entries[index + 2] = entries[index]
+                entries[index + 3] = old_data
+        else:
+            index += 2
+            old_data = entries[index + 1]
+            if old_data and entries[index] ^ old_data == key:
+                code = code or old_data & 0xFFFF
+            elif old_data:
+                self.overwrites += 1
+
+        self.stores += 1
+        data = (
+            code
+            | depth << DEPTH_SHIFT
+            | bound << BOUND_SHIFT
+            | (score + SCORE_OFFSET) << SCORE_SHIFT
+        )
+        entries[index] = key ^ data
+        entries[index + 1] = data
+
+
+def table_size_in_bytes(size_mb: float) -> int:
+    """
+    Returns the size in bytes of a table of a given greatest size in
+    megabytes (the number of buckets is rounded down to a power of two).
+
+
+    Parameters:
+
+    size_mb : float
+        a float representing the greatest size of the table in megabytes
+    """
+    buckets = max(1, int(size_mb * (1 << 20)) // (2 * ENTRY_SIZE))
+    return (1 << (buckets.bit_length() - 1)) * 2 * ENTRY_SIZE
@@ -0,0 +1,63 @@
+from random import Random
+from typing import List, Optional
+from chess_game_interface.chess_bitboards import (
+    BLACK_INDEX,
+    iterate_squares,
+    square_column,
+)
+
+# Zobrist keys are generated with a fixed seed so that the hashes of the
+# positions are the same in every process (and every run of the programme).
+_generator = Random(0x5A0B7157)
+
+PIECE_KEYS = [
+    [_generator.getrandbits(64) for _ in range(64)] for _ in range(12)
+]
+_CASTLING_RIGHT_KEYS = [_generator.getrandbits(64) for _ in range(4)]
+CASTLING_KEYS = [0 for _ in range(16)]
+for _rights in range(16):
+    for _right in range(4):
+        if _rights >> _right & 1:
+            CASTLING_KEYS[_rights] ^= _CASTLING_RIGHT_KEYS[_right]
+EN_PASSANT_KEYS = [_generator.getrandbits(64) for _ in range(8)]
+BLACK_TO_MOVE_KEY = _generator.getrandbits(64)
+
+
+def compute_hash(
+    bitboards: List[int],
+    colour: int,
+    castling: int,
+    en_passant: Optional[int],
+) -> int:
+    """
+    Returns the 64-bit Zobrist hash of a position. Used when a state is
+    created from scratch, the states following a move update the hash of
+    the previous one instead.
+
+
+    Parameters:
+
+    bitboards : List[int]
+        a list of twelve bitboards, one for each piece type of each colour
+
+    colour : int
+        an int representing the colour of the player whose move is now
+
+    castling : int
+        an int whose bits represent the castling rights of both of the
+        players
+
+    en_passant : int
+        an int representing the index of the en passant square or None if
+        there is no such square
+    """
+    key = CASTLING_KEYS[castling]
+    for index, bitboard in enumerate(bitboards):
+        piece_keys = PIECE_KEYS[index]
+        for square in iterate_squares(bitboard):
+            key ^= piece_keys[square]
+    if en_passant is not None:
+        key ^= EN_PASSANT_KEYS[square_column(en_passant)]
+    if colour == BLACK_INDEX:
+        key ^= BLACK_TO_MOVE_KEY
+    return key
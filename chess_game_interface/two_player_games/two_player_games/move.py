@@ -1,3 +1,3 @@
 class Move:
     """A base class for classes that represent moves in games"""
-    pass
+    __slots__ = ()
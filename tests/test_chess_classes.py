@@ -1,9 +1,23 @@
 from chess_game_interface.chess_exceptions import (
     CoordinatesOutOfBoundsException,
+    IncorrectPieceTypeException,
+    InvalidFENException,
     InvalidMoveException,
+    InvalidSearchLimitsException,
     WhitePlayerNotInTheGameException,
 )
-from chess_game_interface.chess_move import ChessMove
+from chess_game_interface.chess_bitboards import (
+    BLACK_QUEENSIDE,
+    PAWN,
+    QUEEN,
+    WHITE_KINGSIDE,
+    ray_attacks,
+)
+from chess_game_interface.chess_move import (
+    ChessMove,
+    MOVE_TABLE,
+    PROMOTION_SHIFT,
+)
 from chess_game_interface.chess_pieces import (
     Pawn,
     Knight,
@@ -11,8 +25,54 @@ from chess_game_interface.chess_pieces import (
     Rook,
     Queen,
     King,
+    PIECE_TYPES,
+)
+from chess_game_interface.chess_perft import (
+    PERFT_POSITIONS,
+    divide,
+    parallel_perft,
+    perft,
+)
+from chess_game_interface.chess_engine import (
+    MATE_SCORE,
+    ChessEngine,
+    SearchLimits,
+    best_move,
+    evaluate,
+    parallel_search,
+)
+from chess_game_interface.chess_move_ordering import (
+    MoveOrdering,
+    capture_score,
+    get_taken_type,
 )
-from chess_game_interface.chess_state import ChessState
+from chess_game_interface.chess_evaluation import compute_scores
+from chess_game_interface.chess_polyglot import (
+    ENTRY_STRUCT,
+    OpeningBook,
+    polyglot_key,
+)
+from chess_game_interface.chess_transposition import (
+    EXACT_BOUND,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    DEPTH_SHIFT,
+    TranspositionTable,
+    table_size_in_bytes,
+)
+from chess_game_interface.chess_state import (
+    ChessState,
+    GameStatus,
+    MutableChessState,
+)
+from chess_game_interface.chess_tablebase import (
+    TABLE_EXTENSION,
+    TABLE_SIZE,
+    Tablebase,
+    generate_table,
+)
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
 from typing import Iterable
 from chess_game_interface.two_player_games.two_player_games.player import (
     Player,
@@ -1709,3 +1769,1115 @@ def test_get_winner_draw():
     )
     chess_state = ChessState(player_1, player_2, player_1, board)
     assert chess_state.get_winner() is None
+
+
+def test_board_view_built_lazily():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    assert chess_state._board_view is None
+    king = chess_state._board[0][4]
+    assert type(king) == King
+    assert king.player() == player_1
+    assert king.can_castle()
+    assert chess_state._board_view is not None
+
+
+def test_make_move_en_passant_after_first_move():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    for move in (
+        ChessMove(4, 1, 4, 3),
+        ChessMove(0, 6, 0, 5),
+        ChessMove(4, 3, 4, 4),
+        ChessMove(3, 6, 3, 4),
+    ):
+        chess_state = chess_state.make_move(move)
+    assert chess_state._board[4][3].is_en_passantable()
+    new_state = chess_state.make_move(ChessMove(4, 4, 3, 5))
+    assert new_state._board[4][3] is None
+    assert type(new_state._board[5][3]) == Pawn
+
+
+def test_make_move_rook_move_loses_castling():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    board = (
+        [
+            [
+                Rook(0, 0, player_1),
+                None,
+                None,
+                None,
+                King(4, 0, player_1),
+                None,
+                None,
+                Rook(7, 0, player_1),
+            ]
+        ]
+        + [[None for _ in range(8)] for _ in range(6)]
+        + [
+            [
+                None,
+                None,
+                None,
+                None,
+                King(4, 7, player_2),
+                None,
+                None,
+                None,
+            ]
+        ]
+    )
+    state = ChessState(player_1, player_2, player_1, board)
+    state = state.make_move(ChessMove(7, 0, 7, 1))
+    state = state.make_move(ChessMove(4, 7, 4, 6))
+    state = state.make_move(ChessMove(7, 1, 7, 0))
+    state = state.make_move(ChessMove(4, 6, 4, 7))
+    assert not state._board[0][7].can_castle()
+    assert state._board[0][0].can_castle()
+    with raises(InvalidMoveException):
+        state.make_move(ChessMove(4, 0, 6, 0))
+    state.make_move(ChessMove(4, 0, 2, 0))
+
+
+def test_get_legal_moves_init_empty():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    assert compare_move_tables(
+        chess_state.get_legal_moves(), chess_state.get_moves()
+    )
+
+
+def test_get_legal_moves_pinned_piece():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    board = (
+        [
+            [
+                King(4, 0, player_1, False) if column == 4 else None
+                for column in range(8)
+            ]
+        ]
+        + [
+            [
+                Rook(4, 1, player_1, False) if column == 4 else None
+                for column in range(8)
+            ]
+        ]
+        + [[None for _ in range(8)] for _ in range(4)]
+        + [
+            [
+                Rook(4, 6, player_2, False) if column == 4 else None
+                for column in range(8)
+            ]
+        ]
+        + [
+            [
+                King(0, 7, player_2, False) if column == 0 else None
+                for column in range(8)
+            ]
+        ]
+    )
+    chess_state = ChessState(player_1, player_2, player_1, board)
+    expected_moves = [
+        ChessMove(4, 0, 3, 0),
+        ChessMove(4, 0, 5, 0),
+        ChessMove(4, 0, 3, 1),
+        ChessMove(4, 0, 5, 1),
+        ChessMove(4, 1, 4, 2),
+        ChessMove(4, 1, 4, 3),
+        ChessMove(4, 1, 4, 4),
+        ChessMove(4, 1, 4, 5),
+        ChessMove(4, 1, 4, 6),
+    ]
+    assert compare_move_tables(chess_state.get_legal_moves(), expected_moves)
+
+
+def test_get_legal_moves_double_check():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    board = (
+        [
+            [
+                King(4, 0, player_1, False) if column == 4 else None
+                for column in range(8)
+            ]
+        ]
+        + [[None, None, None, None, None, None, Knight(6, 1, player_1), None]]
+        + [[None, None, None, Knight(3, 2, player_2), None, None, None, None]]
+        + [[None for _ in range(8)] for _ in range(3)]
+        + [
+            [
+                Rook(4, 6, player_2, False) if column == 4 else None
+                for column in range(8)
+            ]
+        ]
+        + [
+            [
+                King(0, 7, player_2, False) if column == 0 else None
+                for column in range(8)
+            ]
+        ]
+    )
+    chess_state = ChessState(player_1, player_2, player_1, board)
+    expected_moves = [
+        ChessMove(4, 0, 3, 0),
+        ChessMove(4, 0, 5, 0),
+        ChessMove(4, 0, 3, 1),
+    ]
+    assert compare_move_tables(chess_state.get_legal_moves(), expected_moves)
+    assert not chess_state.is_finished()
+
+
+def test_get_legal_moves_en_passant_uncovers_check():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    board = (
+        [[None for _ in range(8)] for _ in range(4)]
+        + [
+            [
+                King(0, 4, player_1, False),
+                None,
+                None,
+                Pawn(3, 4, player_2, False, True),
+                Pawn(4, 4, player_1, False, False),
+                None,
+                None,
+                Rook(7, 4, player_2, False),
+            ]
+        ]
+        + [[None for _ in range(8)] for _ in range(2)]
+        + [
+            [
+                King(7, 7, player_2, False) if column == 7 else None
+                for column in range(8)
+            ]
+        ]
+    )
+    chess_state = ChessState(player_1, player_2, player_1, board)
+    assert ChessMove(4, 4, 3, 5) in chess_state.get_moves()
+    assert ChessMove(4, 4, 3, 5) not in chess_state.get_legal_moves()
+    assert ChessMove(4, 4, 4, 5) in chess_state.get_legal_moves()
+
+
+def test_is_square_attacked_init_empty():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    assert chess_state.is_square_attacked(8 * 2 + 0, player_1)
+    assert chess_state.is_square_attacked(8 * 2 + 5, player_1)
+    assert not chess_state.is_square_attacked(8 * 3 + 4, player_1)
+    assert chess_state.is_square_attacked(8 * 5 + 7, player_2)
+    assert not chess_state.is_square_attacked(8 * 2 + 0, player_2)
+
+
+def test_get_attack_map_matches_is_square_attacked():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    chess_state = chess_state.make_move(ChessMove(4, 1, 4, 3))
+    chess_state = chess_state.make_move(ChessMove(3, 6, 3, 4))
+    expected = [
+        [
+            chess_state.is_square_attacked(square, player)
+            for square in range(64)
+        ]
+        for player in (player_1, player_2)
+    ]
+    for player, player_expected in zip((player_1, player_2), expected):
+        attack_map = chess_state.get_attack_map(player)
+        assert [bool(attack_map >> square & 1) for square in range(64)] == (
+            player_expected
+        )
+        assert chess_state.get_attack_map(player) is attack_map
+
+
+def test_mutable_state_push_pop():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    mutable_state = MutableChessState.from_state(chess_state)
+    moves = [
+        ChessMove(4, 1, 4, 3),
+        ChessMove(3, 6, 3, 4),
+        ChessMove(4, 3, 3, 4),
+        ChessMove(3, 7, 3, 4),
+    ]
+    for move in moves:
+        chess_state = chess_state.make_move(move)
+        mutable_state.push(move)
+    assert str(mutable_state) == str(chess_state)
+    assert mutable_state.get_current_player() == player_1
+    for move in reversed(moves):
+        assert mutable_state.pop() == move
+    assert str(mutable_state) == str(ChessState(player_1, player_2))
+    with raises(InvalidMoveException):
+        mutable_state.pop()
+
+
+def test_mutable_state_pop_castling_and_promotion():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    board = (
+        [
+            [
+                None,
+                None,
+                None,
+                None,
+                King(4, 0, player_1),
+                None,
+                None,
+                Rook(7, 0, player_1),
+            ]
+        ]
+        + [[None for _ in range(8)] for _ in range(5)]
+        + [
+            [
+                Pawn(0, 6, player_1, False) if column == 0 else None
+                for column in range(8)
+            ]
+        ]
+        + [
+            [
+                None,
+                Knight(1, 7, player_2),
+                None,
+                None,
+                None,
+                None,
+                None,
+                King(7, 7, player_2, False),
+            ]
+        ]
+    )
+    mutable_state = MutableChessState(player_1, player_2, player_1, board)
+    initial = str(mutable_state)
+    mutable_state.push(ChessMove(4, 0, 6, 0))
+    assert type(mutable_state._board[0][5]) == Rook
+    mutable_state.push(ChessMove(7, 7, 6, 7))
+    mutable_state.push(ChessMove(0, 6, 1, 7), Queen)
+    assert type(mutable_state._board[7][1]) == Queen
+    mutable_state.pop()
+    mutable_state.pop()
+    mutable_state.pop()
+    assert str(mutable_state) == initial
+    assert mutable_state._board[0][4].can_castle()
+    assert type(mutable_state.make_move(ChessMove(4, 0, 6, 0))) == ChessState
+
+
+def test_chess_move_hash():
+    moves = {
+        ChessMove(4, 1, 4, 3),
+        ChessMove(4, 1, 4, 3),
+        ChessMove(6, 0, 5, 2),
+    }
+    assert len(moves) == 2
+    assert ChessMove(6, 0, 5, 2) in moves
+    assert hash(ChessMove(1, 2, 3, 4)) != hash(ChessMove(3, 4, 1, 2))
+
+
+def test_zobrist_key_transposition():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    initial_state = ChessState(player_1, player_2)
+    chess_state = initial_state
+    for move in (
+        ChessMove(6, 0, 5, 2),
+        ChessMove(6, 7, 5, 5),
+        ChessMove(5, 2, 6, 0),
+    ):
+        chess_state = chess_state.make_move(move)
+        assert chess_state.zobrist_key() != initial_state.zobrist_key()
+    chess_state = chess_state.make_move(ChessMove(5, 5, 6, 7))
+    assert chess_state.zobrist_key() == initial_state.zobrist_key()
+    assert chess_state == initial_state
+    assert len({chess_state, initial_state}) == 1
+
+
+def test_zobrist_key_matches_new_state():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    mutable_state = MutableChessState.from_state(chess_state)
+    for move in (
+        ChessMove(4, 1, 4, 3),
+        ChessMove(3, 6, 3, 4),
+        ChessMove(4, 3, 3, 4),
+        ChessMove(4, 6, 4, 4),
+    ):
+        chess_state = chess_state.make_move(move)
+        mutable_state.push(move)
+    rebuilt_state = ChessState(
+        player_1, player_2, player_1, chess_state._board
+    )
+    assert rebuilt_state.zobrist_key() == chess_state.zobrist_key()
+    assert mutable_state.zobrist_key() == chess_state.zobrist_key()
+    with raises(TypeError):
+        hash(mutable_state)
+
+
+def test_chess_move_code():
+    move = ChessMove(4, 1, 4, 3)
+    assert move.code() == 12 + (28 << 6)
+    assert ChessMove.from_code(move.code()) == move
+    assert ChessMove.from_code(move.code()) is MOVE_TABLE[move.code()]
+    assert not hasattr(move, "__dict__")
+
+
+def test_get_legal_move_codes_promotion():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    pawn = Pawn(3, 6, player_1, False)
+    king_w = King(0, 0, player_1, False)
+    king_b = King(7, 7, player_2, False)
+    board = (
+        [[king_w if column == 0 else None for column in range(8)]]
+        + [[None for _ in range(8)] for _ in range(5)]
+        + [[pawn if column == 3 else None for column in range(8)]]
+        + [[king_b if column == 7 else None for column in range(8)]]
+    )
+    chess_state = ChessState(player_1, player_2, player_1, board)
+    codes = chess_state.get_legal_move_codes()
+    assert codes.typecode == "H"
+    assert len(codes) == 3 + 4
+    promotion_codes = [code for code in codes if code >> 12]
+    assert sorted(code >> 12 for code in promotion_codes) == [
+        Knight.KIND,
+        Bishop.KIND,
+        Rook.KIND,
+        Queen.KIND,
+    ]
+    mutable_state = MutableChessState.from_state(chess_state)
+    mutable_state.push_code(ChessMove(3, 6, 3, 7).code() | Knight.KIND << 12)
+    assert type(mutable_state._board[7][3]) == Knight
+    assert mutable_state.pop() == ChessMove(3, 6, 3, 7)
+
+
+def test_piece_lookup_tables():
+    assert bin(Knight.TARGETS[0]).count("1") == 2
+    assert bin(Knight.TARGETS[27]).count("1") == 8
+    assert bin(King.TARGETS[63]).count("1") == 3
+    assert Pawn.CAPTURE_TARGETS[0][8] == 1 << 17
+    assert Pawn.CAPTURE_TARGETS[1][55] == (1 << 46)
+    assert bin(Rook.RAYS[0][0][0]).count("1") == 7
+    blocked = ray_attacks(0, 1 << 3 | 1 << 16, Rook.RAYS)
+    assert blocked == (1 << 1 | 1 << 2 | 1 << 3 | 1 << 8 | 1 << 16)
+
+
+def test_pieces_shared_between_states():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    new_state = chess_state.make_move(ChessMove(4, 1, 4, 3))
+    assert new_state._board[0][0] is chess_state._board[0][0]
+    assert new_state._board[7][4] is chess_state._board[7][4]
+    assert new_state._board[3][4] is not chess_state._board[1][4]
+    assert new_state._board[3][4].square() == 28
+    assert not hasattr(new_state._board[0][0], "__dict__")
+    assert not hasattr(new_state._board[1][0], "__dict__")
+
+
+def test_king_squares_tracked():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    assert chess_state._king_squares == (4, 60)
+    chess_state = chess_state.make_move(ChessMove(4, 1, 4, 3))
+    chess_state = chess_state.make_move(ChessMove(4, 6, 4, 4))
+    new_state = chess_state.make_move(ChessMove(4, 0, 4, 1))
+    assert new_state._king_squares == (12, 60)
+    assert chess_state._king_squares == (4, 60)
+    assert new_state._get_current_players_king().square() == 60
+    mutable_state = MutableChessState.from_state(chess_state)
+    mutable_state.push(ChessMove(4, 0, 4, 1))
+    mutable_state.push(ChessMove(4, 7, 4, 6))
+    assert mutable_state._king_squares == (12, 52)
+    mutable_state.pop()
+    mutable_state.pop()
+    assert mutable_state._king_squares == (4, 60)
+    assert chess_state._king_squares == (4, 60)
+
+
+def test_get_status_fools_mate():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    assert chess_state.get_status() == GameStatus.ONGOING
+    assert chess_state.get_legal_moves() is chess_state.get_legal_moves()
+    for move in (
+        ChessMove(5, 1, 5, 2),
+        ChessMove(4, 6, 4, 4),
+        ChessMove(6, 1, 6, 3),
+        ChessMove(3, 7, 7, 3),
+    ):
+        chess_state = chess_state.make_move(move)
+    assert chess_state.get_status() == GameStatus.CHECKMATE
+    assert chess_state.is_finished()
+    assert chess_state.get_winner() == player_2
+
+
+def test_get_status_stalemate_mutable_state():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    king_w = King(0, 0, player_1, False)
+    queen_b = Queen(3, 2, player_2)
+    king_b = King(7, 7, player_2, False)
+    board = (
+        [[king_w if column == 0 else None for column in range(8)]]
+        + [[None for _ in range(8)]]
+        + [[queen_b if column == 3 else None for column in range(8)]]
+        + [[None for _ in range(8)] for _ in range(4)]
+        + [[king_b if column == 7 else None for column in range(8)]]
+    )
+    chess_state = MutableChessState(player_2, player_1, player_1, board)
+    assert chess_state.get_status() == GameStatus.ONGOING
+    chess_state.push(ChessMove(3, 2, 2, 1))
+    assert chess_state.get_status() == GameStatus.STALEMATE
+    assert chess_state.get_legal_moves() == ()
+    assert chess_state.get_winner() is None
+    chess_state.pop()
+    assert chess_state.get_status() == GameStatus.ONGOING
+
+
+def test_fen_round_trip():
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b Kq e3 0 1"
+    chess_state = ChessState.from_fen(fen)
+    assert chess_state.to_fen() == fen
+    assert chess_state._castling == WHITE_KINGSIDE | BLACK_QUEENSIDE
+    assert chess_state._en_passant == 20
+    player_1 = Player("1")
+    player_2 = Player("2")
+    assert ChessState.from_fen(
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        player_1,
+        player_2,
+    ) == ChessState(player_1, player_2)
+
+
+def test_from_fen_invalid():
+    for fen in (
+        "",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e4 0 1",
+    ):
+        with raises(InvalidFENException):
+            ChessState.from_fen(fen)
+
+
+def test_from_fen_invalid_en_passant():
+    for fen in (
+        # no pawn has moved by two squares past the en passant square
+        "4k3/8/8/8/3p4/8/8/4K3 b - e3 0 1",
+        "4k3/3p4/8/8/8/8/8/4K3 w - e6 0 1",
+        # the en passant square doesn't match the player to move
+        "4k3/8/8/8/8/8/3P4/4K3 w - e3 0 1",
+        "4k3/8/8/4p3/3P4/8/8/4K3 b - e6 0 1",
+        # the en passant square is occupied
+        "4k3/8/4n3/3Pp3/8/8/8/4K3 w - e6 0 1",
+    ):
+        with raises(InvalidFENException):
+            ChessState.from_fen(fen)
+
+
+def test_from_fen_en_passant_capture():
+    chess_state = ChessState.from_fen("4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1")
+    chess_state = chess_state.make_move(ChessMove(3, 3, 4, 2))
+    assert chess_state.to_fen() == "4k3/8/8/8/8/4p3/8/4K3 w - - 0 1"
+    chess_state = ChessState.from_fen("4k3/8/8/3Pp3/8/8/8/4K3 w - e6 0 1")
+    chess_state = chess_state.make_move(ChessMove(3, 4, 4, 5))
+    assert chess_state.to_fen() == "4k3/8/4P3/8/8/8/8/4K3 b - - 0 1"
+
+
+def test_perft_positions():
+    for name, fen, expected_nodes in PERFT_POSITIONS:
+        chess_state = ChessState.from_fen(fen)
+        for depth, expected in enumerate(expected_nodes[:2], 1):
+            assert perft(chess_state, depth) == expected
+    assert perft(ChessState.from_fen(PERFT_POSITIONS[0][1]), 3) == 8902
+
+
+def test_divide():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[3][1])
+    moves = divide(chess_state, 2)
+    assert sum(moves.values()) == 264
+    assert set(moves) == {"c4c5", "d2d4", "f1f2", "f3d4", "b4c5", "g1h1"}
+    assert divide(chess_state, 1) == {move: 1 for move in moves}
+    assert chess_state.to_fen().startswith(PERFT_POSITIONS[3][1][:-4])
+
+
+def test_parallel_perft():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[1][1])
+    assert parallel_perft(chess_state, 2, 2) == 2039
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[2][1])
+    assert parallel_perft(chess_state, 3, 2) == 2812
+    assert parallel_perft(chess_state, 3, 1) == 2812
+
+
+def test_has_legal_move():
+    for fen, expected in (
+        (PERFT_POSITIONS[0][1], True),
+        (
+            "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3",
+            False,
+        ),
+        ("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", False),
+        ("7k/8/8/5Q2/8/8/8/6K1 b - - 0 1", True),
+        ("4k3/8/8/8/8/8/3PPP2/r2QKB2 w - - 0 1", True),
+        ("4k3/8/8/8/8/5n2/3PPPb1/3QKB2 w - - 0 1", True),
+    ):
+        chess_state = ChessState.from_fen(fen)
+        assert chess_state.has_legal_move() == expected
+        assert bool(chess_state.get_legal_moves()) == expected
+        assert chess_state.has_legal_move() == expected
+
+
+def test_iterate_legal_moves():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[1][1])
+    moves = chess_state.iterate_legal_moves()
+    first_move = next(moves)
+    assert first_move.start_column() == 4 and first_move.start_row() == 0
+    assert chess_state._legal_moves is None
+    assert compare_move_tables(
+        [first_move] + list(moves), chess_state.get_legal_moves()
+    )
+    assert list(chess_state.iterate_legal_moves()) == list(
+        chess_state.get_legal_moves()
+    )
+    pawn = chess_state._board[1][0]
+    assert list(pawn._iterate_moves(chess_state)) == pawn._get_moves(
+        chess_state
+    )
+
+
+def test_board_rows_shared_between_states():
+    player_1 = Player("1")
+    player_2 = Player("2")
+    chess_state = ChessState(player_1, player_2)
+    chess_state._board
+    new_state = chess_state.make_move(ChessMove(4, 1, 4, 3))
+    assert new_state._board_source is not None
+    assert new_state._board[0] is chess_state._board[0]
+    assert new_state._board[7] is chess_state._board[7]
+    assert new_state._board[1] is not chess_state._board[1]
+    assert new_state._board_source is None
+    assert new_state._board == new_state._build_board()
+    for move in (
+        ChessMove(3, 6, 3, 4),
+        ChessMove(4, 3, 4, 4),
+        ChessMove(5, 6, 5, 4),
+        ChessMove(4, 4, 5, 5),
+        ChessMove(6, 7, 5, 5),
+        ChessMove(6, 0, 5, 2),
+        ChessMove(5, 5, 7, 4),
+        ChessMove(5, 2, 7, 3),
+        ChessMove(7, 7, 6, 7),
+    ):
+        new_state._board
+        new_state = new_state.make_move(move)
+        board = new_state._board
+        new_state._board_view = None
+        assert board == new_state._board
+
+
+def test_state_shared_between_threads():
+    def analyse(chess_state):
+        return [
+            (
+                new_state.to_fen(),
+                new_state.zobrist_key(),
+                new_state.get_status(),
+                len(new_state.get_legal_moves()),
+                str(new_state),
+            )
+            for new_state in (
+                chess_state.make_move(move, Queen)
+                for move in chess_state.get_legal_moves()
+            )
+        ]
+
+    fen = PERFT_POSITIONS[1][1]
+    expected = analyse(ChessState.from_fen(fen))
+    chess_state = ChessState.from_fen(fen)
+    bitboards = chess_state._bitboards.copy()
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(analyse, [chess_state] * 32))
+    assert all(result == expected for result in results)
+    assert chess_state.to_fen() == fen
+    assert chess_state._bitboards == bitboards
+    assert chess_state.zobrist_key() == ChessState.from_fen(fen).zobrist_key()
+
+
+def test_is_legal():
+    for _, fen, _ in PERFT_POSITIONS:
+        chess_state = ChessState.from_fen(fen)
+        legal_moves = set(chess_state.get_legal_moves())
+        for move in MOVE_TABLE:
+            assert chess_state.is_legal(move) == (move in legal_moves)
+
+
+def test_make_move_pinned_piece():
+    chess_state = ChessState.from_fen("4k3/4r3/8/8/8/8/4N3/4K3 w - - 0 1")
+    assert not chess_state.is_legal(ChessMove(4, 1, 2, 2))
+    with raises(InvalidMoveException):
+        chess_state.make_move(ChessMove(4, 1, 2, 2))
+    assert chess_state.is_legal(ChessMove(4, 0, 3, 0))
+
+
+def test_try_make_move():
+    chess_state = ChessState.from_fen("4k3/4r1P1/8/8/8/8/4N3/4K3 w - - 0 1")
+    assert chess_state.try_make_move(ChessMove(4, 1, 2, 2)) is None
+    assert chess_state.try_make_move(ChessMove(0, 0, 0, 1)) is None
+    assert chess_state.try_make_move(ChessMove(6, 6, 6, 7)) is None
+    assert chess_state.try_make_move(ChessMove(6, 6, 6, 7), King) is None
+    with raises(IncorrectPieceTypeException):
+        chess_state.make_move(ChessMove(6, 6, 6, 7), King)
+    new_state = chess_state.try_make_move(ChessMove(6, 6, 6, 7), Knight)
+    assert new_state.to_fen() == "4k1N1/4r3/8/8/8/8/4N3/4K3 b - - 0 1"
+    assert new_state == chess_state.make_move(ChessMove(6, 6, 6, 7), Knight)
+
+
+def test_evaluate_material():
+    chess_state = ChessState.from_fen("4k3/8/8/8/8/8/8/R3K3 w - - 0 1")
+    assert evaluate(chess_state) > 500
+    chess_state = ChessState.from_fen("4k3/8/8/8/8/8/8/R3K3 b - - 0 1")
+    assert evaluate(chess_state) < -500
+    assert evaluate(ChessState.from_fen(PERFT_POSITIONS[0][1])) == 0
+    mirrored_state = ChessState.from_fen("r3k3/8/8/8/8/8/8/4K3 b - - 0 1")
+    assert evaluate(mirrored_state) == -evaluate(chess_state)
+
+
+def test_scores_updated_incrementally():
+    for _, fen, _ in PERFT_POSITIONS:
+        chess_state = ChessState.from_fen(fen)
+        mutable_state = MutableChessState.from_state(chess_state)
+        for code in chess_state.get_legal_move_codes():
+            move = MOVE_TABLE[code & 0xFFF]
+            promotion_type = None
+            if code >> PROMOTION_SHIFT:
+                promotion_type = PIECE_TYPES[code >> PROMOTION_SHIFT]
+            new_state = chess_state.make_move(move, promotion_type)
+            assert new_state._scores == compute_scores(new_state._bitboards)
+            mutable_state.push_code(code)
+            assert mutable_state._scores == new_state._scores
+            mutable_state.pop()
+        assert mutable_state._scores == chess_state._scores
+
+
+def test_best_move_mate_in_one():
+    chess_state = ChessState.from_fen("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    result = best_move(chess_state, SearchLimits(depth=3))
+    assert result.move() == ChessMove(0, 0, 0, 7)
+    assert result.score == MATE_SCORE - 1
+    assert result.promotion_type() is None
+
+
+def test_best_move_wins_material():
+    chess_state = ChessState.from_fen("4k3/8/8/3q4/8/8/3R4/3K4 w - - 0 1")
+    result = best_move(chess_state, SearchLimits(depth=2))
+    assert result.move() == ChessMove(3, 1, 3, 4)
+    assert result.depth == 2
+    assert result.score > 0
+
+
+def test_best_move_promotion():
+    chess_state = ChessState.from_fen("8/4P1k1/8/8/8/8/8/4K3 w - - 0 1")
+    result = best_move(chess_state, SearchLimits(depth=1))
+    assert result.move() == ChessMove(4, 6, 4, 7)
+    assert result.promotion_type() == Queen
+
+
+def test_best_move_principal_variation_is_legal():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[1][1])
+    result = best_move(chess_state, SearchLimits(depth=3))
+    assert len(result.codes) == 3
+    for code, move in zip(result.codes, result.principal_variation()):
+        assert chess_state.is_legal(move)
+        promotion_type = None
+        if code >> PROMOTION_SHIFT:
+            promotion_type = PIECE_TYPES[code >> PROMOTION_SHIFT]
+        chess_state = chess_state.make_move(move, promotion_type)
+
+
+def test_best_move_limits():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[0][1])
+    result = best_move(chess_state, SearchLimits(nodes=50))
+    assert result.nodes <= 50
+    assert result.move() in chess_state.get_legal_moves()
+    result = best_move(chess_state, SearchLimits(time=0.2))
+    assert result.time < 1
+    assert result.move() in chess_state.get_legal_moves()
+    result = best_move(ChessState.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1"))
+    assert result.move() is None
+    assert result.score == 0
+
+
+def test_best_move_depth_zero_and_unfinished_iteration():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[1][1])
+    result = best_move(chess_state, SearchLimits(depth=0))
+    assert (result.depth, result.nodes) == (0, 0)
+    assert result.score == evaluate(chess_state)
+    assert result.move() in chess_state.get_legal_moves()
+    # the first iteration is stopped, so its score isn't reported
+    result = best_move(chess_state, SearchLimits(nodes=5))
+    assert result.depth == 0
+    assert result.score == evaluate(chess_state)
+    assert result.move() in chess_state.get_legal_moves()
+    with raises(InvalidSearchLimitsException):
+        SearchLimits(depth=-1)
+    with raises(InvalidSearchLimitsException):
+        SearchLimits(time=-0.5)
+
+
+def test_transposition_table_size():
+    table = TranspositionTable(1)
+    assert table.size_in_bytes() == 1 << 20
+    assert len(table) == 1 << 16
+    assert len(TranspositionTable(0.75)) == 1 << 15
+    assert table.usage() == 0
+
+
+def test_transposition_table_store_and_probe():
+    table = TranspositionTable(1)
+    key = 0xFEDCBA9876543210
+    assert table.probe(key) is None
+    table.store(key, 5, -MATE_SCORE + 3, EXACT_BOUND, 1234)
+    assert table.probe(key) == (5, -MATE_SCORE + 3, EXACT_BOUND, 1234)
+    table.store(key, 6, 40, UPPER_BOUND)
+    assert table.probe(key) == (6, 40, UPPER_BOUND, 1234)
+    assert table.probe(key ^ 1 << 63) is None
+    assert (table.hits, table.misses, table.stores) == (2, 2, 2)
+    assert table.hit_rate() == 0.5
+    table.clear()
+    assert table.probe(key) is None
+    assert table.hits == 0
+
+
+def test_transposition_table_replacement():
+    table = TranspositionTable(1 / 1024)
+    buckets = len(table) // 2
+    first, second, third = 7, 7 + buckets, 7 + 2 * buckets
+    table.store(first, 8, 1, LOWER_BOUND, 1)
+    table.store(second, 3, 2, LOWER_BOUND, 2)
+    assert table.probe(first)[0] == 8
+    assert table.probe(second)[0] == 3
+    table.store(third, 2, 3, LOWER_BOUND, 3)
+    assert table.overwrites == 1
+    assert table.probe(first)[0] == 8
+    assert table.probe(second) is None
+    table.store(second, 9, 2, LOWER_BOUND, 2)
+    assert table.overwrites == 2
+    assert table.probe(second)[0] == 9
+    assert table.probe(first)[0] == 8
+    assert table.probe(third) is None
+
+
+def test_engine_uses_transposition_table():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[0][1])
+    engine = ChessEngine(1)
+    first_result = engine.search(chess_state, SearchLimits(depth=3))
+    assert engine.transposition_table.hits > 0
+    assert engine.transposition_table.usage() > 0
+    second_result = engine.search(chess_state, SearchLimits(depth=3))
+    assert second_result.nodes < first_result.nodes
+    assert second_result.score == first_result.score
+
+
+def test_transposition_table_shared_buffer():
+    buffer = bytearray(table_size_in_bytes(1 / 1024))
+    first_table = TranspositionTable(1 / 1024, buffer)
+    second_table = TranspositionTable(1 / 1024, buffer)
+    key = 0x0123456789ABCDEF
+    first_table.store(key, 4, 25, EXACT_BOUND, 77)
+    assert second_table.probe(key) == (4, 25, EXACT_BOUND, 77)
+    # an entry whose data doesn't match its check is ignored
+    index = 4 * (key & first_table._mask)
+    first_table._entries[index + 1] ^= 1 << DEPTH_SHIFT
+    assert second_table.probe(key) is None
+    first_table.close()
+    second_table.close()
+
+
+def test_parallel_search():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[0][1])
+    result = parallel_search(
+        chess_state, SearchLimits(depth=2), processes=2, table_size_mb=1
+    )
+    assert result.depth == 2
+    assert result.move() in chess_state.get_legal_moves()
+    assert result.nodes > 0
+
+
+def test_capture_score_mvv_lva():
+    chess_state = MutableChessState.from_state(
+        ChessState.from_fen("4k3/8/8/3q1r2/2P5/4N3/8/4K3 w - - 0 1")
+    )
+    pawn_takes_queen = ChessMove(2, 3, 3, 4).code()
+    knight_takes_queen = ChessMove(4, 2, 3, 4).code()
+    knight_takes_rook = ChessMove(4, 2, 5, 4).code()
+    assert (
+        capture_score(chess_state, pawn_takes_queen)
+        > capture_score(chess_state, knight_takes_queen)
+        > capture_score(chess_state, knight_takes_rook)
+    )
+
+
+def test_get_taken_type():
+    chess_state = MutableChessState.from_state(
+        ChessState.from_fen("4k3/8/8/3qPp2/8/8/8/4K3 w - f6 0 1")
+    )
+    assert get_taken_type(chess_state, ChessMove(4, 4, 3, 5).code()) is None
+    assert get_taken_type(chess_state, ChessMove(4, 4, 5, 5).code()) == PAWN
+    assert get_taken_type(chess_state, ChessMove(4, 0, 3, 1).code()) is None
+    chess_state = MutableChessState.from_state(
+        ChessState.from_fen("4k3/8/8/3q1r2/2P5/4N3/8/4K3 w - - 0 1")
+    )
+    assert get_taken_type(chess_state, ChessMove(2, 3, 3, 4).code()) == QUEEN
+
+
+def test_move_ordering():
+    chess_state = MutableChessState.from_state(
+        ChessState.from_fen("4k3/8/8/3q1r2/2P5/4N3/8/4K3 w - - 0 1")
+    )
+    ordering = MoveOrdering()
+    codes = chess_state.get_legal_move_codes()
+    quiet = ChessMove(4, 0, 4, 1).code()
+    killer = ChessMove(4, 2, 6, 1).code()
+    ordering.add_cutoff(chess_state, quiet, 3, 0)
+    ordering.add_cutoff(chess_state, killer, 1, 1)
+    ordering.add_cutoff(chess_state, ChessMove(2, 3, 3, 4).code(), 5, 1)
+
+    ordered = list(ordering.iterate_moves(chess_state, codes, 1, quiet))
+    assert sorted(ordered) == sorted(codes)
+    assert ordered[:5] == [
+        quiet,
+        ChessMove(2, 3, 3, 4).code(),
+        ChessMove(4, 2, 3, 4).code(),
+        ChessMove(4, 2, 5, 4).code(),
+        killer,
+    ]
+    ordered = list(ordering.iterate_moves(chess_state, codes, 0))
+    assert ordered[3] == quiet
+
+    ordering.new_search()
+    ordered = list(ordering.iterate_moves(chess_state, codes, 1))
+    assert ordered[3] == quiet
+
+
+class GenerationOrder(MoveOrdering):
+    """Searches the moves in the order in which they are generated, only the
+    move of the principal variation or the transposition table goes
+    first."""
+
+    def iterate_moves(self, state, codes, ply, first_code=0):
+        if first_code and first_code in codes:
+            yield first_code
+        for code in codes:
+            if code != first_code:
+                yield code
+
+
+def search_without_ordering(chess_state, depth, nodes):
+    engine = ChessEngine(1)
+    engine._ordering = GenerationOrder()
+    return engine.search(chess_state, SearchLimits(depth=depth, nodes=nodes))
+
+
+def test_move_ordering_reduces_nodes():
+    chess_state = ChessState.from_fen(PERFT_POSITIONS[5][1])
+    ordered_result = ChessEngine(1).search(chess_state, SearchLimits(depth=3))
+    assert ordered_result.depth == 3
+    # the search in the order of generation doesn't finish the third
+    # iteration with five times as many nodes
+    unordered_result = search_without_ordering(
+        chess_state, 3, 5 * ordered_result.nodes
+    )
+    assert unordered_result.depth < 3
+
+
+def test_move_ordering_reduction_factor():
+    # tactical positions, in which the order of the captures matters
+    for index in (3, 4):
+        chess_state = ChessState.from_fen(PERFT_POSITIONS[index][1])
+        ordered_result = ChessEngine(1).search(
+            chess_state, SearchLimits(depth=3)
+        )
+        unordered_result = search_without_ordering(
+            chess_state, 3, 5 * ordered_result.nodes
+        )
+        assert ordered_result.depth == 3
+        assert unordered_result.depth < 3
+
+
+def test_get_captures():
+    for _, fen, _ in PERFT_POSITIONS:
+        chess_state = ChessState.from_fen(fen)
+        expected = [
+            code
+            for code in chess_state.get_legal_move_codes()
+            if code >> PROMOTION_SHIFT
+            or chess_state._occupancy[1 - chess_state._colour] >> (code >> 6)
+            & 1
+            or chess_state._en_passant == code >> 6
+            and chess_state._bitboards[6 * chess_state._colour] >> (code & 63)
+            & 1
+        ]
+        assert sorted(chess_state.get_capture_codes()) == sorted(expected)
+        assert sorted(
+            move.code() for move in chess_state.get_captures()
+        ) == sorted(set(code & 0xFFF for code in expected))
+
+
+def test_get_captures_en_passant_and_promotion():
+    chess_state = ChessState.from_fen("4k3/1P6/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    assert set(chess_state.get_captures()) == {
+        ChessMove(4, 4, 3, 5),
+        ChessMove(1, 6, 1, 7),
+    }
+    assert len(chess_state.get_capture_codes()) == 5
+
+
+def test_quiescence_avoids_horizon_blunder():
+    chess_state = ChessState.from_fen("4k3/8/4p3/3p4/8/8/8/3QK3 w - - 0 1")
+    result = best_move(chess_state, SearchLimits(depth=1))
+    assert result.move() != ChessMove(3, 0, 3, 4)
+
+
+def test_polyglot_key():
+    # the keys given in the description of the Polyglot book format
+    positions = [
+        (
+            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+            0x463B96181691FC9C,
+        ),
+        (
+            "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+            0x823C9B50FD114196,
+        ),
+        (
+            "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 2",
+            0x0756B94461C50FB0,
+        ),
+        (
+            "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+            0x22A48B5A8E47FF78,
+        ),
+        (
+            "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPPKPPP/RNBQ1BNR b kq - 0 3",
+            0x652A607CA3F242C1,
+        ),
+    ]
+    for fen, key in positions:
+        assert polyglot_key(ChessState.from_fen(fen)) == key
+
+
+def test_opening_book(tmp_path):
+    initial_state = ChessState.from_fen(PERFT_POSITIONS[0][1])
+    castling_state = ChessState.from_fen(
+        "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"
+    )
+    initial_key = polyglot_key(initial_state)
+    castling_key = polyglot_key(castling_state)
+    entries = [
+        (initial_key, 0o1434, 3, 0),  # e2e4
+        (initial_key, 0o1333, 5, 0),  # d2d4
+        (initial_key, 0o1444, 7, 0),  # e2e5 (illegal)
+        (initial_key, 0o0122, 0, 0),  # b1c3 (no weight)
+        (castling_key, 0o0407, 1, 0),  # e1h1 (kingside castling)
+        (castling_key, 0o0400, 2, 0),  # e1a1 (queenside castling)
+        (0, 0o1434, 1, 0),
+        ((1 << 64) - 1, 0o1434, 1, 0),
+    ]
+    path = tmp_path / "book.bin"
+    path.write_bytes(
+        b"".join(ENTRY_STRUCT.pack(*entry) for entry in sorted(entries))
+    )
+    with OpeningBook(str(path)) as book:
+        assert len(book) == len(entries)
+        assert book.get_moves(initial_state) == [
+            (ChessMove(3, 1, 3, 3), 5),
+            (ChessMove(4, 1, 4, 3), 3),
+        ]
+        assert book.get_moves(castling_state) == [
+            (ChessMove(4, 0, 2, 0), 2),
+            (ChessMove(4, 0, 6, 0), 1),
+        ]
+        assert book.choose_move_code(initial_state, Random(0)) in {
+            ChessMove(3, 1, 3, 3).code(),
+            ChessMove(4, 1, 4, 3).code(),
+        }
+        castled_state = castling_state.make_move(ChessMove(4, 0, 6, 0))
+        assert book.get_moves(castled_state) == []
+        kings_state = ChessState.from_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+        assert book.choose_move_code(kings_state) is None
+
+    empty_path = tmp_path / "empty.bin"
+    empty_path.write_bytes(b"")
+    with OpeningBook(str(empty_path)) as book:
+        assert len(book) == 0
+        assert book.get_moves(initial_state) == []
+
+
+def test_tablebase(tmp_path):
+    table = generate_table("KQK")
+    # the longest mate with a king and a queen takes ten moves
+    assert max(table) - 1 == 20
+    (tmp_path / ("KQK" + TABLE_EXTENSION)).write_bytes(table)
+    with Tablebase(str(tmp_path)) as tablebase:
+        mated_state = ChessState.from_fen("k7/1Q6/2K5/8/8/8/8/8 b - - 0 1")
+        assert tablebase.probe(mated_state) == (-1, 0)
+        mate_in_one_state = ChessState.from_fen(
+            "k7/8/2K5/8/8/8/8/1Q6 w - - 0 1"
+        )
+        assert tablebase.probe(mate_in_one_state) == (1, 1)
+        assert (
+            tablebase.get_winner(mate_in_one_state)
+            == mate_in_one_state.get_current_player()
+        )
+        # the same position with the colours swapped
+        mirrored_state = ChessState.from_fen("1q6/8/8/8/8/2k5/8/K7 b - - 0 1")
+        assert tablebase.probe(mirrored_state) == (1, 1)
+        stalemate_state = ChessState.from_fen("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+        assert tablebase.probe(stalemate_state) == (0, 0)
+        assert tablebase.get_winner(stalemate_state) is None
+        # the king takes the unprotected queen
+        capture_state = ChessState.from_fen("k7/1Q6/8/8/8/8/8/7K b - - 0 1")
+        assert tablebase.probe_wdl(capture_state) == 0
+        lost_state = ChessState.from_fen("8/8/3k4/8/8/8/8/KQ6 b - - 0 1")
+        assert tablebase.probe_wdl(lost_state) == -1
+        assert 0 < tablebase.probe_dtm(lost_state) <= 20
+        # the positions with other pieces aren't covered
+        rook_state = ChessState.from_fen("k7/8/2K5/8/8/8/8/1R6 w - - 0 1")
+        assert tablebase.probe(rook_state) is None
+        initial_state = ChessState.from_fen(PERFT_POSITIONS[0][1])
+        assert tablebase.probe_wdl(initial_state) is None
+
+        engine = ChessEngine(1, tablebase=tablebase)
+        queen_state = ChessState.from_fen("8/8/8/4k3/8/8/8/1Q2K3 w - - 0 1")
+        result = engine.search(queen_state, SearchLimits(depth=2))
+        assert result.score == MATE_SCORE - tablebase.probe_dtm(queen_state)
+
+
+def test_parallel_search_uses_tablebases(tmp_path):
+    # a table scoring every position as a draw
+    (tmp_path / ("KQK" + TABLE_EXTENSION)).write_bytes(bytes(TABLE_SIZE))
+    chess_state = ChessState.from_fen("8/8/8/4k3/8/8/8/1Q2K3 w - - 0 1")
+    for processes in (1, 2):
+        result = parallel_search(
+            chess_state,
+            SearchLimits(depth=2),
+            processes=processes,
+            table_size_mb=1,
+            tablebases=str(tmp_path),
+        )
+        assert result.score == 0
+    result = parallel_search(
+        chess_state, SearchLimits(depth=2), processes=2, table_size_mb=1
+    )
+    assert result.score > 0